@@ -18,8 +18,9 @@ from app.core.database import Base
 # access to the values within the .ini file in use.
 config = context.config
 
-# Set sqlalchemy.url from settings
-config.set_main_option("sqlalchemy.url", str(settings.DATABASE_URL))
+# Set sqlalchemy.url from settings. The option goes through ConfigParser
+# interpolation, so "%" from percent-encoded credentials must be doubled
+config.set_main_option("sqlalchemy.url", settings.DATABASE_URL.replace("%", "%%"))
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
@@ -0,0 +1,59 @@
+"""Add composite indexes for mood, note, sleep and notification list queries
+
+Revision ID: add_record_list_indexes
+Revises: meal_plan_jsonb
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'add_record_list_indexes'
+down_revision = 'meal_plan_jsonb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add composite indexes matching the day record and notification lists."""
+    # Mood records are listed per day ordered by time
+    op.create_index(
+        'ix_mood_records_day_time',
+        'mood_records',
+        ['day_id', 'time'],
+        unique=False
+    )
+
+    # Notes are listed per day, newest first
+    op.create_index(
+        'ix_notes_day_created',
+        'notes',
+        ['day_id', sa.text('created_at DESC')],
+        unique=False
+    )
+
+    # Sleep records are listed per day ordered by bedtime (nulls last)
+    op.create_index(
+        'ix_sleep_records_day_bedtime',
+        'sleep_records',
+        ['day_id', 'bedtime'],
+        unique=False
+    )
+
+    # Notifications are listed per user, newest first, optionally unread only
+    op.create_index(
+        'ix_notifications_user_created',
+        'notifications',
+        ['user_id', sa.text('created_at DESC')],
+        unique=False,
+        postgresql_include=['is_read']
+    )
+
+
+def downgrade():
+    """Remove composite list indexes."""
+    op.drop_index('ix_notifications_user_created', table_name='notifications')
+    op.drop_index('ix_sleep_records_day_bedtime', table_name='sleep_records')
+    op.drop_index('ix_notes_day_created', table_name='notes')
+    op.drop_index('ix_mood_records_day_time', table_name='mood_records')
@@ -0,0 +1,40 @@
+"""Add composite indexes for goal and exercise list queries
+
+Revision ID: add_list_indexes
+Revises: add_tz_remaining_dt
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'add_list_indexes'
+down_revision = 'add_tz_remaining_dt'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add composite indexes matching the goal and exercise list queries."""
+    # Goals are listed per user, optionally by status, newest first
+    op.create_index(
+        'ix_goals_user_status_created',
+        'goals',
+        ['user_id', 'status', sa.text('created_at DESC')],
+        unique=False
+    )
+
+    # Exercises are listed per day ordered by start time
+    op.create_index(
+        'ix_exercises_day_start',
+        'exercises',
+        ['day_id', 'start_time'],
+        unique=False
+    )
+
+
+def downgrade():
+    """Remove composite list indexes."""
+    op.drop_index('ix_exercises_day_start', table_name='exercises')
+    op.drop_index('ix_goals_user_status_created', table_name='goals')
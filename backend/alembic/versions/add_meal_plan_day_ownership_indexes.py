@@ -0,0 +1,31 @@
+"""Add composite index for meal plan list queries
+
+Revision ID: add_ownership_indexes
+Revises: add_list_indexes
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'add_ownership_indexes'
+down_revision = 'add_list_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add composite index matching the meal plan list query."""
+    # Meal plans are listed per user, optionally active only, newest first
+    op.create_index(
+        'ix_meal_plans_user_active_created',
+        'meal_plans',
+        ['user_id', 'is_active', sa.text('created_at DESC')],
+        unique=False
+    )
+
+
+def downgrade():
+    """Remove the meal plan list index."""
+    op.drop_index('ix_meal_plans_user_active_created', table_name='meal_plans')
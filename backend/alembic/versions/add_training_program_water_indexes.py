@@ -0,0 +1,40 @@
+"""Add composite indexes for training program and water intake queries
+
+Revision ID: add_tp_water_indexes
+Revises: add_record_list_indexes
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'add_tp_water_indexes'
+down_revision = 'add_record_list_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add composite indexes matching the training program and water queries."""
+    # Training programs are listed per user, active only, newest first
+    op.create_index(
+        'ix_training_programs_user_active_created',
+        'training_programs',
+        ['user_id', 'is_active', sa.text('created_at DESC')],
+        unique=False
+    )
+
+    # Water intakes are listed per day ordered by time
+    op.create_index(
+        'ix_water_intakes_day_time',
+        'water_intakes',
+        ['day_id', 'time'],
+        unique=False
+    )
+
+
+def downgrade():
+    """Remove training program and water intake composite indexes."""
+    op.drop_index('ix_water_intakes_day_time', table_name='water_intakes')
+    op.drop_index('ix_training_programs_user_active_created', table_name='training_programs')
@@ -0,0 +1,56 @@
+"""Convert meal plan plan_data and summary columns to JSONB
+
+Revision ID: meal_plan_jsonb
+Revises: add_ownership_indexes
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'meal_plan_jsonb'
+down_revision = 'add_ownership_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Store meal plan JSON documents as JSONB."""
+    op.alter_column(
+        'meal_plans',
+        'plan_data',
+        type_=postgresql.JSONB(),
+        existing_type=postgresql.JSON(),
+        existing_nullable=False,
+        postgresql_using='plan_data::jsonb'
+    )
+    op.alter_column(
+        'meal_plans',
+        'summary',
+        type_=postgresql.JSONB(),
+        existing_type=postgresql.JSON(),
+        existing_nullable=True,
+        postgresql_using='summary::jsonb'
+    )
+
+
+def downgrade():
+    """Revert meal plan JSON documents to JSON."""
+    op.alter_column(
+        'meal_plans',
+        'summary',
+        type_=postgresql.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using='summary::json'
+    )
+    op.alter_column(
+        'meal_plans',
+        'plan_data',
+        type_=postgresql.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=False,
+        postgresql_using='plan_data::json'
+    )
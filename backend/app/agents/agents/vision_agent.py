@@ -10,11 +10,13 @@ The agent handles partial failures gracefully, saving recognized items
 even if complete nutrition data cannot be retrieved.
 """
 
+import inspect
 import json
 import logging
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Callable, Dict, List, Optional, TypedDict
 
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import END, StateGraph
 from sqlalchemy.orm import Session
 
@@ -26,6 +28,30 @@ from app.models.meal import Meal, MealItem
 logger = logging.getLogger(__name__)
 
 
+def _agent_step(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap an agent method as a graph node bound at run time.
+
+    The compiled graph is shared by all VisionAgent instances, so nodes look
+    up the agent running the workflow in the run config.
+
+    Args:
+        method: Unbound VisionAgent method taking the workflow state
+
+    Returns:
+        Graph node or routing function
+    """
+    if inspect.iscoroutinefunction(method):
+        async def async_step(state: "VisionAgentState", config: RunnableConfig) -> Any:
+            return await method(config["configurable"]["agent"], state)
+
+        return async_step
+
+    def step(state: "VisionAgentState", config: RunnableConfig) -> Any:
+        return method(config["configurable"]["agent"], state)
+
+    return step
+
+
 class VisionAgentState(TypedDict):
     """State for Vision Agent workflow.
 
@@ -94,6 +120,9 @@ class VisionAgent(BaseAgent):
         ```
     """
 
+    # Compiled workflow shared by all instances (see _get_graph)
+    _graph: Optional[Any] = None
+
     def __init__(self, db_session: Session, user_id: int):
         """Initialize Vision Agent.
 
@@ -102,10 +131,25 @@ class VisionAgent(BaseAgent):
             user_id: ID of the user this agent operates for
         """
         super().__init__(db_session, user_id, "vision")
-        self.graph = self._build_graph()
+        self.graph = self._get_graph()
         logger.info(f"Vision Agent initialized for user {user_id}")
 
-    def _build_graph(self) -> Any:
+    @classmethod
+    def _get_graph(cls) -> Any:
+        """Get the compiled workflow, building it on first use.
+
+        Compiling the graph is the bulk of agent construction cost, so it is
+        done once per process instead of once per photo.
+
+        Returns:
+            Compiled LangGraph workflow
+        """
+        if cls._graph is None:
+            cls._graph = cls._build_graph()
+        return cls._graph
+
+    @classmethod
+    def _build_graph(cls) -> Any:
         """Build the LangGraph workflow.
 
         Creates a state machine that orchestrates the meal photo
@@ -117,11 +161,11 @@ class VisionAgent(BaseAgent):
         workflow = StateGraph(VisionAgentState)
 
         # Add nodes for each step
-        workflow.add_node("analyze_photo", self._analyze_photo)
-        workflow.add_node("search_nutrition", self._search_nutrition)
-        workflow.add_node("calculate_totals", self._calculate_totals)
-        workflow.add_node("create_meal", self._create_meal)
-        workflow.add_node("handle_error", self._handle_error)
+        workflow.add_node("analyze_photo", _agent_step(cls._analyze_photo))
+        workflow.add_node("search_nutrition", _agent_step(cls._search_nutrition))
+        workflow.add_node("calculate_totals", _agent_step(cls._calculate_totals))
+        workflow.add_node("create_meal", _agent_step(cls._create_meal))
+        workflow.add_node("handle_error", _agent_step(cls._handle_error))
 
         # Define workflow edges
         workflow.set_entry_point("analyze_photo")
@@ -129,7 +173,7 @@ class VisionAgent(BaseAgent):
         # Conditional routing after photo analysis
         workflow.add_conditional_edges(
             "analyze_photo",
-            self._should_search_nutrition,
+            _agent_step(cls._should_search_nutrition),
             {
                 "search": "search_nutrition",
                 "calculate": "calculate_totals",
@@ -143,7 +187,7 @@ class VisionAgent(BaseAgent):
         # Conditional routing after calculating totals
         workflow.add_conditional_edges(
             "calculate_totals",
-            self._should_create_meal,
+            _agent_step(cls._should_create_meal),
             {
                 "create": "create_meal",
                 "error": "handle_error"
@@ -181,37 +225,19 @@ class VisionAgent(BaseAgent):
         Raises:
             ValueError: If required input fields are missing
         """
-        # Validate input
-        if "day_id" not in input_data:
-            raise ValueError("Missing required field: day_id")
-        if "photo_path" not in input_data:
-            raise ValueError("Missing required field: photo_path")
+        # Validate input and initialize state
+        initial_state = self._initial_state(input_data)
 
         logger.info(
             f"Executing Vision Agent workflow for user {self.user_id}, "
             f"day {input_data['day_id']}, photo {input_data['photo_path']}"
         )
 
-        # Initialize state
-        initial_state: VisionAgentState = {
-            "user_id": self.user_id,
-            "day_id": input_data["day_id"],
-            "photo_path": input_data["photo_path"],
-            "category": input_data.get("category", "snack"),
-            "recognized_items": [],
-            "nutrition_data": [],
-            "needs_web_search": [],
-            "totals": None,
-            "meal_id": None,
-            "success": False,
-            "error": None,
-            "partial_results": None,
-            "confidence": "low"
-        }
-
         # Execute workflow
         try:
-            result = await self.graph.ainvoke(initial_state)
+            result = await self.graph.ainvoke(
+                initial_state, config={"configurable": {"agent": self}}
+            )
 
             # Log result
             if result["success"]:
@@ -239,6 +265,68 @@ class VisionAgent(BaseAgent):
                 "nutrition_data": []
             }
 
+    async def replay(
+        self, input_data: Dict[str, Any], results: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Create the meal from the results of an earlier run on the same photo.
+
+        Skips photo analysis and nutrition search and runs only the
+        create_meal step, so the meal, its totals and its items are the same
+        as a full run would write.
+
+        Args:
+            input_data: Same keys as for execute
+            results: recognized_items, nutrition_data, totals and confidence
+                from an earlier successful run
+
+        Returns:
+            Dictionary with workflow results, as returned by execute
+
+        Raises:
+            ValueError: If required input fields are missing
+        """
+        state = self._initial_state(input_data)
+        state["recognized_items"] = results["recognized_items"]
+        state["nutrition_data"] = results["nutrition_data"]
+        state["totals"] = results["totals"]
+        state["confidence"] = results.get("confidence", "low")
+
+        logger.info(f"Replaying Vision Agent results for day {state['day_id']}")
+        return await self._create_meal(state)
+
+    def _initial_state(self, input_data: Dict[str, Any]) -> VisionAgentState:
+        """Build the workflow state for a photo.
+
+        Args:
+            input_data: Dictionary with day_id, photo_path and optional category
+
+        Returns:
+            Initial workflow state
+
+        Raises:
+            ValueError: If required input fields are missing
+        """
+        if "day_id" not in input_data:
+            raise ValueError("Missing required field: day_id")
+        if "photo_path" not in input_data:
+            raise ValueError("Missing required field: photo_path")
+
+        return {
+            "user_id": self.user_id,
+            "day_id": input_data["day_id"],
+            "photo_path": input_data["photo_path"],
+            "category": input_data.get("category", "snack"),
+            "recognized_items": [],
+            "nutrition_data": [],
+            "needs_web_search": [],
+            "totals": None,
+            "meal_id": None,
+            "success": False,
+            "error": None,
+            "partial_results": None,
+            "confidence": "low"
+        }
+
     async def _analyze_photo(self, state: VisionAgentState) -> VisionAgentState:
         """Step 1: Analyze photo using GPT-4 Vision.
 
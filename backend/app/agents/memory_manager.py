@@ -383,7 +383,7 @@ class AgentMemoryManager:
             ...     metadata={"since": "2024-02-01"}
             ... )
         """
-        memory = self.db.query(AgentMemory).filter(AgentMemory.id == memory_id).first()
+        memory = self.db.get(AgentMemory, memory_id)
 
         if not memory:
             raise ValueError(f"Memory with id {memory_id} not found")
@@ -412,7 +412,7 @@ class AgentMemoryManager:
             >>> if success:
             ...     print("Memory deleted")
         """
-        memory = self.db.query(AgentMemory).filter(AgentMemory.id == memory_id).first()
+        memory = self.db.get(AgentMemory, memory_id)
 
         if not memory:
             return False
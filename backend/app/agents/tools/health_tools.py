@@ -150,7 +150,7 @@ def get_user_profile(db: Session, user_id: int) -> Dict[str, Any]:
     Returns:
         User profile data
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
 
     if not user:
         return {}
@@ -16,6 +16,7 @@ from app.agents.agents import (
 )
 from app.core.dependencies import get_current_user, get_db
 from app.core.llm_rate_limiter import check_llm_rate_limit
+from app.core.sse import SSE_HEADERS
 from app.models.user import User
 from app.services.llm_service import LLMService
 from app.services.agent_coordinator import AgentCoordinator
@@ -397,11 +398,7 @@ async def stream_chat(
         return StreamingResponse(
             generate_stream(stream_iterator),
             media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Accel-Buffering": "no",  # Disable nginx buffering
-            }
+            headers=SSE_HEADERS,
         )
 
     except Exception as e:
@@ -453,11 +450,7 @@ async def stream_nutrition_coaching(
         return StreamingResponse(
             generate_stream(stream_iterator),
             media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Accel-Buffering": "no",
-            }
+            headers=SSE_HEADERS,
         )
 
     except Exception as e:
@@ -509,11 +502,7 @@ async def stream_workout_coaching(
         return StreamingResponse(
             generate_stream(stream_iterator),
             media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Accel-Buffering": "no",
-            }
+            headers=SSE_HEADERS,
         )
 
     except Exception as e:
@@ -615,11 +604,7 @@ async def stream_coordinated_response(
         return StreamingResponse(
             generate_stream(),
             media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Accel-Buffering": "no",
-            }
+            headers=SSE_HEADERS,
         )
 
     except Exception as e:
@@ -6,6 +6,7 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session, joinedload
 
+from app.core.cache import cache_delete, meal_cache_key
 from app.core.dependencies import get_current_user, get_db
 from app.models.day import Day
 from app.models.user import User
@@ -186,7 +187,7 @@ def update_day(
         HTTPException: 404 if day not found, 403 if not authorized
     """
     # First check if day exists
-    day = db.query(Day).filter(Day.id == day_id).first()
+    day = db.get(Day, day_id)
 
     if not day:
         raise HTTPException(
@@ -234,7 +235,7 @@ def delete_day(
         HTTPException: 404 if day not found, 403 if not authorized
     """
     # First check if day exists
-    day = db.query(Day).filter(Day.id == day_id).first()
+    day = db.get(Day, day_id)
 
     if not day:
         raise HTTPException(
@@ -249,6 +250,9 @@ def delete_day(
             detail="Not authorized to delete this day",
         )
 
+    # Collect meal IDs first: the day's meals are deleted with it
+    meal_ids = [meal.id for meal in day.meals]
+
     # Delete day
     success = DayService.delete_day(db, day_id)
 
@@ -258,4 +262,6 @@ def delete_day(
             detail=f"Day with id {day_id} not found",
         )
 
+    cache_delete(*(meal_cache_key(meal_id, current_user.id) for meal_id in meal_ids))
+
     return None
@@ -2,12 +2,15 @@
 
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
-from app.core.dependencies import get_current_user, get_db
-from app.models.day import Day
-from app.models.exercise import Exercise
+from app.core.dependencies import (
+    check_day_access,
+    get_current_user,
+    get_db,
+    raise_day_not_accessible,
+)
 from app.models.user import User
 from app.schemas.exercise import ExerciseCreate, ExerciseResponse, ExerciseUpdate
 from app.services.exercise_service import ExerciseService
@@ -40,26 +43,52 @@ def create_exercise(
     Raises:
         HTTPException: 404 if day not found, 403 if not authorized
     """
-    # First check if day exists
-    day = db.query(Day).filter(Day.id == day_id).first()
+    # Create exercise; the day ownership check is part of the insert
+    exercise_dict = exercise_data.model_dump(exclude_unset=True)
+    exercise = ExerciseService.create_exercise(
+        db, day_id, current_user.id, exercise_dict
+    )
+    if exercise:
+        return exercise
 
-    if not day:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Day with id {day_id} not found",
-        )
+    # Nothing was inserted, check whether the day is missing or foreign
+    raise_day_not_accessible(db, day_id, "Not authorized to add exercises to this day")
 
-    # Verify day belongs to current user
-    if day.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to add exercises to this day",
-        )
 
-    # Create exercise
-    exercise_dict = exercise_data.model_dump(exclude_unset=True)
-    exercise = ExerciseService.create_exercise(db, day_id, exercise_dict)
-    return exercise
+@router.post(
+    "/days/{day_id}/exercises/bulk",
+    response_model=List[ExerciseResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+def bulk_create_exercises(
+    day_id: int,
+    exercises_data: List[ExerciseCreate] = Body(..., min_length=1, max_length=1000),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Create several exercises for a specific day in one request.
+
+    Args:
+        day_id: Day ID to add exercises to
+        exercises_data: List of exercise creation data
+        db: Database session
+        current_user: Current authenticated user
+
+    Returns:
+        Newly created exercises with 201 status
+
+    Raises:
+        HTTPException: 404 if day not found, 403 if not authorized
+    """
+    check_day_access(db, day_id, current_user.id, "Not authorized to add exercises to this day")
+
+    # Create all exercises in one batch
+    exercises = ExerciseService.bulk_create_exercises(
+        db,
+        day_id,
+        [exercise.model_dump(exclude_unset=True) for exercise in exercises_data],
+    )
+    return exercises
 
 
 @router.get("/days/{day_id}/exercises", response_model=List[ExerciseResponse])
@@ -81,21 +110,7 @@ def get_exercises_by_day(
     Raises:
         HTTPException: 404 if day not found, 403 if not authorized
     """
-    # First check if day exists
-    day = db.query(Day).filter(Day.id == day_id).first()
-
-    if not day:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Day with id {day_id} not found",
-        )
-
-    # Verify day belongs to current user
-    if day.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to view exercises for this day",
-        )
+    check_day_access(db, day_id, current_user.id, "Not authorized to view exercises for this day")
 
     # Get exercises
     exercises = ExerciseService.get_exercises_by_day(db, day_id)
@@ -160,33 +175,25 @@ def update_exercise(
     Raises:
         HTTPException: 404 if exercise not found, 403 if not authorized
     """
-    # First check if exercise exists
-    exercise = db.query(Exercise).filter(Exercise.id == exercise_id).first()
-
-    if not exercise:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Exercise with id {exercise_id} not found",
-        )
-
-    # Verify exercise's day belongs to current user
-    if exercise.day.user_id != current_user.id:
+    # Update exercise with only the fields that are provided
+    update_data = exercise_data.model_dump(exclude_unset=True)
+    updated_exercise = ExerciseService.update_exercise(
+        db, exercise_id, current_user.id, **update_data
+    )
+
+    if updated_exercise is None:
+        # The UPDATE matched nothing: tell a missing exercise from a foreign one
+        if not ExerciseService.exercise_exists(db, exercise_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Exercise with id {exercise_id} not found",
+            )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to update this exercise",
         )
 
-    # Update exercise with only the fields that are provided
-    update_data = exercise_data.model_dump(exclude_unset=True)
-
-    try:
-        updated_exercise = ExerciseService.update_exercise(db, exercise_id, **update_data)
-        return updated_exercise
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
+    return updated_exercise
 
 
 @router.delete("/exercises/{exercise_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -208,29 +215,19 @@ def delete_exercise(
     Raises:
         HTTPException: 404 if exercise not found, 403 if not authorized
     """
-    # First check if exercise exists
-    exercise = db.query(Exercise).filter(Exercise.id == exercise_id).first()
-
-    if not exercise:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Exercise with id {exercise_id} not found",
-        )
-
-    # Verify exercise's day belongs to current user
-    if exercise.day.user_id != current_user.id:
+    # Delete exercise only if its day belongs to current user
+    deleted = ExerciseService.delete_exercise(db, exercise_id, current_user.id)
+
+    if not deleted:
+        # The DELETE matched nothing: tell a missing exercise from a foreign one
+        if not ExerciseService.exercise_exists(db, exercise_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Exercise with id {exercise_id} not found",
+            )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to delete this exercise",
         )
 
-    # Delete exercise
-    success = ExerciseService.delete_exercise(db, exercise_id)
-
-    if not success:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Exercise with id {exercise_id} not found",
-        )
-
     return None
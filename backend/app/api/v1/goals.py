@@ -6,9 +6,8 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.core.dependencies import get_current_user, get_db
-from app.models.goal import Goal
 from app.models.user import User
-from app.schemas.goal import GoalCreate, GoalResponse, GoalUpdate
+from app.schemas.goal import GoalCreate, GoalResponse, GoalStatus, GoalUpdate
 from app.services.goal_service import GoalService
 
 router = APIRouter()
@@ -47,12 +46,14 @@ def create_goal(
 
 @router.get("/goals", response_model=List[GoalResponse])
 def get_goals(
-    status_filter: Optional[str] = Query(None, alias="status", description="Filter by status: active, completed, archived"),
+    status_filter: Optional[GoalStatus] = Query(None, alias="status", description="Filter by status: active, completed, archived"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get all goals for the current user.
 
+    Invalid status values are rejected with 422 during request validation.
+
     Args:
         status_filter: Optional status filter (active, completed, archived)
         db: Database session
@@ -60,18 +61,10 @@ def get_goals(
 
     Returns:
         List of goals ordered by created_at desc
-
-    Raises:
-        HTTPException: 400 if invalid status provided
     """
-    # Validate status if provided
-    if status_filter and status_filter not in ["active", "completed", "archived"]:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid status. Must be one of: active, completed, archived",
-        )
-
-    goals = GoalService.get_user_goals(db, current_user.id, status_filter)
+    goals = GoalService.get_user_goals(
+        db, current_user.id, status_filter.value if status_filter else None
+    )
     return goals
 
 
@@ -133,33 +126,23 @@ def update_goal(
     Raises:
         HTTPException: 404 if goal not found, 403 if not authorized
     """
-    # First check if goal exists
-    goal = db.query(Goal).filter(Goal.id == goal_id).first()
-
-    if not goal:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Goal with id {goal_id} not found",
-        )
-
-    # Verify goal belongs to current user
-    if goal.user_id != current_user.id:
+    # Update goal with only the fields that are provided
+    update_data = goal_data.model_dump(exclude_unset=True)
+    updated_goal = GoalService.update_goal(db, goal_id, current_user.id, **update_data)
+
+    if updated_goal is None:
+        # The UPDATE matched nothing: tell a missing goal from a foreign one
+        if not GoalService.goal_exists(db, goal_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Goal with id {goal_id} not found",
+            )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to update this goal",
         )
 
-    # Update goal with only the fields that are provided
-    update_data = goal_data.model_dump(exclude_unset=True)
-
-    try:
-        updated_goal = GoalService.update_goal(db, goal_id, **update_data)
-        return updated_goal
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
+    return updated_goal
 
 
 @router.delete("/goals/{goal_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -181,29 +164,19 @@ def delete_goal(
     Raises:
         HTTPException: 404 if goal not found, 403 if not authorized
     """
-    # First check if goal exists
-    goal = db.query(Goal).filter(Goal.id == goal_id).first()
-
-    if not goal:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Goal with id {goal_id} not found",
-        )
-
-    # Verify goal belongs to current user
-    if goal.user_id != current_user.id:
+    # Delete goal only if it belongs to current user
+    deleted = GoalService.delete_goal(db, goal_id, current_user.id)
+
+    if not deleted:
+        # The DELETE matched nothing: tell a missing goal from a foreign one
+        if not GoalService.goal_exists(db, goal_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Goal with id {goal_id} not found",
+            )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to delete this goal",
         )
 
-    # Delete goal
-    success = GoalService.delete_goal(db, goal_id)
-
-    if not success:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Goal with id {goal_id} not found",
-        )
-
     return None
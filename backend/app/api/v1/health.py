@@ -1,15 +1,19 @@
 """Health check and monitoring endpoints."""
 
+import asyncio
 import logging
 import os
 import shutil
 import time
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Tuple
 
 import psutil
 import redis
 from fastapi import APIRouter, status
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, generate_latest
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
 from sqlalchemy import text
 
 from app.config import settings
@@ -19,9 +23,37 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Upper bound (seconds) on the database ping in readiness checks
+DB_CHECK_TIMEOUT = 5.0
+
+# How long (seconds) disk/memory readings are reused by readiness checks
+SYSTEM_STATS_TTL = 5.0
+
+_system_stats_cache: Dict[str, Tuple[float, Any]] = {}
+
+# Shared Redis client for health checks. Probes reuse pooled connections
+# instead of opening (and tearing down) a TCP connection on every hit. The
+# sync pool is thread-safe and, unlike redis.asyncio, not bound to one loop.
+_redis_pool = redis.BlockingConnectionPool(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    db=settings.REDIS_DB,
+    max_connections=4,
+    timeout=5,
+    socket_connect_timeout=5,
+    socket_timeout=5,
+)
+_redis_client = redis.Redis(connection_pool=_redis_pool)
+
+
+# Liveness body, encoded once. A fresh response object is still built per
+# call: middlewares mutate response headers in place (e.g. X-Request-ID),
+# so a shared instance would leak headers between requests.
+_LIVENESS_BODY = b"OK"
+
 
 @router.get("/liveness", response_class=PlainTextResponse)
-async def liveness_probe() -> str:
+async def liveness_probe() -> PlainTextResponse:
     """
     Liveness probe for Kubernetes/Docker health checks.
 
@@ -35,7 +67,7 @@ async def liveness_probe() -> str:
         curl http://localhost:8000/health/liveness
         OK
     """
-    return "OK"
+    return PlainTextResponse(_LIVENESS_BODY)
 
 
 @router.get("/readiness")
@@ -68,32 +100,22 @@ async def readiness_probe() -> JSONResponse:
             "timestamp": "2025-11-18T10:30:00Z"
         }
     """
-    checks = {}
-    all_healthy = True
-
-    # Check PostgreSQL
-    db_check = await check_database()
-    checks["database"] = db_check
-    if db_check["status"] != "healthy":
-        all_healthy = False
-
-    # Check Redis
-    redis_check = await check_redis()
-    checks["redis"] = redis_check
-    if redis_check["status"] != "healthy":
-        all_healthy = False
-
-    # Check Disk Space
-    disk_check = check_disk_space()
-    checks["disk"] = disk_check
-    if disk_check["status"] != "healthy":
-        all_healthy = False
-
-    # Check Memory
-    memory_check = check_memory()
-    checks["memory"] = memory_check
-    if memory_check["status"] != "healthy":
-        all_healthy = False
+    # All checks are independent and blocking work happens off the event
+    # loop, so run them concurrently: probe latency is the slowest check
+    db_check, redis_check, disk_check, memory_check = await asyncio.gather(
+        check_database(),
+        check_redis(),
+        asyncio.to_thread(check_disk_space),
+        asyncio.to_thread(check_memory),
+    )
+
+    checks = {
+        "database": db_check,
+        "redis": redis_check,
+        "disk": disk_check,
+        "memory": memory_check,
+    }
+    all_healthy = all(check["status"] == "healthy" for check in checks.values())
 
     # Build response
     response_data = {
@@ -110,16 +132,120 @@ async def readiness_probe() -> JSONResponse:
     return JSONResponse(content=response_data, status_code=status_code)
 
 
+class FitCoachCollector(Collector):
+    """
+    Prometheus collector for pool and system resource gauges.
+
+    Values are read once per scrape in ``collect`` and written straight into
+    the exposition output by ``generate_latest``.
+    """
+
+    def collect(self) -> List[GaugeMetricFamily]:
+        """Read current pool, memory, CPU and disk figures."""
+        metrics: List[GaugeMetricFamily] = []
+
+        # Database pool metrics
+        try:
+            pool = engine.pool
+            metrics.extend([
+                GaugeMetricFamily(
+                    "fitcoach_database_pool_size",
+                    "Database connection pool size",
+                    value=pool.size(),
+                ),
+                GaugeMetricFamily(
+                    "fitcoach_database_pool_checked_out",
+                    "Database connections checked out",
+                    value=pool.checkedout(),
+                ),
+            ])
+        except Exception as e:
+            logger.error(f"Failed to get database pool metrics: {e}")
+
+        # Memory metrics
+        try:
+            memory = psutil.virtual_memory()
+            process_memory = psutil.Process().memory_info()
+            metrics.extend([
+                GaugeMetricFamily(
+                    "fitcoach_memory_usage_bytes",
+                    "Application memory usage in bytes",
+                    value=process_memory.rss,
+                ),
+                GaugeMetricFamily(
+                    "fitcoach_system_memory_total_bytes",
+                    "Total system memory in bytes",
+                    value=memory.total,
+                ),
+                GaugeMetricFamily(
+                    "fitcoach_system_memory_available_bytes",
+                    "Available system memory in bytes",
+                    value=memory.available,
+                ),
+            ])
+        except Exception as e:
+            logger.error(f"Failed to get memory metrics: {e}")
+
+        # CPU metrics
+        try:
+            metrics.append(
+                GaugeMetricFamily(
+                    "fitcoach_cpu_usage_percent",
+                    "CPU usage percentage",
+                    # Non-blocking: usage since the previous scrape
+                    value=psutil.cpu_percent(interval=None),
+                )
+            )
+        except Exception as e:
+            logger.error(f"Failed to get CPU metrics: {e}")
+
+        # Disk metrics
+        try:
+            disk = shutil.disk_usage("/")
+            metrics.extend([
+                GaugeMetricFamily(
+                    "fitcoach_disk_total_bytes",
+                    "Total disk space in bytes",
+                    value=disk.total,
+                ),
+                GaugeMetricFamily(
+                    "fitcoach_disk_used_bytes",
+                    "Used disk space in bytes",
+                    value=disk.used,
+                ),
+                GaugeMetricFamily(
+                    "fitcoach_disk_free_bytes",
+                    "Free disk space in bytes",
+                    value=disk.free,
+                ),
+            ])
+        except Exception as e:
+            logger.error(f"Failed to get disk metrics: {e}")
+
+        return metrics
+
+
+# psutil.cpu_percent(interval=None) reports usage since its previous call;
+# prime it so the first scrape doesn't read a meaningless 0.0
+psutil.cpu_percent(interval=None)
+
+# Dedicated registry so only FitCoach gauges are exposed (no default
+# process/platform collectors) and re-imports don't hit duplicate names
+metrics_registry = CollectorRegistry(auto_describe=False)
+metrics_registry.register(FitCoachCollector())
+
+
 @router.get("/metrics", response_class=PlainTextResponse)
-async def metrics() -> str:
+def metrics() -> Response:
     """
     Prometheus-compatible metrics endpoint.
 
+    Declared sync so the psutil/disk reads made while collecting run in the
+    threadpool instead of on the event loop.
+
     Provides basic application metrics in Prometheus exposition format:
     - Database connection pool metrics
-    - Redis connection status
     - System resource usage (CPU, memory, disk)
-    - HTTP request metrics (if available)
 
     Returns:
         Plain text metrics in Prometheus format
@@ -127,92 +253,29 @@ async def metrics() -> str:
     Example:
         # HELP fitcoach_database_pool_size Database connection pool size
         # TYPE fitcoach_database_pool_size gauge
-        fitcoach_database_pool_size 5
+        fitcoach_database_pool_size 5.0
 
-        # HELP fitcoach_memory_usage_bytes Memory usage in bytes
+        # HELP fitcoach_memory_usage_bytes Application memory usage in bytes
         # TYPE fitcoach_memory_usage_bytes gauge
-        fitcoach_memory_usage_bytes 134217728
+        fitcoach_memory_usage_bytes 1.34217728e+08
     """
-    metrics_lines = []
-
-    # Database pool metrics
-    try:
-        pool = engine.pool
-        metrics_lines.extend([
-            "# HELP fitcoach_database_pool_size Database connection pool size",
-            "# TYPE fitcoach_database_pool_size gauge",
-            f"fitcoach_database_pool_size {pool.size()}",
-            "",
-            "# HELP fitcoach_database_pool_checked_out Database connections checked out",
-            "# TYPE fitcoach_database_pool_checked_out gauge",
-            f"fitcoach_database_pool_checked_out {pool.checkedout()}",
-            "",
-        ])
-    except Exception as e:
-        logger.error(f"Failed to get database pool metrics: {e}")
-
-    # Memory metrics
-    try:
-        memory = psutil.virtual_memory()
-        process = psutil.Process()
-        process_memory = process.memory_info()
-
-        metrics_lines.extend([
-            "# HELP fitcoach_memory_usage_bytes Application memory usage in bytes",
-            "# TYPE fitcoach_memory_usage_bytes gauge",
-            f"fitcoach_memory_usage_bytes {process_memory.rss}",
-            "",
-            "# HELP fitcoach_system_memory_total_bytes Total system memory in bytes",
-            "# TYPE fitcoach_system_memory_total_bytes gauge",
-            f"fitcoach_system_memory_total_bytes {memory.total}",
-            "",
-            "# HELP fitcoach_system_memory_available_bytes Available system memory in bytes",
-            "# TYPE fitcoach_system_memory_available_bytes gauge",
-            f"fitcoach_system_memory_available_bytes {memory.available}",
-            "",
-        ])
-    except Exception as e:
-        logger.error(f"Failed to get memory metrics: {e}")
-
-    # CPU metrics
-    try:
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-        metrics_lines.extend([
-            "# HELP fitcoach_cpu_usage_percent CPU usage percentage",
-            "# TYPE fitcoach_cpu_usage_percent gauge",
-            f"fitcoach_cpu_usage_percent {cpu_percent}",
-            "",
-        ])
-    except Exception as e:
-        logger.error(f"Failed to get CPU metrics: {e}")
+    return Response(content=generate_latest(metrics_registry), media_type=CONTENT_TYPE_LATEST)
 
-    # Disk metrics
-    try:
-        disk = shutil.disk_usage("/")
-        metrics_lines.extend([
-            "# HELP fitcoach_disk_total_bytes Total disk space in bytes",
-            "# TYPE fitcoach_disk_total_bytes gauge",
-            f"fitcoach_disk_total_bytes {disk.total}",
-            "",
-            "# HELP fitcoach_disk_used_bytes Used disk space in bytes",
-            "# TYPE fitcoach_disk_used_bytes gauge",
-            f"fitcoach_disk_used_bytes {disk.used}",
-            "",
-            "# HELP fitcoach_disk_free_bytes Free disk space in bytes",
-            "# TYPE fitcoach_disk_free_bytes gauge",
-            f"fitcoach_disk_free_bytes {disk.free}",
-            "",
-        ])
-    except Exception as e:
-        logger.error(f"Failed to get disk metrics: {e}")
 
-    return "\n".join(metrics_lines)
+def _ping_database() -> None:
+    """Run ``SELECT 1`` on a pooled connection (blocking)."""
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
 
 
 async def check_database() -> Dict[str, Any]:
     """
     Check PostgreSQL database connection and latency.
 
+    The blocking ping runs in a worker thread so a slow database doesn't
+    stall the event loop, and the wait is bounded so a hung database
+    reports unhealthy instead of hanging the probe.
+
     Returns:
         Dictionary with status and latency information
     """
@@ -220,8 +283,7 @@ async def check_database() -> Dict[str, Any]:
         start_time = time.time()
 
         # Simple query to check connection
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
+        await asyncio.wait_for(asyncio.to_thread(_ping_database), timeout=DB_CHECK_TIMEOUT)
 
         latency_ms = (time.time() - start_time) * 1000
 
@@ -229,6 +291,12 @@ async def check_database() -> Dict[str, Any]:
             "status": "healthy",
             "latency_ms": round(latency_ms, 2),
         }
+    except asyncio.TimeoutError:
+        logger.error(f"Database health check timed out after {DB_CHECK_TIMEOUT}s")
+        return {
+            "status": "unhealthy",
+            "error": f"timed out after {DB_CHECK_TIMEOUT}s",
+        }
     except Exception as e:
         logger.error(f"Database health check failed: {e}")
         return {
@@ -247,22 +315,11 @@ async def check_redis() -> Dict[str, Any]:
     try:
         start_time = time.time()
 
-        # Create Redis connection
-        redis_client = redis.Redis(
-            host=settings.REDIS_HOST,
-            port=settings.REDIS_PORT,
-            db=settings.REDIS_DB,
-            socket_connect_timeout=5,
-            socket_timeout=5,
-        )
-
-        # Ping Redis
-        redis_client.ping()
+        # Ping Redis over a pooled connection without blocking the event loop
+        await asyncio.to_thread(_redis_client.ping)
 
         latency_ms = (time.time() - start_time) * 1000
 
-        redis_client.close()
-
         return {
             "status": "healthy",
             "latency_ms": round(latency_ms, 2),
@@ -275,6 +332,31 @@ async def check_redis() -> Dict[str, Any]:
         }
 
 
+def _cached_system_stat(name: str, fetch: Callable[[], Any]) -> Any:
+    """
+    Return a system reading, re-fetching it at most once per SYSTEM_STATS_TTL.
+
+    Probes from many pods/kubelets hit readiness every few seconds; disk and
+    memory figures don't move meaningfully in that window, so the syscall
+    and /proc parsing are skipped for cached readings.
+
+    Args:
+        name: Cache key for the reading
+        fetch: Callable producing a fresh reading
+
+    Returns:
+        Cached or freshly fetched reading
+    """
+    now = time.monotonic()
+    cached = _system_stats_cache.get(name)
+    if cached is not None and now - cached[0] < SYSTEM_STATS_TTL:
+        return cached[1]
+
+    value = fetch()
+    _system_stats_cache[name] = (now, value)
+    return value
+
+
 def check_disk_space(warning_threshold_percent: float = 90.0) -> Dict[str, Any]:
     """
     Check available disk space.
@@ -286,7 +368,7 @@ def check_disk_space(warning_threshold_percent: float = 90.0) -> Dict[str, Any]:
         Dictionary with status and disk usage information
     """
     try:
-        disk = shutil.disk_usage("/")
+        disk = _cached_system_stat("disk", lambda: shutil.disk_usage("/"))
         total_gb = disk.total / (1024**3)
         used_gb = disk.used / (1024**3)
         free_gb = disk.free / (1024**3)
@@ -322,7 +404,7 @@ def check_memory(warning_threshold_percent: float = 90.0) -> Dict[str, Any]:
         Dictionary with status and memory usage information
     """
     try:
-        memory = psutil.virtual_memory()
+        memory = _cached_system_stat("memory", psutil.virtual_memory)
         total_gb = memory.total / (1024**3)
         available_gb = memory.available / (1024**3)
         used_gb = memory.used / (1024**3)
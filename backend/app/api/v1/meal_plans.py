@@ -1,18 +1,31 @@
 """Meal plan API endpoints."""
 
 import logging
-from typing import AsyncIterator
-
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
-
+from typing import AsyncIterator, List
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import Response, StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import bindparam, insert, select
+from sqlalchemy.orm import Session, load_only
+
+from app.core.cache import (
+    MEAL_PLAN_CACHE_TTL,
+    cache_delete,
+    cache_get,
+    cache_set,
+    meal_plan_cache_key,
+)
+from app.core.database import commit_returning
 from app.core.dependencies import get_current_user, get_db
+from app.core.etag import json_response_with_etag
+from app.core.sse import SSE_DONE, SSE_HEADERS, SSE_PADDING, coalesce_chunks, sse_event
 from app.models.meal_plan import MealPlan
 from app.models.user import User
 from app.schemas.meal_plan import (
     MealPlanCreateResponse,
     MealPlanGenerateRequest,
+    MealPlanListItem,
     MealPlanListResponse,
     MealPlanResponse,
 )
@@ -22,9 +35,20 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Converts a whole page of ORM rows to list items in one pydantic-core call
+_PLAN_LIST_ADAPTER = TypeAdapter(List[MealPlanListItem])
+
+# Ownership is part of the WHERE clause, so another user's plan (and its
+# large plan_data) is never loaded. Built once with bound parameters so each
+# call reuses the statement and its cached compiled form.
+_OWNED_MEAL_PLAN = select(MealPlan).where(
+    MealPlan.id == bindparam("plan_id"),
+    MealPlan.user_id == bindparam("user_id"),
+)
+
 
 @router.post("/generate", response_model=MealPlanCreateResponse)
-async def generate_meal_plan(
+def generate_meal_plan(
     request: MealPlanGenerateRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -61,22 +85,24 @@ async def generate_meal_plan(
                 error=result.get("error", "Failed to generate meal plan")
             )
 
-        # Save to database
-        meal_plan = MealPlan(
-            user_id=current_user.id,
-            name=request.name or "My Meal Plan",
-            description=request.description,
-            calorie_target=result.get("calorie_target", 2000),
-            dietary_preferences=request.dietary_preferences,
-            allergies=request.allergies,
-            plan_data=result.get("meal_plan", {}),
-            summary=result.get("summary", {}),
-            is_active=1,
+        # Save to database, reading the new row back in the same statement
+        stmt = (
+            insert(MealPlan)
+            .values(
+                user_id=current_user.id,
+                name=request.name or "My Meal Plan",
+                description=request.description,
+                calorie_target=result.get("calorie_target", 2000),
+                dietary_preferences=request.dietary_preferences,
+                allergies=request.allergies,
+                plan_data=result.get("meal_plan", {}),
+                summary=result.get("summary", {}),
+                is_active=1,
+            )
+            .returning(MealPlan)
         )
-
-        db.add(meal_plan)
-        db.commit()
-        db.refresh(meal_plan)
+        meal_plan = db.execute(stmt).scalar_one()
+        commit_returning(db, meal_plan)
 
         logger.info(f"Meal plan created successfully: ID {meal_plan.id}")
 
@@ -95,7 +121,7 @@ async def generate_meal_plan(
 
 
 @router.get("/", response_model=MealPlanListResponse)
-async def get_meal_plans(
+def get_meal_plans(
     active_only: bool = True,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -108,20 +134,43 @@ async def get_meal_plans(
         current_user: Current authenticated user
 
     Returns:
-        MealPlanListResponse with list of plans
+        MealPlanListResponse with list of plans (plan_data and summary are
+        only returned by the detail endpoint)
     """
     try:
-        query = db.query(MealPlan).filter(MealPlan.user_id == current_user.id)
+        # Skip the large plan_data/summary JSON columns, the list view
+        # only needs plan metadata
+        query = (
+            db.query(MealPlan)
+            .options(
+                load_only(
+                    MealPlan.id,
+                    MealPlan.user_id,
+                    MealPlan.name,
+                    MealPlan.description,
+                    MealPlan.calorie_target,
+                    MealPlan.dietary_preferences,
+                    MealPlan.allergies,
+                    MealPlan.is_active,
+                    MealPlan.created_at,
+                    MealPlan.updated_at,
+                )
+            )
+            .filter(MealPlan.user_id == current_user.id)
+        )
 
         if active_only:
             query = query.filter(MealPlan.is_active == 1)
 
         meal_plans = query.order_by(MealPlan.created_at.desc()).all()
 
-        return MealPlanListResponse(
-            meal_plans=[MealPlanResponse.model_validate(plan) for plan in meal_plans],
-            total=len(meal_plans)
+        # Items are already validated by the adapter, so build the envelope
+        # without revalidating and serialize it directly
+        response = MealPlanListResponse.model_construct(
+            meal_plans=_PLAN_LIST_ADAPTER.validate_python(meal_plans, from_attributes=True),
+            total=len(meal_plans),
         )
+        return Response(content=response.model_dump_json(), media_type="application/json")
 
     except Exception as e:
         logger.error(f"Error fetching meal plans: {e}", exc_info=True)
@@ -132,15 +181,19 @@ async def get_meal_plans(
 
 
 @router.get("/{plan_id}", response_model=MealPlanResponse)
-async def get_meal_plan(
+def get_meal_plan(
     plan_id: int,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get a specific meal plan by ID.
 
+    Responds 304 Not Modified when If-None-Match matches the current ETag.
+
     Args:
         plan_id: Meal plan ID
+        request: Incoming request (for conditional GET headers)
         db: Database session
         current_user: Current authenticated user
 
@@ -151,10 +204,15 @@ async def get_meal_plan(
         HTTPException: 404 if plan not found
     """
     try:
-        meal_plan = db.query(MealPlan).filter(
-            MealPlan.id == plan_id,
-            MealPlan.user_id == current_user.id
-        ).first()
+        # Serve the serialized plan from cache when available
+        cache_key = meal_plan_cache_key(plan_id, current_user.id)
+        cached = cache_get(cache_key)
+        if cached is not None:
+            return json_response_with_etag(request, cached)
+
+        meal_plan = db.scalars(
+            _OWNED_MEAL_PLAN, {"plan_id": plan_id, "user_id": current_user.id}
+        ).one_or_none()
 
         if not meal_plan:
             raise HTTPException(
@@ -162,7 +220,9 @@ async def get_meal_plan(
                 detail="Meal plan not found"
             )
 
-        return MealPlanResponse.model_validate(meal_plan)
+        body = MealPlanResponse.model_validate(meal_plan).model_dump_json()
+        cache_set(cache_key, body, MEAL_PLAN_CACHE_TTL)
+        return json_response_with_etag(request, body)
 
     except HTTPException:
         raise
@@ -175,7 +235,7 @@ async def get_meal_plan(
 
 
 @router.delete("/{plan_id}")
-async def delete_meal_plan(
+def delete_meal_plan(
     plan_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -194,10 +254,9 @@ async def delete_meal_plan(
         HTTPException: 404 if plan not found
     """
     try:
-        meal_plan = db.query(MealPlan).filter(
-            MealPlan.id == plan_id,
-            MealPlan.user_id == current_user.id
-        ).first()
+        meal_plan = db.scalars(
+            _OWNED_MEAL_PLAN, {"plan_id": plan_id, "user_id": current_user.id}
+        ).one_or_none()
 
         if not meal_plan:
             raise HTTPException(
@@ -208,6 +267,7 @@ async def delete_meal_plan(
         # Archive instead of delete
         meal_plan.is_active = 0
         db.commit()
+        cache_delete(meal_plan_cache_key(plan_id, current_user.id))
 
         return {"success": True, "message": "Meal plan archived successfully"}
 
@@ -242,29 +302,30 @@ async def stream_meal_plan_generation(
 
         async def generate_stream() -> AsyncIterator[bytes]:
             """Generate SSE stream."""
+            # Padding comment first so buffering proxies start flushing
+            yield SSE_PADDING
             try:
-                async for chunk in MealPlanService.stream_meal_plan_generation(
-                    db=db,
-                    user=current_user,
-                    dietary_preferences=request.dietary_preferences,
-                    calorie_target=request.calorie_target,
-                    allergies=request.allergies,
+                # Send token bursts as one event instead of one per token
+                async for chunk in coalesce_chunks(
+                    MealPlanService.stream_meal_plan_generation(
+                        db=db,
+                        user=current_user,
+                        dietary_preferences=request.dietary_preferences,
+                        calorie_target=request.calorie_target,
+                        allergies=request.allergies,
+                    )
                 ):
-                    yield f"data: {chunk}\n\n".encode("utf-8")
+                    yield sse_event(chunk)
             except Exception as e:
                 logger.error(f"Error in meal plan stream: {e}", exc_info=True)
-                yield f"data: [ERROR: {str(e)}]\n\n".encode("utf-8")
+                yield sse_event(f"[ERROR: {str(e)}]")
             finally:
-                yield "data: [DONE]\n\n".encode("utf-8")
+                yield SSE_DONE
 
         return StreamingResponse(
             generate_stream(),
             media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Accel-Buffering": "no",
-            }
+            headers=SSE_HEADERS,
         )
 
     except Exception as e:
@@ -1,21 +1,33 @@
 """Meal endpoints."""
 
 import asyncio
+import hashlib
 import os
-import uuid
-from datetime import datetime
+import time
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, List, NoReturn, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, UploadFile, status
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Query, Request, UploadFile, status
 from sqlalchemy.orm import Session
 
-from app.agents.agents.vision_agent import VisionAgent
 from app.config import settings
-from app.core.dependencies import get_current_user, get_db
+from app.core.cache import (
+    MEAL_CACHE_TTL,
+    cache_delete,
+    cache_get,
+    cache_set,
+    meal_cache_key,
+)
+from app.core.dependencies import (
+    check_day_access,
+    get_current_user,
+    get_db,
+    raise_day_not_accessible,
+)
+from app.core.etag import json_response_with_etag
 from app.core.file_validator import validate_image_upload
-from app.models.day import Day
-from app.models.meal import Meal
+from app.core.pubsub import meal_status_channel, subscription, wait_for_message
+from app.core.task_queue import enqueue_job
 from app.models.user import User
 from app.schemas.meal import (
     MealCreate,
@@ -25,9 +37,38 @@ from app.schemas.meal import (
     PhotoUploadResponse,
 )
 from app.services.meal_service import MealService
+from app.worker import process_meal_photo
 
 router = APIRouter()
 
+# Uploaded photos are written to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Crockford base32 alphabet used for ULID photo filenames
+_ULID_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+
+def _raise_meal_not_accessible(db: Session, meal_id: int, forbidden_detail: str) -> NoReturn:
+    """Raise 404 or 403 after an ownership-filtered meal query matched nothing.
+
+    Args:
+        db: Database session
+        meal_id: Meal ID that was requested
+        forbidden_detail: Error detail used when the meal belongs to another user
+
+    Raises:
+        HTTPException: 404 if meal does not exist, 403 otherwise
+    """
+    if not MealService.meal_exists(db, meal_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Meal with id {meal_id} not found",
+        )
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail=forbidden_detail,
+    )
+
 
 @router.post("/days/{day_id}/meals", response_model=MealResponse, status_code=status.HTTP_201_CREATED)
 def create_meal(
@@ -50,34 +91,24 @@ def create_meal(
     Raises:
         HTTPException: 404 if day not found, 403 if not authorized
     """
-    # First check if day exists
-    day = db.query(Day).filter(Day.id == day_id).first()
-
-    if not day:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Day with id {day_id} not found",
-        )
-
-    # Verify day belongs to current user
-    if day.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to add meals to this day",
-        )
-
-    # Create meal (exclude day_id from meal_data as we use path parameter)
+    # Create meal (exclude day_id from meal_data as we use path parameter);
+    # the day ownership check is part of the insert
     meal_dict = meal_data.model_dump(exclude={"day_id"})
 
     try:
-        meal = MealService.create_meal(db, day_id, meal_dict)
-        return meal
+        meal = MealService.create_meal(db, day_id, current_user.id, meal_dict)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
 
+    if not meal:
+        # Nothing was inserted, check whether the day is missing or foreign
+        raise_day_not_accessible(db, day_id, "Not authorized to add meals to this day")
+
+    return meal
+
 
 @router.get("/days/{day_id}/meals", response_model=List[MealResponse])
 def get_meals_by_day(
@@ -98,21 +129,8 @@ def get_meals_by_day(
     Raises:
         HTTPException: 404 if day not found, 403 if not authorized
     """
-    # First check if day exists
-    day = db.query(Day).filter(Day.id == day_id).first()
-
-    if not day:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Day with id {day_id} not found",
-        )
-
-    # Verify day belongs to current user
-    if day.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to view meals for this day",
-        )
+    # Check that the day exists and belongs to current user
+    check_day_access(db, day_id, current_user.id, "Not authorized to view meals for this day")
 
     meals = MealService.get_meals_by_day(db, day_id)
     return meals
@@ -121,13 +139,17 @@ def get_meals_by_day(
 @router.get("/meals/{meal_id}", response_model=MealResponse)
 def get_meal(
     meal_id: int,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get specific meal by ID.
 
+    Responds 304 Not Modified when If-None-Match matches the current ETag.
+
     Args:
         meal_id: Meal ID
+        request: Incoming request (for conditional GET headers)
         db: Database session
         current_user: Current authenticated user
 
@@ -137,22 +159,21 @@ def get_meal(
     Raises:
         HTTPException: 404 if meal not found, 403 if not authorized
     """
-    meal = MealService.get_meal(db, meal_id)
+    # Serve the serialized meal from cache when available
+    cache_key = meal_cache_key(meal_id, current_user.id)
+    cached = cache_get(cache_key)
+    if cached is not None:
+        return json_response_with_etag(request, cached)
 
-    if not meal:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Meal with id {meal_id} not found",
-        )
+    # Fetch the meal only if its day belongs to current user
+    meal = MealService.get_user_meal(db, meal_id, current_user.id)
 
-    # Verify meal's day belongs to current user
-    if meal.day.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to view this meal",
-        )
+    if not meal:
+        _raise_meal_not_accessible(db, meal_id, "Not authorized to view this meal")
 
-    return meal
+    body = MealResponse.model_validate(meal).model_dump_json()
+    cache_set(cache_key, body, MEAL_CACHE_TTL)
+    return json_response_with_etag(request, body)
 
 
 @router.put("/meals/{meal_id}", response_model=MealResponse)
@@ -176,33 +197,15 @@ def update_meal(
     Raises:
         HTTPException: 404 if meal not found, 403 if not authorized
     """
-    # First check if meal exists
-    meal = db.query(Meal).filter(Meal.id == meal_id).first()
-
-    if not meal:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Meal with id {meal_id} not found",
-        )
-
-    # Verify meal's day belongs to current user
-    if meal.day.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to update this meal",
-        )
-
     # Update meal with only the fields that are provided
     update_data = meal_data.model_dump(exclude_unset=True)
+    updated_meal = MealService.update_meal(db, meal_id, current_user.id, **update_data)
 
-    try:
-        updated_meal = MealService.update_meal(db, meal_id, **update_data)
-        return updated_meal
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
+    if updated_meal is None:
+        _raise_meal_not_accessible(db, meal_id, "Not authorized to update this meal")
+
+    cache_delete(meal_cache_key(meal_id, current_user.id))
+    return updated_meal
 
 
 @router.delete("/meals/{meal_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -224,95 +227,90 @@ def delete_meal(
     Raises:
         HTTPException: 404 if meal not found, 403 if not authorized
     """
-    # First check if meal exists
-    meal = db.query(Meal).filter(Meal.id == meal_id).first()
-
-    if not meal:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Meal with id {meal_id} not found",
-        )
-
-    # Verify meal's day belongs to current user
-    if meal.day.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to delete this meal",
-        )
+    # Delete meal only if its day belongs to current user
+    deleted = MealService.delete_meal(db, meal_id, current_user.id)
 
-    # Delete meal
-    success = MealService.delete_meal(db, meal_id)
-
-    if not success:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Meal with id {meal_id} not found",
-        )
+    if not deleted:
+        _raise_meal_not_accessible(db, meal_id, "Not authorized to delete this meal")
 
+    cache_delete(meal_cache_key(meal_id, current_user.id))
     return None
 
 
 # Vision Agent integration
 
 
-def process_meal_photo_background(meal_id: int, photo_path: str, user_id: int) -> None:
-    """Process meal photo with Vision Agent in background.
+async def process_meal_photo_background(
+    meal_id: int, photo_path: str, user_id: int, photo_hash: Optional[str] = None
+) -> None:
+    """Process meal photo in-process when the job queue is unavailable.
+
+    Runs as an async background task on the server's event loop rather than
+    starting a new loop per photo.
 
     Args:
         meal_id: ID of the meal to update
         photo_path: Path to the uploaded photo
         user_id: User ID for database session
+        photo_hash: Hex digest of the photo content
     """
-    import asyncio
-    from app.core.database import SessionLocal
-
-    db = SessionLocal()
-
-    async def _async_process():
-        """Inner async function to run VisionAgent."""
-        nonlocal db
-        try:
-            # Get meal and update status to processing
-            meal = db.query(Meal).filter(Meal.id == meal_id).first()
-            if not meal:
-                return
-
-            meal.photo_processing_status = "processing"
-            db.commit()
-
-            # Initialize Vision Agent
-            vision_agent = VisionAgent(db=db, user_id=user_id)
-
-            # Process photo
-            result = await vision_agent.execute({
-                "photo_path": photo_path,
-                "category": meal.category,
-                "day_id": meal.day_id,
-            })
-
-            # Update meal with results
-            if result.get("success"):
-                meal.photo_processing_status = "completed"
-                if result.get("recognized_items"):
-                    meal.ai_recognized_items = result["recognized_items"]
-            else:
-                meal.photo_processing_status = "failed"
-                meal.photo_processing_error = result.get("error", "Unknown error")
-
-            db.commit()
-
-        except Exception as e:
-            # Update meal with error
-            meal = db.query(Meal).filter(Meal.id == meal_id).first()
-            if meal:
-                meal.photo_processing_status = "failed"
-                meal.photo_processing_error = str(e)
-                db.commit()
-        finally:
-            db.close()
-
-    # Run async function
-    asyncio.run(_async_process())
+    await process_meal_photo(meal_id, photo_path, user_id, photo_hash)
+
+
+def _new_ulid() -> str:
+    """Generate a ULID for photo filenames.
+
+    48 bits of millisecond timestamp followed by 80 random bits, encoded as
+    26 Crockford base32 characters, so names sort by upload time.
+
+    Returns:
+        ULID string
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    chars = []
+    for _ in range(26):
+        chars.append(_ULID_ALPHABET[value & 0x1F])
+        value >>= 5
+    return "".join(reversed(chars))
+
+
+def _save_upload(source: BinaryIO, destination: Path, max_bytes: int) -> str:
+    """Copy an uploaded file to disk in chunks, hashing it on the way.
+
+    Args:
+        source: Uploaded file object
+        destination: Target file path
+        max_bytes: Maximum number of bytes allowed
+
+    Returns:
+        BLAKE2b hex digest of the file content
+
+    Raises:
+        ValueError: If the upload exceeds max_bytes (partial file is removed)
+    """
+    source.seek(0)
+    written = 0
+    digest = hashlib.blake2b(digest_size=16)
+    # Chunks are already large, so write them straight to the fd instead of
+    # through a second userspace buffer
+    fd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o644)
+    try:
+        while chunk := source.read(UPLOAD_CHUNK_SIZE):
+            written += len(chunk)
+            if written > max_bytes:
+                break
+            digest.update(chunk)
+            view = memoryview(chunk)
+            while view:
+                view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+    if written > max_bytes:
+        destination.unlink(missing_ok=True)
+        raise ValueError(f"File exceeds maximum upload size of {max_bytes} bytes")
+
+    return digest.hexdigest()
 
 
 @router.post("/meals/upload-photo", response_model=PhotoUploadResponse, status_code=status.HTTP_202_ACCEPTED)
@@ -350,18 +348,7 @@ async def upload_meal_photo(
         HTTPException: 400 if invalid file, 404 if day not found, 403 if not authorized
     """
     # Validate day exists and belongs to user
-    day = db.query(Day).filter(Day.id == day_id).first()
-    if not day:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Day with id {day_id} not found",
-        )
-
-    if day.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to add meals to this day",
-        )
+    check_day_access(db, day_id, current_user.id, "Not authorized to add meals to this day")
 
     # Validate uploaded file (security checks)
     safe_filename = await validate_image_upload(file)
@@ -370,18 +357,21 @@ async def upload_meal_photo(
     upload_dir = Path(settings.MEAL_PHOTOS_DIR)
     upload_dir.mkdir(parents=True, exist_ok=True)
 
-    # Generate unique filename using sanitized filename
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    unique_id = str(uuid.uuid4())[:8]
+    # Generate unique, time-sortable filename keeping the sanitized extension
     file_ext = Path(safe_filename).suffix
-    filename = f"{current_user.id}_{timestamp}_{unique_id}{file_ext}"
+    filename = f"{current_user.id}_{_new_ulid()}{file_ext}"
     file_path = upload_dir / filename
 
-    # Save file
+    # Save file in chunks off the event loop
     try:
-        with open(file_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
+        photo_hash = await asyncio.to_thread(
+            _save_upload, file.file, file_path, settings.MAX_UPLOAD_SIZE
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e),
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -396,7 +386,7 @@ async def upload_meal_photo(
     }
 
     try:
-        meal = MealService.create_meal(db, day_id, meal_data)
+        meal = MealService.create_meal(db, day_id, current_user.id, meal_data)
     except ValueError as e:
         # Clean up uploaded file
         if file_path.exists():
@@ -406,13 +396,22 @@ async def upload_meal_photo(
             detail=str(e),
         )
 
-    # Trigger Vision Agent in background
-    background_tasks.add_task(
-        process_meal_photo_background,
-        meal_id=meal.id,
-        photo_path=str(file_path),
-        user_id=current_user.id,
-    )
+    if not meal:
+        # The day was deleted while the photo was being saved
+        if file_path.exists():
+            file_path.unlink()
+        raise_day_not_accessible(db, day_id, "Not authorized to add meals to this day")
+
+    # Hand the Vision Agent job to the worker, processing in-process only
+    # if the queue is unavailable
+    job_args = {
+        "meal_id": meal.id,
+        "photo_path": str(file_path),
+        "user_id": current_user.id,
+        "photo_hash": photo_hash,
+    }
+    if not await enqueue_job("process_meal_photo", **job_args):
+        background_tasks.add_task(process_meal_photo_background, **job_args)
 
     return PhotoUploadResponse(
         meal_id=meal.id,
@@ -422,19 +421,57 @@ async def upload_meal_photo(
     )
 
 
+def _get_processing_status(db: Session, meal_id: int, user_id: int) -> MealProcessingStatus:
+    """Build the processing status of a meal photo owned by the user.
+
+    Args:
+        db: Database session
+        meal_id: Meal ID
+        user_id: ID of the user who must own the meal's day
+
+    Returns:
+        MealProcessingStatus with current status and results (if completed)
+
+    Raises:
+        HTTPException: 404 if meal not found, 403 if not authorized
+    """
+    # Fetch the meal only if its day belongs to current user
+    meal = MealService.get_user_meal(db, meal_id, user_id)
+
+    if not meal:
+        _raise_meal_not_accessible(db, meal_id, "Not authorized to view this meal")
+
+    response = MealProcessingStatus(
+        meal_id=meal.id,
+        status=meal.photo_processing_status or "pending",
+        error=meal.photo_processing_error,
+        recognized_items=meal.ai_recognized_items,
+    )
+
+    # If completed, include full meal data
+    if meal.photo_processing_status == "completed":
+        response.meal_data = MealResponse.model_validate(meal)
+
+    return response
+
+
 @router.get("/meals/{meal_id}/processing-status", response_model=MealProcessingStatus)
 def get_meal_processing_status(
     meal_id: int,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get the processing status of a meal photo.
 
     Use this endpoint to poll for Vision Agent processing results.
-    Poll every 2-3 seconds until status is 'completed' or 'failed'.
+    Poll every 2-3 seconds until status is 'completed' or 'failed', or use
+    processing-status/wait to long-poll instead. Send the last ETag in
+    If-None-Match to get 304 Not Modified while nothing changed.
 
     Args:
         meal_id: Meal ID
+        request: Incoming request (for conditional GET headers)
         db: Database session
         current_user: Current authenticated user
 
@@ -444,30 +481,50 @@ def get_meal_processing_status(
     Raises:
         HTTPException: 404 if meal not found, 403 if not authorized
     """
-    meal = db.query(Meal).filter(Meal.id == meal_id).first()
+    response = _get_processing_status(db, meal_id, current_user.id)
+    return json_response_with_etag(request, response.model_dump_json())
 
-    if not meal:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Meal with id {meal_id} not found",
-        )
 
-    # Verify meal's day belongs to current user
-    if meal.day.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to view this meal",
-        )
+@router.get("/meals/{meal_id}/processing-status/wait", response_model=MealProcessingStatus)
+async def wait_meal_processing_status(
+    meal_id: int,
+    request: Request,
+    timeout: float = Query(30.0, gt=0, le=60, description="Maximum seconds to wait"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Wait for a meal photo to finish processing (long polling).
 
-    response = MealProcessingStatus(
-        meal_id=meal.id,
-        status=meal.photo_processing_status or "pending",
-        error=meal.photo_processing_error,
-        recognized_items=meal.ai_recognized_items,
-    )
+    Returns as soon as processing is no longer in progress, or the current
+    status once the timeout passes. Use this instead of polling
+    processing-status every few seconds.
 
-    # If completed, include full meal data
-    if meal.photo_processing_status == "completed":
-        response.meal_data = MealResponse.model_validate(meal)
+    Args:
+        meal_id: Meal ID
+        request: Incoming request (for conditional GET headers)
+        timeout: Maximum seconds to wait
+        db: Database session
+        current_user: Current authenticated user
 
-    return response
+    Returns:
+        MealProcessingStatus with current status and results (if completed)
+
+    Raises:
+        HTTPException: 404 if meal not found, 403 if not authorized
+    """
+    user_id = current_user.id
+
+    # Subscribe before reading the status so a result published in between
+    # isn't missed
+    async with subscription(meal_status_channel(meal_id)) as pubsub:
+        response = await asyncio.to_thread(_get_processing_status, db, meal_id, user_id)
+
+        if response.status == "processing" and pubsub is not None:
+            # Release the DB connection while waiting
+            await asyncio.to_thread(db.close)
+            if await wait_for_message(pubsub, timeout) is not None:
+                response = await asyncio.to_thread(
+                    _get_processing_status, db, meal_id, user_id
+                )
+
+    return json_response_with_etag(request, response.model_dump_json())
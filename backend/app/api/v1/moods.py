@@ -3,17 +3,24 @@
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
-from app.core.dependencies import get_current_user, get_db
-from app.models.day import Day
-from app.models.mood_record import MoodRecord
+from app.core.dependencies import (
+    check_day_access,
+    get_current_user,
+    get_db,
+    raise_day_not_accessible,
+)
 from app.models.user import User
 from app.schemas.mood import MoodCreate, MoodResponse, MoodUpdate
 from app.services.mood_service import MoodService
 
 router = APIRouter()
 
+_MOOD_LIST_ADAPTER = TypeAdapter(List[MoodResponse])
+
 
 @router.post("/days/{day_id}/moods", response_model=MoodResponse, status_code=status.HTTP_201_CREATED)
 def create_mood(
@@ -36,34 +43,28 @@ def create_mood(
     Raises:
         HTTPException: 404 if day not found, 403 if not authorized
     """
-    # First check if day exists
-    day = db.query(Day).filter(Day.id == day_id).first()
-
-    if not day:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Day with id {day_id} not found",
-        )
-
-    # Verify day belongs to current user
-    if day.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to add mood records to this day",
-        )
-
-    # Create mood record (exclude day_id from mood_data as we use path parameter)
-    mood_dict = mood_data.model_dump(exclude={"day_id"})
+    # Create mood record (exclude day_id from mood_data as we use path parameter);
+    # the day ownership check is part of the insert
+    mood_dict = {
+        field: getattr(mood_data, field)
+        for field in MoodCreate.model_fields
+        if field != "day_id"
+    }
 
     try:
-        mood = MoodService.create_mood(db, day_id, mood_dict)
-        return mood
+        mood = MoodService.create_mood(db, day_id, current_user.id, mood_dict)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
 
+    if not mood:
+        # Nothing was inserted, check whether the day is missing or foreign
+        raise_day_not_accessible(db, day_id, "Not authorized to add mood records to this day")
+
+    return mood
+
 
 @router.get("/days/{day_id}/moods", response_model=List[MoodResponse])
 def get_moods_by_day(
@@ -84,24 +85,44 @@ def get_moods_by_day(
     Raises:
         HTTPException: 404 if day not found, 403 if not authorized
     """
-    # First check if day exists
-    day = db.query(Day).filter(Day.id == day_id).first()
+    check_day_access(db, day_id, current_user.id, "Not authorized to view mood records for this day")
 
-    if not day:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Day with id {day_id} not found",
-        )
+    moods = MoodService.get_moods_by_day(db, day_id)
 
-    # Verify day belongs to current user
-    if day.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to view mood records for this day",
+    # Validate and serialize the whole list in one pydantic-core pass
+    items = _MOOD_LIST_ADAPTER.validate_python(moods, from_attributes=True)
+    return Response(content=_MOOD_LIST_ADAPTER.dump_json(items), media_type="application/json")
+
+
+@router.delete("/days/{day_id}/moods", status_code=status.HTTP_204_NO_CONTENT)
+def delete_moods_by_day(
+    day_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Delete all mood records for a specific day.
+
+    Args:
+        day_id: Day ID
+        db: Database session
+        current_user: Current authenticated user
+
+    Returns:
+        No content (204)
+
+    Raises:
+        HTTPException: 404 if day not found, 403 if not authorized
+    """
+    # Delete in one statement, only if the day belongs to current user
+    deleted = MoodService.delete_moods_by_day(db, day_id, current_user.id)
+
+    if not deleted:
+        # Nothing was deleted: the day may be empty, missing or foreign
+        check_day_access(
+            db, day_id, current_user.id, "Not authorized to delete mood records for this day"
         )
 
-    moods = MoodService.get_moods_by_day(db, day_id)
-    return moods
+    return None
 
 
 @router.get("/moods/{mood_id}", response_model=MoodResponse)
@@ -162,33 +183,23 @@ def update_mood(
     Raises:
         HTTPException: 404 if mood record not found, 403 if not authorized
     """
-    # First check if mood record exists
-    mood = db.query(MoodRecord).filter(MoodRecord.id == mood_id).first()
-
-    if not mood:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Mood record with id {mood_id} not found",
-        )
-
-    # Verify mood record's day belongs to current user
-    if mood.day.user_id != current_user.id:
+    # Update mood record with only the fields that are provided
+    update_data = {field: getattr(mood_data, field) for field in mood_data.model_fields_set}
+    updated_mood = MoodService.update_mood(db, mood_id, current_user.id, **update_data)
+
+    if updated_mood is None:
+        # The UPDATE matched nothing: tell a missing mood record from a foreign one
+        if not MoodService.mood_exists(db, mood_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Mood record with id {mood_id} not found",
+            )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to update this mood record",
         )
 
-    # Update mood record with only the fields that are provided
-    update_data = mood_data.model_dump(exclude_unset=True)
-
-    try:
-        updated_mood = MoodService.update_mood(db, mood_id, **update_data)
-        return updated_mood
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
+    return updated_mood
 
 
 @router.delete("/moods/{mood_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -210,29 +221,19 @@ def delete_mood(
     Raises:
         HTTPException: 404 if mood record not found, 403 if not authorized
     """
-    # First check if mood record exists
-    mood = db.query(MoodRecord).filter(MoodRecord.id == mood_id).first()
-
-    if not mood:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Mood record with id {mood_id} not found",
-        )
-
-    # Verify mood record's day belongs to current user
-    if mood.day.user_id != current_user.id:
+    # Delete mood record only if its day belongs to current user
+    deleted = MoodService.delete_mood(db, mood_id, current_user.id)
+
+    if not deleted:
+        # The DELETE matched nothing: tell a missing mood record from a foreign one
+        if not MoodService.mood_exists(db, mood_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Mood record with id {mood_id} not found",
+            )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to delete this mood record",
         )
 
-    # Delete mood record
-    success = MoodService.delete_mood(db, mood_id)
-
-    if not success:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Mood record with id {mood_id} not found",
-        )
-
     return None
@@ -3,17 +3,24 @@
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
-from app.core.dependencies import get_current_user, get_db
-from app.models.day import Day
-from app.models.note import Note
+from app.core.dependencies import (
+    check_day_access,
+    get_current_user,
+    get_db,
+    raise_day_not_accessible,
+)
 from app.models.user import User
 from app.schemas.note import NoteCreate, NoteResponse, NoteUpdate
 from app.services.note_service import NoteService
 
 router = APIRouter()
 
+_NOTE_LIST_ADAPTER = TypeAdapter(List[NoteResponse])
+
 
 @router.post("/days/{day_id}/notes", response_model=NoteResponse, status_code=status.HTTP_201_CREATED)
 def create_note(
@@ -36,34 +43,28 @@ def create_note(
     Raises:
         HTTPException: 404 if day not found, 403 if not authorized
     """
-    # First check if day exists
-    day = db.query(Day).filter(Day.id == day_id).first()
-
-    if not day:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Day with id {day_id} not found",
-        )
-
-    # Verify day belongs to current user
-    if day.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to add notes to this day",
-        )
-
-    # Create note (exclude day_id from note_data as we use path parameter)
-    note_dict = note_data.model_dump(exclude={"day_id"})
+    # Create note (exclude day_id from note_data as we use path parameter);
+    # the day ownership check is part of the insert
+    note_dict = {
+        field: getattr(note_data, field)
+        for field in NoteCreate.model_fields
+        if field != "day_id"
+    }
 
     try:
-        note = NoteService.create_note(db, day_id, note_dict)
-        return note
+        note = NoteService.create_note(db, day_id, current_user.id, note_dict)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
 
+    if not note:
+        # Nothing was inserted, check whether the day is missing or foreign
+        raise_day_not_accessible(db, day_id, "Not authorized to add notes to this day")
+
+    return note
+
 
 @router.get("/days/{day_id}/notes", response_model=List[NoteResponse])
 def get_notes_by_day(
@@ -84,24 +85,44 @@ def get_notes_by_day(
     Raises:
         HTTPException: 404 if day not found, 403 if not authorized
     """
-    # First check if day exists
-    day = db.query(Day).filter(Day.id == day_id).first()
+    check_day_access(db, day_id, current_user.id, "Not authorized to view notes for this day")
 
-    if not day:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Day with id {day_id} not found",
-        )
+    notes = NoteService.get_notes_by_day(db, day_id)
 
-    # Verify day belongs to current user
-    if day.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to view notes for this day",
+    # Validate and serialize the whole list in one pydantic-core pass
+    items = _NOTE_LIST_ADAPTER.validate_python(notes, from_attributes=True)
+    return Response(content=_NOTE_LIST_ADAPTER.dump_json(items), media_type="application/json")
+
+
+@router.delete("/days/{day_id}/notes", status_code=status.HTTP_204_NO_CONTENT)
+def delete_notes_by_day(
+    day_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Delete all notes for a specific day.
+
+    Args:
+        day_id: Day ID
+        db: Database session
+        current_user: Current authenticated user
+
+    Returns:
+        No content (204)
+
+    Raises:
+        HTTPException: 404 if day not found, 403 if not authorized
+    """
+    # Delete in one statement, only if the day belongs to current user
+    deleted = NoteService.delete_notes_by_day(db, day_id, current_user.id)
+
+    if not deleted:
+        # Nothing was deleted: the day may be empty, missing or foreign
+        check_day_access(
+            db, day_id, current_user.id, "Not authorized to delete notes for this day"
         )
 
-    notes = NoteService.get_notes_by_day(db, day_id)
-    return notes
+    return None
 
 
 @router.get("/notes/{note_id}", response_model=NoteResponse)
@@ -162,33 +183,23 @@ def update_note(
     Raises:
         HTTPException: 404 if note not found, 403 if not authorized
     """
-    # First check if note exists
-    note = db.query(Note).filter(Note.id == note_id).first()
-
-    if not note:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Note with id {note_id} not found",
-        )
-
-    # Verify note's day belongs to current user
-    if note.day.user_id != current_user.id:
+    # Update note with only the fields that are provided
+    update_data = {field: getattr(note_data, field) for field in note_data.model_fields_set}
+    updated_note = NoteService.update_note(db, note_id, current_user.id, **update_data)
+
+    if updated_note is None:
+        # The UPDATE matched nothing: tell a missing note from a foreign one
+        if not NoteService.note_exists(db, note_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Note with id {note_id} not found",
+            )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to update this note",
         )
 
-    # Update note with only the fields that are provided
-    update_data = note_data.model_dump(exclude_unset=True)
-
-    try:
-        updated_note = NoteService.update_note(db, note_id, **update_data)
-        return updated_note
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
+    return updated_note
 
 
 @router.delete("/notes/{note_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -210,29 +221,19 @@ def delete_note(
     Raises:
         HTTPException: 404 if note not found, 403 if not authorized
     """
-    # First check if note exists
-    note = db.query(Note).filter(Note.id == note_id).first()
-
-    if not note:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Note with id {note_id} not found",
-        )
-
-    # Verify note's day belongs to current user
-    if note.day.user_id != current_user.id:
+    # Delete note only if its day belongs to current user
+    deleted = NoteService.delete_note(db, note_id, current_user.id)
+
+    if not deleted:
+        # The DELETE matched nothing: tell a missing note from a foreign one
+        if not NoteService.note_exists(db, note_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Note with id {note_id} not found",
+            )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to delete this note",
         )
 
-    # Delete note
-    success = NoteService.delete_note(db, note_id)
-
-    if not success:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Note with id {note_id} not found",
-        )
-
     return None
@@ -2,27 +2,47 @@
 
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
+from app.core.cache import (
+    NOTIFICATIONS_CACHE_TTL,
+    cache_get,
+    cache_set,
+    notifications_cache_key,
+)
 from app.core.dependencies import get_current_user, get_db
 from app.models.notification import Notification
 from app.models.user import User
-from app.schemas.notification import NotificationResponse, NotificationUpdate
+from app.schemas.notification import (
+    NotificationMarkRead,
+    NotificationMarkReadResponse,
+    NotificationResponse,
+    NotificationUpdate,
+)
 from app.services.notification_service import NotificationService
 
 router = APIRouter()
 
+_NOTIFICATION_LIST_ADAPTER = TypeAdapter(List[NotificationResponse])
+
 
 @router.get("/notifications", response_model=List[NotificationResponse])
 def get_notifications(
+    request: Request,
     unread_only: bool = Query(False, description="Filter to show only unread notifications"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get all user's notifications.
 
+    The serialized list is cached briefly per user; a request with
+    ``Cache-Control: no-cache`` bypasses the cached copy.
+
     Args:
+        request: Incoming request (for Cache-Control)
         unread_only: If True, only return unread notifications (default: False)
         db: Database session
         current_user: Current authenticated user
@@ -30,10 +50,68 @@ def get_notifications(
     Returns:
         List of notifications ordered by created_at desc
     """
+    cache_key = notifications_cache_key(current_user.id, unread_only)
+    if "no-cache" not in request.headers.get("cache-control", ""):
+        cached = cache_get(cache_key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+
     notifications = NotificationService.get_user_notifications(
         db, current_user.id, unread_only=unread_only
     )
-    return notifications
+    body = _NOTIFICATION_LIST_ADAPTER.dump_json(
+        _NOTIFICATION_LIST_ADAPTER.validate_python(notifications, from_attributes=True)
+    ).decode()
+    cache_set(cache_key, body, NOTIFICATIONS_CACHE_TTL)
+    return Response(content=body, media_type="application/json")
+
+
+@router.delete("/notifications", status_code=status.HTTP_204_NO_CONTENT)
+def delete_notifications(
+    ids: List[int] = Query([], max_length=1000, description="Notification IDs to delete"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Delete several of the user's notifications in one request.
+
+    IDs that don't exist or belong to another user are ignored.
+
+    Args:
+        ids: Notification IDs to delete (repeat the parameter: ?ids=1&ids=2)
+        db: Database session
+        current_user: Current authenticated user
+
+    Returns:
+        No content (204)
+    """
+    if ids:
+        NotificationService.delete_notifications(db, current_user.id, ids)
+    return None
+
+
+@router.post("/notifications/read", response_model=NotificationMarkReadResponse)
+def mark_notifications_as_read(
+    body: NotificationMarkRead,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Mark several of the user's notifications as read in one request.
+
+    Idempotent: notifications that are already read, don't exist or belong
+    to another user are left alone and not reported back.
+
+    Args:
+        body: Notification IDs to mark as read
+        db: Database session
+        current_user: Current authenticated user
+
+    Returns:
+        IDs of the notifications that were marked as read by this request
+    """
+    updated_ids = []
+    if body.ids:
+        updated_ids = NotificationService.mark_as_read(db, current_user.id, body.ids)
+    return NotificationMarkReadResponse(updated_ids=updated_ids)
 
 
 @router.get("/notifications/{notification_id}", response_model=NotificationResponse)
@@ -93,7 +171,7 @@ def mark_notification_as_read(
         HTTPException: 404 if notification not found, 403 if not authorized
     """
     # First check if notification exists
-    notification = db.query(Notification).filter(Notification.id == notification_id).first()
+    notification = db.get(Notification, notification_id)
 
     if not notification:
         raise HTTPException(
@@ -108,15 +186,11 @@ def mark_notification_as_read(
             detail="Not authorized to update this notification",
         )
 
-    # Mark as read
-    try:
-        updated_notification = NotificationService.mark_as_read(db, notification_id)
-        return updated_notification
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
+    # Mark as read through the bulk path; an already-read notification is
+    # returned unchanged
+    if NotificationService.mark_as_read(db, current_user.id, [notification_id]):
+        db.refresh(notification)
+    return notification
 
 
 @router.delete("/notifications/{notification_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -139,7 +213,7 @@ def delete_notification(
         HTTPException: 404 if notification not found, 403 if not authorized
     """
     # First check if notification exists
-    notification = db.query(Notification).filter(Notification.id == notification_id).first()
+    notification = db.get(Notification, notification_id)
 
     if not notification:
         raise HTTPException(
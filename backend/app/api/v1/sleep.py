@@ -3,17 +3,24 @@
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
-from app.core.dependencies import get_current_user, get_db
-from app.models.day import Day
-from app.models.sleep_record import SleepRecord
+from app.core.dependencies import (
+    check_day_access,
+    get_current_user,
+    get_db,
+    raise_day_not_accessible,
+)
 from app.models.user import User
 from app.schemas.sleep import SleepCreate, SleepResponse, SleepUpdate
 from app.services.sleep_service import SleepService
 
 router = APIRouter()
 
+_SLEEP_LIST_ADAPTER = TypeAdapter(List[SleepResponse])
+
 
 @router.post("/days/{day_id}/sleep", response_model=SleepResponse, status_code=status.HTTP_201_CREATED)
 def create_sleep(
@@ -36,34 +43,28 @@ def create_sleep(
     Raises:
         HTTPException: 404 if day not found, 403 if not authorized
     """
-    # First check if day exists
-    day = db.query(Day).filter(Day.id == day_id).first()
-
-    if not day:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Day with id {day_id} not found",
-        )
-
-    # Verify day belongs to current user
-    if day.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to add sleep records to this day",
-        )
-
-    # Create sleep record (exclude day_id from sleep_data as we use path parameter)
-    sleep_dict = sleep_data.model_dump(exclude={"day_id"})
+    # Create sleep record (exclude day_id from sleep_data as we use path parameter);
+    # the day ownership check is part of the insert
+    sleep_dict = {
+        field: getattr(sleep_data, field)
+        for field in SleepCreate.model_fields
+        if field != "day_id"
+    }
 
     try:
-        sleep = SleepService.create_sleep(db, day_id, sleep_dict)
-        return sleep
+        sleep = SleepService.create_sleep(db, day_id, current_user.id, sleep_dict)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
 
+    if not sleep:
+        # Nothing was inserted, check whether the day is missing or foreign
+        raise_day_not_accessible(db, day_id, "Not authorized to add sleep records to this day")
+
+    return sleep
+
 
 @router.get("/days/{day_id}/sleep", response_model=List[SleepResponse])
 def get_sleep_by_day(
@@ -84,24 +85,44 @@ def get_sleep_by_day(
     Raises:
         HTTPException: 404 if day not found, 403 if not authorized
     """
-    # First check if day exists
-    day = db.query(Day).filter(Day.id == day_id).first()
+    check_day_access(db, day_id, current_user.id, "Not authorized to view sleep records for this day")
 
-    if not day:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Day with id {day_id} not found",
-        )
+    sleep_records = SleepService.get_sleep_by_day(db, day_id)
 
-    # Verify day belongs to current user
-    if day.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to view sleep records for this day",
+    # Validate and serialize the whole list in one pydantic-core pass
+    items = _SLEEP_LIST_ADAPTER.validate_python(sleep_records, from_attributes=True)
+    return Response(content=_SLEEP_LIST_ADAPTER.dump_json(items), media_type="application/json")
+
+
+@router.delete("/days/{day_id}/sleep", status_code=status.HTTP_204_NO_CONTENT)
+def delete_sleep_by_day(
+    day_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Delete all sleep records for a specific day.
+
+    Args:
+        day_id: Day ID
+        db: Database session
+        current_user: Current authenticated user
+
+    Returns:
+        No content (204)
+
+    Raises:
+        HTTPException: 404 if day not found, 403 if not authorized
+    """
+    # Delete in one statement, only if the day belongs to current user
+    deleted = SleepService.delete_sleep_by_day(db, day_id, current_user.id)
+
+    if not deleted:
+        # Nothing was deleted: the day may be empty, missing or foreign
+        check_day_access(
+            db, day_id, current_user.id, "Not authorized to delete sleep records for this day"
         )
 
-    sleep_records = SleepService.get_sleep_by_day(db, day_id)
-    return sleep_records
+    return None
 
 
 @router.get("/sleep/{sleep_id}", response_model=SleepResponse)
@@ -162,33 +183,23 @@ def update_sleep(
     Raises:
         HTTPException: 404 if sleep record not found, 403 if not authorized
     """
-    # First check if sleep record exists
-    sleep = db.query(SleepRecord).filter(SleepRecord.id == sleep_id).first()
-
-    if not sleep:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Sleep record with id {sleep_id} not found",
-        )
-
-    # Verify sleep record's day belongs to current user
-    if sleep.day.user_id != current_user.id:
+    # Update sleep record with only the fields that are provided
+    update_data = {field: getattr(sleep_data, field) for field in sleep_data.model_fields_set}
+    updated_sleep = SleepService.update_sleep(db, sleep_id, current_user.id, **update_data)
+
+    if updated_sleep is None:
+        # The UPDATE matched nothing: tell a missing sleep record from a foreign one
+        if not SleepService.sleep_exists(db, sleep_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Sleep record with id {sleep_id} not found",
+            )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to update this sleep record",
         )
 
-    # Update sleep record with only the fields that are provided
-    update_data = sleep_data.model_dump(exclude_unset=True)
-
-    try:
-        updated_sleep = SleepService.update_sleep(db, sleep_id, **update_data)
-        return updated_sleep
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
+    return updated_sleep
 
 
 @router.delete("/sleep/{sleep_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -210,29 +221,19 @@ def delete_sleep(
     Raises:
         HTTPException: 404 if sleep record not found, 403 if not authorized
     """
-    # First check if sleep record exists
-    sleep = db.query(SleepRecord).filter(SleepRecord.id == sleep_id).first()
-
-    if not sleep:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Sleep record with id {sleep_id} not found",
-        )
-
-    # Verify sleep record's day belongs to current user
-    if sleep.day.user_id != current_user.id:
+    # Delete sleep record only if its day belongs to current user
+    deleted = SleepService.delete_sleep(db, sleep_id, current_user.id)
+
+    if not deleted:
+        # The DELETE matched nothing: tell a missing sleep record from a foreign one
+        if not SleepService.sleep_exists(db, sleep_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Sleep record with id {sleep_id} not found",
+            )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to delete this sleep record",
         )
 
-    # Delete sleep record
-    success = SleepService.delete_sleep(db, sleep_id)
-
-    if not success:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Sleep record with id {sleep_id} not found",
-        )
-
     return None
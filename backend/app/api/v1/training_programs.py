@@ -1,30 +1,69 @@
 """Training program API endpoints."""
 
+import asyncio
 import logging
-from typing import AsyncIterator
-
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
-
+import uuid
+from typing import AsyncIterator, List, Optional
+
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, status
+from fastapi.responses import Response, StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import Text, bindparam, cast, func, select, update
+from sqlalchemy.orm import Session, load_only
+
+from app.core.cache import (
+    TRAINING_PROGRAM_CACHE_TTL,
+    cache_get,
+    cache_set,
+    invalidate_training_programs,
+    training_program_cache_key,
+    training_programs_cache_key,
+)
 from app.core.dependencies import get_current_user, get_db
+from app.core.etag import json_response_with_etag
+from app.core.pubsub import subscription, training_program_job_channel, wait_for_message
+from app.core.sse import SSE_DONE, SSE_HEADERS, SSE_PADDING, coalesce_chunks, sse_event
+from app.core.task_queue import enqueue_job
 from app.models.training_program import TrainingProgram
 from app.models.user import User
 from app.schemas.training_program import (
     TrainingProgramCreateResponse,
     TrainingProgramGenerateRequest,
+    TrainingProgramJobResponse,
+    TrainingProgramListItem,
     TrainingProgramListResponse,
     TrainingProgramResponse,
 )
 from app.services.training_program_service import TrainingProgramService
+from app.worker import generate_training_program as run_generation_job
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Converts a whole page of ORM rows to list items in one pydantic-core call
+_PROGRAM_LIST_ADAPTER = TypeAdapter(List[TrainingProgramListItem])
+
+# JSON columns are read as their stored text and embedded in the response
+# as-is, so the multi-KB program_data is never decoded and re-encoded
+_RAW_JSON_FIELDS = {"equipment", "program_data", "summary"}
+_PROGRAM_DETAIL_COLUMNS = [
+    cast(TrainingProgram.__table__.c[field], Text).label(field)
+    if field in _RAW_JSON_FIELDS
+    else TrainingProgram.__table__.c[field]
+    for field in TrainingProgramResponse.model_fields
+]
+# Built once with bound parameters so each call reuses the statement and
+# its cached compiled form
+_OWNED_PROGRAM_DETAIL = select(*_PROGRAM_DETAIL_COLUMNS).where(
+    TrainingProgram.id == bindparam("program_id"),
+    TrainingProgram.user_id == bindparam("user_id"),
+)
+
 
 @router.post("/generate", response_model=TrainingProgramCreateResponse)
-async def generate_training_program(
+def generate_training_program(
     request: TrainingProgramGenerateRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -63,23 +102,10 @@ async def generate_training_program(
             )
 
         # Save to database
-        program = TrainingProgram(
-            user_id=current_user.id,
-            name=request.name or f"{request.goal.replace('_', ' ').title()} Program",
-            description=request.description,
-            goal=request.goal,
-            experience_level=request.experience_level,
-            days_per_week=request.days_per_week,
-            equipment=request.equipment,
-            program_data=result.get("program", {}),
-            summary=result.get("summary", {}),
-            is_active=1,
+        program = TrainingProgramService.save_program(
+            db, current_user.id, request.model_dump(), result
         )
 
-        db.add(program)
-        db.commit()
-        db.refresh(program)
-
         logger.info(f"Training program created successfully: ID {program.id}")
 
         return TrainingProgramCreateResponse(
@@ -96,34 +122,209 @@ async def generate_training_program(
         )
 
 
+@router.post(
+    "/generate/jobs",
+    response_model=TrainingProgramJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def start_training_program_generation(
+    request: TrainingProgramGenerateRequest,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user),
+):
+    """Start generating a 12-week training program in the background.
+
+    Returns immediately with a job ID; follow the job through
+    GET /training-programs/jobs/{job_id}.
+
+    Args:
+        request: Training program generation request
+        background_tasks: FastAPI background tasks
+        current_user: Current authenticated user
+
+    Returns:
+        TrainingProgramJobResponse with the pending job
+
+    Raises:
+        HTTPException: 503 if the job state cannot be recorded
+    """
+    job_id = uuid.uuid4().hex
+    job_args = {
+        "job_id": job_id,
+        "user_id": current_user.id,
+        "params": request.model_dump(),
+    }
+
+    # Record the job before it can finish, then hand it to the worker,
+    # generating in-process only if the queue is unavailable. Without a
+    # recorded state the job could never be followed, so it is not started.
+    recorded = await asyncio.to_thread(
+        TrainingProgramService.set_job_state, job_id, current_user.id, "pending"
+    )
+    if not recorded:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Generation jobs are temporarily unavailable, please retry",
+        )
+    if not await enqueue_job("generate_training_program", **job_args):
+        background_tasks.add_task(run_generation_job, **job_args)
+
+    logger.info(f"Training program generation job {job_id} started for user {current_user.id}")
+
+    return TrainingProgramJobResponse(job_id=job_id, status="pending")
+
+
+def _get_job_status(job_id: str, user_id: int) -> TrainingProgramJobResponse:
+    """Build the status of a generation job started by the user.
+
+    Args:
+        job_id: Generation job ID
+        user_id: ID of the user who must have started the job
+
+    Returns:
+        TrainingProgramJobResponse
+
+    Raises:
+        HTTPException: 404 if the job is unknown, expired or another user's
+    """
+    state = TrainingProgramService.get_job_state(job_id)
+
+    if state is None or state["user_id"] != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Generation job not found"
+        )
+
+    return TrainingProgramJobResponse(
+        job_id=job_id,
+        status=state["status"],
+        program_id=state.get("program_id"),
+        error=state.get("error"),
+    )
+
+
+@router.get("/jobs/{job_id}", response_model=TrainingProgramJobResponse)
+async def get_training_program_job(
+    job_id: str,
+    timeout: float = Query(0.0, ge=0, le=60, description="Maximum seconds to wait while pending"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Get the status of a training program generation job.
+
+    With a timeout the request long-polls: it returns as soon as the job
+    finishes, or the pending status once the timeout passes.
+
+    Args:
+        job_id: Generation job ID
+        timeout: Maximum seconds to wait while the job is pending (default: 0)
+        db: Database session (only used to authenticate)
+        current_user: Current authenticated user
+
+    Returns:
+        TrainingProgramJobResponse with the program ID once completed
+
+    Raises:
+        HTTPException: 404 if job not found
+    """
+    user_id = current_user.id
+    # Job state lives in Redis; don't hold a DB connection while waiting
+    await asyncio.to_thread(db.close)
+
+    job = await asyncio.to_thread(_get_job_status, job_id, user_id)
+    if job.status != "pending" or timeout == 0:
+        return job
+
+    # Re-read after subscribing so a result published in between isn't missed
+    async with subscription(training_program_job_channel(job_id)) as pubsub:
+        job = await asyncio.to_thread(_get_job_status, job_id, user_id)
+
+        if job.status == "pending" and pubsub is not None:
+            if await wait_for_message(pubsub, timeout) is not None:
+                job = await asyncio.to_thread(_get_job_status, job_id, user_id)
+
+    return job
+
+
 @router.get("/", response_model=TrainingProgramListResponse)
-async def get_training_programs(
+def get_training_programs(
     active_only: bool = True,
+    limit: Optional[int] = Query(None, ge=1, le=100, description="Page size (default: all programs)"),
+    offset: int = Query(0, ge=0, description="Number of programs to skip"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get all training programs for current user.
 
+    Without ``limit`` every program is returned. With ``limit`` only that
+    page is loaded and ``total`` is counted in SQL.
+
     Args:
         active_only: Only return active programs (default True)
+        limit: Maximum number of programs to return
+        offset: Number of programs to skip
         db: Database session
         current_user: Current authenticated user
 
     Returns:
-        TrainingProgramListResponse with list of programs
+        TrainingProgramListResponse with list of programs (program_data and
+        summary are only returned by the detail endpoint) and the number of
+        matching programs
     """
     try:
-        query = db.query(TrainingProgram).filter(TrainingProgram.user_id == current_user.id)
-
+        # Only the full list is cached; pages go to the database
+        paginated = limit is not None or offset > 0
+        cache_key = training_programs_cache_key(current_user.id, active_only)
+        if not paginated:
+            cached = cache_get(cache_key)
+            if cached is not None:
+                return Response(content=cached, media_type="application/json")
+
+        filters = [TrainingProgram.user_id == current_user.id]
         if active_only:
-            query = query.filter(TrainingProgram.is_active == 1)
-
-        programs = query.order_by(TrainingProgram.created_at.desc()).all()
-
-        return TrainingProgramListResponse(
-            programs=[TrainingProgramResponse.model_validate(p) for p in programs],
-            total=len(programs)
+            filters.append(TrainingProgram.is_active == 1)
+
+        # Skip the large program_data/summary JSON columns, the list view
+        # only needs program metadata
+        query = (
+            db.query(TrainingProgram)
+            .options(
+                load_only(
+                    TrainingProgram.id,
+                    TrainingProgram.user_id,
+                    TrainingProgram.name,
+                    TrainingProgram.description,
+                    TrainingProgram.goal,
+                    TrainingProgram.experience_level,
+                    TrainingProgram.days_per_week,
+                    TrainingProgram.equipment,
+                    TrainingProgram.is_active,
+                    TrainingProgram.created_at,
+                    TrainingProgram.updated_at,
+                )
+            )
+            .filter(*filters)
+            .order_by(TrainingProgram.created_at.desc())
+            .offset(offset)
+            .limit(limit)
         )
+        programs = query.all()
+
+        if paginated:
+            total = db.query(func.count(TrainingProgram.id)).filter(*filters).scalar()
+        else:
+            total = len(programs)
+
+        # Items are already validated by the adapter, so build the envelope
+        # without revalidating and serialize it directly
+        response = TrainingProgramListResponse.model_construct(
+            programs=_PROGRAM_LIST_ADAPTER.validate_python(programs, from_attributes=True),
+            total=total,
+        )
+        body = response.model_dump_json()
+        if not paginated:
+            cache_set(cache_key, body, TRAINING_PROGRAM_CACHE_TTL)
+        return Response(content=body, media_type="application/json")
 
     except Exception as e:
         logger.error(f"Error fetching training programs: {e}", exc_info=True)
@@ -134,15 +335,19 @@ async def get_training_programs(
 
 
 @router.get("/{program_id}", response_model=TrainingProgramResponse)
-async def get_training_program(
+def get_training_program(
     program_id: int,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get a specific training program by ID.
 
+    Responds 304 Not Modified when If-None-Match matches the current ETag.
+
     Args:
         program_id: Training program ID
+        request: Incoming request (for conditional GET headers)
         db: Database session
         current_user: Current authenticated user
 
@@ -153,9 +358,14 @@ async def get_training_program(
         HTTPException: 404 if program not found
     """
     try:
-        program = db.query(TrainingProgram).filter(
-            TrainingProgram.id == program_id,
-            TrainingProgram.user_id == current_user.id
+        # Serve the serialized program from cache when available
+        cache_key = training_program_cache_key(program_id, current_user.id)
+        cached = cache_get(cache_key)
+        if cached is not None:
+            return json_response_with_etag(request, cached)
+
+        program = db.execute(
+            _OWNED_PROGRAM_DETAIL, {"program_id": program_id, "user_id": current_user.id}
         ).first()
 
         if not program:
@@ -164,7 +374,12 @@ async def get_training_program(
                 detail="Training program not found"
             )
 
-        return TrainingProgramResponse.model_validate(program)
+        body = orjson.dumps({
+            field: orjson.Fragment(value) if field in _RAW_JSON_FIELDS and value is not None else value
+            for field, value in program._mapping.items()
+        }).decode()
+        cache_set(cache_key, body, TRAINING_PROGRAM_CACHE_TTL)
+        return json_response_with_etag(request, body)
 
     except HTTPException:
         raise
@@ -177,7 +392,7 @@ async def get_training_program(
 
 
 @router.delete("/{program_id}")
-async def delete_training_program(
+def delete_training_program(
     program_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -196,20 +411,27 @@ async def delete_training_program(
         HTTPException: 404 if program not found
     """
     try:
-        program = db.query(TrainingProgram).filter(
-            TrainingProgram.id == program_id,
-            TrainingProgram.user_id == current_user.id
-        ).first()
+        # Archive instead of delete; ownership is part of the UPDATE
+        stmt = (
+            update(TrainingProgram)
+            .where(
+                TrainingProgram.id == program_id,
+                TrainingProgram.user_id == current_user.id,
+            )
+            .values(is_active=0)
+            .returning(TrainingProgram.id)
+            .execution_options(synchronize_session=False)
+        )
+        archived = db.execute(stmt).first()
+        db.commit()
 
-        if not program:
+        if archived is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Training program not found"
             )
 
-        # Archive instead of delete
-        program.is_active = 0
-        db.commit()
+        invalidate_training_programs(current_user.id, program_id)
 
         return {"success": True, "message": "Training program archived successfully"}
 
@@ -242,32 +464,38 @@ async def stream_program_generation(
     try:
         logger.info(f"Streaming training program generation for user {current_user.id}")
 
+        # Load everything the prompt needs, then hand the connection back to
+        # the pool so it isn't held for the length of the LLM stream. Both
+        # block on the database, so they run off the event loop.
+        await asyncio.to_thread(db.refresh, current_user, attribute_names=["goals"])
+        await asyncio.to_thread(db.close)
+
         async def generate_stream() -> AsyncIterator[bytes]:
             """Generate SSE stream."""
+            # Padding comment first so buffering proxies start flushing
+            yield SSE_PADDING
             try:
-                async for chunk in TrainingProgramService.stream_program_generation(
-                    db=db,
-                    user=current_user,
-                    goal=request.goal,
-                    experience_level=request.experience_level,
-                    days_per_week=request.days_per_week,
-                    equipment=request.equipment,
+                # Send token bursts as one event instead of one per token
+                async for chunk in coalesce_chunks(
+                    TrainingProgramService.stream_program_generation(
+                        user=current_user,
+                        goal=request.goal,
+                        experience_level=request.experience_level,
+                        days_per_week=request.days_per_week,
+                        equipment=request.equipment,
+                    )
                 ):
-                    yield f"data: {chunk}\n\n".encode("utf-8")
+                    yield sse_event(chunk)
             except Exception as e:
                 logger.error(f"Error in program stream: {e}", exc_info=True)
-                yield f"data: [ERROR: {str(e)}]\n\n".encode("utf-8")
+                yield sse_event(f"[ERROR: {str(e)}]")
             finally:
-                yield "data: [DONE]\n\n".encode("utf-8")
+                yield SSE_DONE
 
         return StreamingResponse(
             generate_stream(),
             media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Accel-Buffering": "no",
-            }
+            headers=SSE_HEADERS,
         )
 
     except Exception as e:
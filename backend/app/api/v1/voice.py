@@ -1,12 +1,21 @@
 """Voice API endpoints for Speech-to-Text and Text-to-Speech."""
 
+import asyncio
+import hashlib
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+try:
+    # SIMD-accelerated drop-in for the stdlib module; MP3s run to hundreds of KB
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+from fastapi import APIRouter, Depends, File, Form, Header, HTTPException, UploadFile, status
 from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 
+from app.core.cache import TTS_CACHE_TTL, cache_get, cache_set, tts_cache_key
 from app.core.dependencies import get_current_user
 from app.models.user import User
 from app.services.voice_service import VoiceService
@@ -15,6 +24,17 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Headers for audio returned as a binary body. MP3 is already compressed,
+# so gzip is skipped rather than spending CPU and holding back stream chunks
+_AUDIO_HEADERS = {
+    "Content-Disposition": 'inline; filename="speech.mp3"',
+    "Content-Encoding": "identity",
+}
+
+# Same text, voice and speed always give the same audio, so clients may
+# keep it as long as the server-side cache does
+_TTS_CACHE_CONTROL = f"private, max-age={TTS_CACHE_TTL}"
+
 
 # ===== Request/Response Schemas =====
 
@@ -65,14 +85,13 @@ async def speech_to_text(
     try:
         logger.info(f"Speech-to-text request from user {current_user.id}")
 
-        # Read audio file
-        audio_data = await audio.read()
-
-        if len(audio_data) == 0:
+        # Check for an empty upload without reading the whole file
+        if not await audio.read(1):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Empty audio file"
             )
+        await audio.seek(0)
 
         # Get audio format from filename
         audio_format = "webm"
@@ -81,9 +100,11 @@ async def speech_to_text(
             if extension in ["mp3", "wav", "m4a", "webm", "ogg"]:
                 audio_format = extension
 
-        # Transcribe
-        result = VoiceService.speech_to_text(
-            audio_data=audio_data,
+        # Transcribe, streaming the spooled upload to the API from a worker
+        # thread (blocking API call)
+        result = await asyncio.to_thread(
+            VoiceService.speech_to_text,
+            audio_file=audio.file,
             audio_format=audio_format,
             language=language
         )
@@ -113,19 +134,115 @@ async def speech_to_text(
 
 # ===== Text-to-Speech Endpoints =====
 
+def _tts_request_hash(request: TTSRequest) -> str:
+    """Hash the fields that determine the synthesized audio.
+
+    Args:
+        request: TTS request
+
+    Returns:
+        Hex digest of voice, speed and text
+    """
+    return hashlib.sha256(
+        f"{request.voice}|{request.speed}|{request.text}".encode("utf-8")
+    ).hexdigest()
+
+
+def _synthesize_base64(request: TTSRequest, request_hash: str) -> str:
+    """Get base64-encoded speech for a request, calling the TTS API on a miss.
+
+    Blocking; call from a worker thread.
+
+    Args:
+        request: TTS request
+        request_hash: Digest from ``_tts_request_hash``
+
+    Returns:
+        Base64-encoded MP3 audio
+
+    Raises:
+        HTTPException: 500 if TTS fails
+    """
+    # First check if the same speech was already synthesized
+    cache_key = tts_cache_key(request_hash)
+    cached = cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    result = VoiceService.text_to_speech(
+        text=request.text,
+        voice=request.voice,
+        speed=request.speed
+    )
+
+    if not result["success"]:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=result.get("error", "TTS failed")
+        )
+
+    audio_base64 = base64.b64encode(result["audio_data"]).decode("ascii")
+    cache_set(cache_key, audio_base64, TTS_CACHE_TTL)
+    return audio_base64
+
+
+def _synthesize_audio(request: TTSRequest, request_hash: str) -> bytes:
+    """Get MP3 speech for a request, calling the TTS API on a miss.
+
+    Blocking; call from a worker thread.
+
+    Args:
+        request: TTS request
+        request_hash: Digest from ``_tts_request_hash``
+
+    Returns:
+        MP3 audio bytes
+
+    Raises:
+        HTTPException: 500 if TTS fails
+    """
+    return base64.b64decode(_synthesize_base64(request, request_hash))
+
+
+def _audio_response(audio: bytes, request_hash: str) -> Response:
+    """Build an audio/mpeg response for synthesized speech.
+
+    Args:
+        audio: MP3 audio bytes
+        request_hash: Digest from ``_tts_request_hash``, used as the ETag
+
+    Returns:
+        Binary audio response
+    """
+    return Response(
+        content=audio,
+        media_type="audio/mpeg",
+        headers={
+            **_AUDIO_HEADERS,
+            "ETag": f'"{request_hash}"',
+            "Cache-Control": _TTS_CACHE_CONTROL,
+        }
+    )
+
+
 @router.post("/text-to-speech", response_model=TTSResponse)
 async def text_to_speech(
     request: TTSRequest,
+    accept: Optional[str] = Header(default=None),
     current_user: User = Depends(get_current_user),
 ):
     """Convert text to speech audio.
 
+    Clients that send ``Accept: audio/mpeg`` get the MP3 bytes as the body
+    instead of a base64 string in JSON.
+
     Args:
         request: TTS request with text and voice options
+        accept: Accept header (for content negotiation)
         current_user: Current authenticated user
 
     Returns:
-        TTSResponse with base64-encoded audio
+        TTSResponse with base64-encoded audio, or audio/mpeg response
 
     Raises:
         HTTPException: 400 if text empty, 500 if TTS fails
@@ -139,27 +256,21 @@ async def text_to_speech(
                 detail="Text cannot be empty"
             )
 
-        # Generate speech
-        result = VoiceService.text_to_speech(
-            text=request.text,
-            voice=request.voice,
-            speed=request.speed
-        )
+        request_hash = _tts_request_hash(request)
 
-        if not result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=result.get("error", "TTS failed")
-            )
+        # Binary-capable clients skip base64 entirely
+        if accept and "audio/mpeg" in accept:
+            audio = await asyncio.to_thread(_synthesize_audio, request, request_hash)
+            return _audio_response(audio, request_hash)
 
-        # Encode audio as base64
-        import base64
-        audio_base64 = base64.b64encode(result["audio_data"]).decode("utf-8")
+        # Cache lookup, API call and base64 encoding are blocking (MP3s run
+        # to hundreds of KB), so run them off the event loop
+        audio_base64 = await asyncio.to_thread(_synthesize_base64, request, request_hash)
 
         return TTSResponse(
             success=True,
             audio_base64=audio_base64,
-            format=result["format"],
+            format="mp3",
             error=None
         )
 
@@ -211,12 +322,12 @@ async def text_to_speech_stream(
             except Exception as e:
                 logger.error(f"Error in TTS stream: {e}", exc_info=True)
 
+        # StreamingResponse iterates a sync generator in the threadpool, so
+        # the blocking TTS call doesn't hold up the event loop
         return StreamingResponse(
             generate_audio(),
             media_type="audio/mpeg",
-            headers={
-                "Content-Disposition": 'inline; filename="speech.mp3"'
-            }
+            headers=_AUDIO_HEADERS
         )
 
     except HTTPException:
@@ -255,27 +366,12 @@ async def text_to_speech_audio(
                 detail="Text cannot be empty"
             )
 
-        # Generate speech
-        result = VoiceService.text_to_speech(
-            text=request.text,
-            voice=request.voice,
-            speed=request.speed
-        )
-
-        if not result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=result.get("error", "TTS failed")
-            )
+        # Generate speech from cache or the API (blocking, run off the event loop)
+        request_hash = _tts_request_hash(request)
+        audio = await asyncio.to_thread(_synthesize_audio, request, request_hash)
 
         # Return audio directly
-        return Response(
-            content=result["audio_data"],
-            media_type="audio/mpeg",
-            headers={
-                "Content-Disposition": 'inline; filename="speech.mp3"'
-            }
-        )
+        return _audio_response(audio, request_hash)
 
     except HTTPException:
         raise
@@ -1,26 +1,35 @@
 """Water intake endpoints."""
 
+import asyncio
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
-from app.core.dependencies import get_current_user, get_db
-from app.models.day import Day
+from app.core.concurrency import ConcurrencyLimiter
+from app.core.dependencies import (
+    check_day_access,
+    get_current_user,
+    get_db,
+    raise_day_not_accessible,
+)
 from app.models.user import User
-from app.models.water_intake import WaterIntake
 from app.schemas.water import WaterCreate, WaterResponse, WaterUpdate
 from app.services.water_service import WaterService
 
 router = APIRouter()
 
+# Water logging comes in bursts (reminder notifications); keep a burst from
+# taking every worker thread
+_WATER_WRITE_LIMIT = ConcurrencyLimiter("water intake write", 32)
+
 
 @router.post(
     "/days/{day_id}/water-intakes",
     response_model=WaterResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def create_water_intake(
+async def create_water_intake(
     day_id: int,
     water_data: WaterCreate,
     db: Session = Depends(get_db),
@@ -38,28 +47,20 @@ def create_water_intake(
         Newly created water intake entry
 
     Raises:
-        HTTPException: 404 if day not found, 403 if not authorized
+        HTTPException: 404 if day not found, 403 if not authorized,
+            503 if too many water intakes are being written at once
     """
-    # Check if day exists
-    day = db.query(Day).filter(Day.id == day_id).first()
-
-    if not day:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Day with id {day_id} not found",
-        )
+    # Create water intake; the day ownership check is part of the insert
+    water_intake = await _WATER_WRITE_LIMIT.run(
+        WaterService.create_water_intake, db, day_id, current_user.id, water_data.model_dump()
+    )
 
-    # Verify day belongs to current user
-    if day.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to add water intake to this day",
+    if not water_intake:
+        # Nothing was inserted, check whether the day is missing or foreign
+        await asyncio.to_thread(
+            raise_day_not_accessible, db, day_id, "Not authorized to add water intake to this day"
         )
 
-    # Create water intake
-    water_intake = WaterService.create_water_intake(
-        db, day_id, water_data.model_dump()
-    )
     return water_intake
 
 
@@ -82,24 +83,13 @@ def get_water_intakes_by_day(
     Raises:
         HTTPException: 404 if day not found, 403 if not authorized
     """
-    # Check if day exists
-    day = db.query(Day).filter(Day.id == day_id).first()
-
-    if not day:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Day with id {day_id} not found",
-        )
+    # Get water intakes; the day ownership check is part of the query
+    water_intakes = WaterService.get_water_intakes_by_day(db, day_id, current_user.id)
 
-    # Verify day belongs to current user
-    if day.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this day's water intakes",
-        )
+    if not water_intakes:
+        # Empty result, check whether the day is missing or foreign
+        check_day_access(db, day_id, current_user.id, "Not authorized to access this day's water intakes")
 
-    # Get water intakes
-    water_intakes = WaterService.get_water_intakes_by_day(db, day_id)
     return water_intakes
 
 
@@ -162,35 +152,25 @@ def update_water_intake(
     Raises:
         HTTPException: 404 if water intake not found, 403 if not authorized
     """
-    # First check if water intake exists
-    water_intake = db.query(WaterIntake).filter(WaterIntake.id == water_id).first()
-
-    if not water_intake:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Water intake with id {water_id} not found",
-        )
+    # Update water intake with only the fields that are provided
+    update_data = water_data.model_dump(exclude_unset=True)
+    updated_water_intake = WaterService.update_water_intake(
+        db, water_id, current_user.id, **update_data
+    )
 
-    # Verify water intake's day belongs to current user
-    if water_intake.day.user_id != current_user.id:
+    if updated_water_intake is None:
+        # The UPDATE matched nothing: tell a missing water intake from a foreign one
+        if not WaterService.water_intake_exists(db, water_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Water intake with id {water_id} not found",
+            )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to update this water intake",
         )
 
-    # Update water intake with only the fields that are provided
-    update_data = water_data.model_dump(exclude_unset=True)
-
-    try:
-        updated_water_intake = WaterService.update_water_intake(
-            db, water_id, **update_data
-        )
-        return updated_water_intake
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
+    return updated_water_intake
 
 
 @router.delete("/water-intakes/{water_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -212,29 +192,19 @@ def delete_water_intake(
     Raises:
         HTTPException: 404 if water intake not found, 403 if not authorized
     """
-    # First check if water intake exists
-    water_intake = db.query(WaterIntake).filter(WaterIntake.id == water_id).first()
-
-    if not water_intake:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Water intake with id {water_id} not found",
-        )
-
-    # Verify water intake's day belongs to current user
-    if water_intake.day.user_id != current_user.id:
+    # Delete water intake only if its day belongs to current user
+    deleted = WaterService.delete_water_intake(db, water_id, current_user.id)
+
+    if not deleted:
+        # The DELETE matched nothing: tell a missing water intake from a foreign one
+        if not WaterService.water_intake_exists(db, water_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Water intake with id {water_id} not found",
+            )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to delete this water intake",
         )
 
-    # Delete water intake
-    success = WaterService.delete_water_intake(db, water_id)
-
-    if not success:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Water intake with id {water_id} not found",
-        )
-
     return None
@@ -1,9 +1,11 @@
 """Application configuration."""
 
 import secrets
+from functools import lru_cache
 from typing import List, Optional
+from urllib.parse import quote
 
-from pydantic import PostgresDsn, field_validator
+from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -47,24 +49,40 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str
     POSTGRES_DB: str = "fitcoach"
     POSTGRES_PORT: int = 5432
-    DATABASE_URL: Optional[PostgresDsn] = None
+    DATABASE_URL: Optional[str] = None
 
     @field_validator("DATABASE_URL", mode="before")
     @classmethod
     def assemble_db_connection(cls, v: Optional[str], info) -> str:
-        """Assemble database URL from components."""
+        """Assemble database URL from components.
+
+        The URL is kept as a plain string, built once here, so it is passed
+        to SQLAlchemy as-is without a pydantic URL object in between.
+        """
         if isinstance(v, str):
             return v
-        return str(
-            PostgresDsn.build(
-                scheme="postgresql",
-                username=info.data.get("POSTGRES_USER"),
-                password=info.data.get("POSTGRES_PASSWORD"),
-                host=info.data.get("POSTGRES_SERVER"),
-                port=info.data.get("POSTGRES_PORT"),
-                path=f"{info.data.get('POSTGRES_DB') or ''}",
-            )
-        )
+        user = quote(info.data.get("POSTGRES_USER") or "", safe="")
+        password = quote(info.data.get("POSTGRES_PASSWORD") or "", safe="")
+        host = info.data.get("POSTGRES_SERVER")
+        port = info.data.get("POSTGRES_PORT")
+        db = info.data.get("POSTGRES_DB") or ""
+        return f"postgresql://{user}:{password}@{host}:{port}/{db}"
+
+    # Database connection pool (per API process)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_TIMEOUT: int = 30  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 280  # Under typical 300s+ idle timeouts of proxies/load balancers
+    # Pinging on every checkout costs a round trip per request; idle pooled
+    # connections are pinged in the background every DB_POOL_KEEPALIVE_INTERVAL
+    # seconds instead (0 disables)
+    DB_POOL_PRE_PING: bool = False
+    DB_POOL_KEEPALIVE_INTERVAL: int = 240
+
+    # Threads available to sync endpoints (Starlette/AnyIO default is 40).
+    # Keep in line with the database pool (DB_POOL_SIZE + DB_MAX_OVERFLOW) so
+    # requests queue on DB connections rather than on free threads.
+    THREADPOOL_SIZE: int = 60
 
     # Redis
     REDIS_HOST: str = "localhost"
@@ -127,4 +145,14 @@ class Settings(BaseSettings):
     SENTRY_ENVIRONMENT: Optional[str] = None  # Override ENVIRONMENT for Sentry
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get application settings, reading the environment and .env only once.
+
+    Returns:
+        Shared Settings instance
+    """
+    return Settings()
+
+
+settings = get_settings()
@@ -0,0 +1,241 @@
+"""Redis response cache for FitCoach API.
+
+Read endpoints whose payload is expensive to load and serialize (e.g. meal
+plans with large AI-generated JSON) store their serialized response in Redis
+and serve it directly on later requests.
+
+All operations fail open: if Redis is unavailable the request falls through
+to the database, the same way the LLM rate limiter behaves.
+"""
+
+import logging
+from typing import Optional
+
+import redis
+from redis.exceptions import RedisError
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Cache TTLs in seconds
+MEAL_PLAN_CACHE_TTL = 600  # Meal plans are immutable after generation
+MEAL_CACHE_TTL = 300
+VISION_CACHE_TTL = 86400  # Recognition results are keyed by photo content
+NOTIFICATIONS_CACHE_TTL = 30  # Polled on every page focus
+TRAINING_PROGRAM_CACHE_TTL = 600  # Training programs are immutable after generation
+TRAINING_PROGRAM_JOB_TTL = 3600  # Clients check back on generation jobs for a while
+TTS_CACHE_TTL = 604800  # Synthesized speech is keyed by request content
+USER_CACHE_TTL = 30  # Looked up on every authenticated request
+
+# Redis key prefixes
+MEAL_PLAN_KEY_PREFIX = "meal_plan:"
+MEAL_KEY_PREFIX = "meal:"
+VISION_KEY_PREFIX = "vision_results:"
+NOTIFICATIONS_KEY_PREFIX = "notifications:"
+TRAINING_PROGRAM_KEY_PREFIX = "training_program:"
+TRAINING_PROGRAMS_KEY_PREFIX = "training_programs:"
+TRAINING_PROGRAM_JOB_KEY_PREFIX = "training_program_job:"
+TTS_KEY_PREFIX = "tts:"
+USER_KEY_PREFIX = "user:"
+
+# Connections are opened lazily on first use; short timeouts keep a slow or
+# unreachable Redis from adding noticeable latency to cached endpoints
+_cache_pool = redis.ConnectionPool(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    db=settings.REDIS_DB,
+    decode_responses=True,
+    socket_timeout=0.5,
+    socket_connect_timeout=0.5,
+)
+_cache_client = redis.Redis(connection_pool=_cache_pool)
+
+
+def meal_plan_cache_key(plan_id: int, user_id: int) -> str:
+    """Build cache key for a meal plan detail response.
+
+    Args:
+        plan_id: Meal plan ID
+        user_id: Owner user ID
+
+    Returns:
+        Redis key string
+    """
+    return f"{MEAL_PLAN_KEY_PREFIX}{plan_id}:{user_id}"
+
+
+def meal_cache_key(meal_id: int, user_id: int) -> str:
+    """Build cache key for a meal detail response.
+
+    Args:
+        meal_id: Meal ID
+        user_id: Owner user ID
+
+    Returns:
+        Redis key string
+    """
+    return f"{MEAL_KEY_PREFIX}{meal_id}:{user_id}"
+
+
+def vision_cache_key(photo_hash: str) -> str:
+    """Build cache key for Vision Agent results of a photo.
+
+    Args:
+        photo_hash: Hex digest of the photo content
+
+    Returns:
+        Redis key string
+    """
+    return f"{VISION_KEY_PREFIX}{photo_hash}"
+
+
+def notifications_cache_key(user_id: int, unread_only: bool) -> str:
+    """Build cache key for a user's notification list response.
+
+    Args:
+        user_id: Owner user ID
+        unread_only: Whether the list is filtered to unread notifications
+
+    Returns:
+        Redis key string
+    """
+    return f"{NOTIFICATIONS_KEY_PREFIX}{user_id}:{'unread' if unread_only else 'all'}"
+
+
+def invalidate_notifications(user_id: int) -> None:
+    """Drop all cached notification lists of a user.
+
+    Args:
+        user_id: Owner user ID
+    """
+    cache_delete(
+        notifications_cache_key(user_id, unread_only=False),
+        notifications_cache_key(user_id, unread_only=True),
+    )
+
+
+def training_program_cache_key(program_id: int, user_id: int) -> str:
+    """Build cache key for a training program detail response.
+
+    Args:
+        program_id: Training program ID
+        user_id: Owner user ID
+
+    Returns:
+        Redis key string
+    """
+    return f"{TRAINING_PROGRAM_KEY_PREFIX}{program_id}:{user_id}"
+
+
+def training_programs_cache_key(user_id: int, active_only: bool) -> str:
+    """Build cache key for a user's training program list response.
+
+    Args:
+        user_id: Owner user ID
+        active_only: Whether the list is filtered to active programs
+
+    Returns:
+        Redis key string
+    """
+    return f"{TRAINING_PROGRAMS_KEY_PREFIX}{user_id}:{'active' if active_only else 'all'}"
+
+
+def invalidate_training_programs(user_id: int, *program_ids: int) -> None:
+    """Drop a user's cached training program lists and the given details.
+
+    Args:
+        user_id: Owner user ID
+        *program_ids: Training program IDs whose detail responses changed
+    """
+    cache_delete(
+        training_programs_cache_key(user_id, active_only=False),
+        training_programs_cache_key(user_id, active_only=True),
+        *(training_program_cache_key(program_id, user_id) for program_id in program_ids),
+    )
+
+
+def training_program_job_key(job_id: str) -> str:
+    """Build key for the state of a training program generation job.
+
+    Args:
+        job_id: Generation job ID
+
+    Returns:
+        Redis key string
+    """
+    return f"{TRAINING_PROGRAM_JOB_KEY_PREFIX}{job_id}"
+
+
+def tts_cache_key(request_hash: str) -> str:
+    """Build cache key for synthesized speech.
+
+    Args:
+        request_hash: Hex digest of the TTS voice, speed and text
+
+    Returns:
+        Redis key string
+    """
+    return f"{TTS_KEY_PREFIX}{request_hash}"
+
+
+def user_cache_key(user_id: int) -> str:
+    """Build cache key for an authenticated user's column values.
+
+    Args:
+        user_id: User ID
+
+    Returns:
+        Redis key string
+    """
+    return f"{USER_KEY_PREFIX}{user_id}"
+
+
+def cache_get(key: str) -> Optional[str]:
+    """Get a cached value.
+
+    Args:
+        key: Redis key
+
+    Returns:
+        Cached string or None on miss or Redis error
+    """
+    try:
+        return _cache_client.get(key)
+    except RedisError as e:
+        logger.warning(f"Cache read failed for {key}: {e}")
+        return None
+
+
+def cache_set(key: str, value: str, ttl: int) -> bool:
+    """Store a value with expiry.
+
+    Args:
+        key: Redis key
+        value: Serialized value
+        ttl: Time-to-live in seconds
+
+    Returns:
+        True if the value was stored, False if Redis was unavailable
+    """
+    try:
+        _cache_client.setex(key, ttl, value)
+    except RedisError as e:
+        logger.warning(f"Cache write failed for {key}: {e}")
+        return False
+    return True
+
+
+def cache_delete(*keys: str) -> None:
+    """Invalidate cached values.
+
+    Args:
+        *keys: Redis keys to delete
+    """
+    if not keys:
+        return
+
+    try:
+        _cache_client.delete(*keys)
+    except RedisError as e:
+        logger.warning(f"Cache invalidation failed for {keys}: {e}")
@@ -0,0 +1,72 @@
+"""Per-endpoint concurrency limits for FitCoach API.
+
+Sync endpoints share one worker threadpool (sized by THREADPOOL_SIZE). A
+burst on a single write endpoint can take every thread and stall unrelated
+requests, so such endpoints run their blocking work through a limiter that
+admits a fixed number of calls at once and sheds the rest with 503.
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, TypeVar
+
+from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Seconds clients are asked to wait before retrying a shed request
+RETRY_AFTER_SECONDS = 1
+
+
+class ConcurrencyLimiter:
+    """Bound how many calls of one endpoint occupy worker threads at once.
+
+    Example:
+        ```python
+        _WATER_WRITE_LIMIT = ConcurrencyLimiter("water intake write", 32)
+
+        water_intake = await _WATER_WRITE_LIMIT.run(
+            WaterService.create_water_intake, db, day_id, user_id, data
+        )
+        ```
+    """
+
+    def __init__(self, name: str, limit: int):
+        """Initialize concurrency limiter.
+
+        Args:
+            name: Human-readable name used in logs and error messages
+            limit: Maximum number of calls running at once
+        """
+        self.name = name
+        self.limit = limit
+        self._semaphore = asyncio.Semaphore(limit)
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking function in the threadpool if a slot is free.
+
+        Args:
+            func: Sync function to run
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Return value of func
+
+        Raises:
+            HTTPException: 503 if all slots are taken
+        """
+        # Shed instead of queueing, so waiting requests don't pile up
+        if self._semaphore.locked():
+            logger.warning(f"Concurrency limit of {self.limit} reached for {self.name}")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=f"Too many concurrent {self.name} requests, please retry",
+                headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+            )
+
+        async with self._semaphore:
+            return await run_in_threadpool(func, *args, **kwargs)
@@ -11,8 +11,9 @@ Key features:
 - SameSite cookie configuration for additional protection
 """
 
+import hmac
 import logging
-import secrets
+import os
 from typing import Callable, Optional
 
 from fastapi import HTTPException, Request, Response, status
@@ -22,6 +23,37 @@ from starlette.middleware.base import BaseHTTPMiddleware
 logger = logging.getLogger(__name__)
 
 
+def _error_body(detail: str) -> bytes:
+    """Serialize a CSRF error detail as a JSON response body.
+
+    Args:
+        detail: Error message
+
+    Returns:
+        Encoded ``{"detail": ...}`` body
+    """
+    return JSONResponse(content={"detail": detail}).body
+
+
+def _forbidden(body: bytes) -> Response:
+    """Build a 403 response from a pre-serialized JSON body.
+
+    A new response is built per rejection since outer middleware sets
+    per-request headers on it.
+
+    Args:
+        body: Encoded JSON body
+
+    Returns:
+        403 JSON response
+    """
+    return Response(
+        content=body,
+        status_code=status.HTTP_403_FORBIDDEN,
+        media_type="application/json",
+    )
+
+
 class CSRFProtection(BaseHTTPMiddleware):
     """CSRF protection middleware.
 
@@ -35,18 +67,35 @@ class CSRFProtection(BaseHTTPMiddleware):
         safe_methods: HTTP methods that don't require CSRF protection
     """
 
+    # Per-instance configuration lives in slots rather than the instance dict
+    __slots__ = (
+        "secret_key",
+        "cookie_name",
+        "header_name",
+        "cookie_samesite",
+        "cookie_secure",
+        "_exempt_exact",
+        "_exempt_prefixes",
+        "_missing_cookie_body",
+        "_missing_header_body",
+        "_mismatch_body",
+    )
+
     # Safe methods that don't modify state
-    SAFE_METHODS = {"GET", "HEAD", "OPTIONS", "TRACE"}
+    SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "TRACE"})
+
+    # Starlette stores header names lowercased, so this skips normalization
+    AUTHORIZATION_HEADER = "authorization"
 
     # Paths that are exempt from CSRF protection (API with Bearer tokens)
-    EXEMPT_PATHS = {
+    EXEMPT_PATHS = frozenset({
         "/api/v1/auth/login",
         "/api/v1/auth/register",
         "/api/v1/auth/refresh",
         "/docs",
         "/openapi.json",
         "/health",
-    }
+    })
 
     def __init__(
         self,
@@ -73,6 +122,17 @@ class CSRFProtection(BaseHTTPMiddleware):
         self.header_name = header_name
         self.cookie_samesite = cookie_samesite
         self.cookie_secure = cookie_secure
+        # Prefixes are matched by a single str.startswith call per request
+        self._exempt_exact = frozenset(self.EXEMPT_PATHS)
+        self._exempt_prefixes = tuple(f"{exempt_path}/" for exempt_path in self.EXEMPT_PATHS)
+        # Rejection bodies are static, so they are serialized once
+        self._missing_cookie_body = _error_body(
+            "CSRF token missing in cookies. Please obtain a new token."
+        )
+        self._missing_header_body = _error_body(
+            f"CSRF token missing in {self.header_name} header."
+        )
+        self._mismatch_body = _error_body("CSRF token validation failed. Token mismatch.")
 
     def generate_csrf_token(self) -> str:
         """Generate a cryptographically secure CSRF token.
@@ -80,7 +140,8 @@ class CSRFProtection(BaseHTTPMiddleware):
         Returns:
             32-byte random token in hexadecimal format
         """
-        return secrets.token_hex(32)
+        # Same CSPRNG as secrets.token_hex, without its Python-level wrappers
+        return os.urandom(32).hex()
 
     def _is_exempt_path(self, path: str) -> bool:
         """Check if path is exempt from CSRF protection.
@@ -91,16 +152,8 @@ class CSRFProtection(BaseHTTPMiddleware):
         Returns:
             True if path is exempt, False otherwise
         """
-        # Check exact matches
-        if path in self.EXEMPT_PATHS:
-            return True
-
-        # Check prefix matches (e.g., /docs/, /api/v1/auth/)
-        for exempt_path in self.EXEMPT_PATHS:
-            if path.startswith(exempt_path + "/"):
-                return True
-
-        return False
+        # Check exact matches, then prefix matches (e.g., /docs/oauth2-redirect)
+        return path in self._exempt_exact or path.startswith(self._exempt_prefixes)
 
     def _has_bearer_token(self, request: Request) -> bool:
         """Check if request has Bearer token authentication.
@@ -111,8 +164,7 @@ class CSRFProtection(BaseHTTPMiddleware):
         Returns:
             True if Bearer token is present, False otherwise
         """
-        auth_header = request.headers.get("Authorization", "")
-        return auth_header.startswith("Bearer ")
+        return request.headers.get(self.AUTHORIZATION_HEADER, "").startswith("Bearer ")
 
     async def dispatch(
         self, request: Request, call_next: Callable
@@ -129,19 +181,26 @@ class CSRFProtection(BaseHTTPMiddleware):
         Raises:
             HTTPException: 403 if CSRF validation fails
         """
+        method = request.method
+
         # Skip CSRF for safe methods
-        if request.method in self.SAFE_METHODS:
+        if method in self.SAFE_METHODS:
             response = await call_next(request)
             return response
 
-        # Skip CSRF for exempt paths
-        if self._is_exempt_path(request.url.path):
+        # Skip CSRF for Bearer token authenticated requests
+        # (JWT Bearer tokens are not vulnerable to CSRF). Checked before the
+        # path since nearly all API writes carry a token.
+        if self._has_bearer_token(request):
             response = await call_next(request)
             return response
 
-        # Skip CSRF for Bearer token authenticated requests
-        # (JWT Bearer tokens are not vulnerable to CSRF)
-        if self._has_bearer_token(request):
+        # request.url is built on first access, so only get the path once the
+        # cheaper checks above have passed
+        path = request.url.path
+
+        # Skip CSRF for exempt paths
+        if self._is_exempt_path(path):
             response = await call_next(request)
             return response
 
@@ -152,39 +211,29 @@ class CSRFProtection(BaseHTTPMiddleware):
         if not cookie_token:
             logger.warning(
                 f"CSRF validation failed: No CSRF cookie present "
-                f"for {request.method} {request.url.path}"
-            )
-            return JSONResponse(
-                status_code=status.HTTP_403_FORBIDDEN,
-                content={
-                    "detail": "CSRF token missing in cookies. Please obtain a new token."
-                },
+                f"for {method} {path}"
             )
+            return _forbidden(self._missing_cookie_body)
 
         if not header_token:
             logger.warning(
                 f"CSRF validation failed: No CSRF header present "
-                f"for {request.method} {request.url.path}"
-            )
-            return JSONResponse(
-                status_code=status.HTTP_403_FORBIDDEN,
-                content={
-                    "detail": f"CSRF token missing in {self.header_name} header."
-                },
+                f"for {method} {path}"
             )
-
-        # Validate token match
-        if not secrets.compare_digest(cookie_token, header_token):
+            return _forbidden(self._missing_header_body)
+
+        # Validate token match. Unequal lengths are rejected up front (token
+        # length is public); equal-length tokens are compared in constant
+        # time as bytes, which also copes with non-ASCII input that
+        # compare_digest refuses on str
+        if len(cookie_token) != len(header_token) or not hmac.compare_digest(
+            cookie_token.encode("utf-8"), header_token.encode("utf-8")
+        ):
             logger.warning(
                 f"CSRF validation failed: Token mismatch "
-                f"for {request.method} {request.url.path}"
-            )
-            return JSONResponse(
-                status_code=status.HTTP_403_FORBIDDEN,
-                content={
-                    "detail": "CSRF token validation failed. Token mismatch."
-                },
+                f"for {method} {path}"
             )
+            return _forbidden(self._mismatch_body)
 
         # Token is valid, process request
         response = await call_next(request)
@@ -241,4 +290,4 @@ def generate_csrf_token() -> str:
     Returns:
         32-byte random token in hexadecimal format
     """
-    return secrets.token_hex(32)
+    return os.urandom(32).hex()
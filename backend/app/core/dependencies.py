@@ -1,38 +1,109 @@
 """FastAPI dependencies."""
 
-from typing import Generator
+from datetime import datetime
+from decimal import Decimal
+from typing import NoReturn, Optional
 
+import orjson
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import DateTime, Numeric, event
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
 
-from app.core.database import SessionLocal
-from app.core.security import decode_token
+from app.core.cache import USER_CACHE_TTL, cache_delete, cache_get, cache_set, user_cache_key
+from app.core.database import SessionLocal, get_db
+from app.core.security import decode_token_cached
 from app.models.user import User
+from app.services.day_service import DayService
 
 # Bearer token security scheme
 security = HTTPBearer()
 
+# User columns kept in the cache; the password hash stays out of Redis and
+# is loaded from the database if an endpoint needs it
+_USER_CACHE_COLUMNS = [
+    column.key for column in User.__table__.columns if column.key != "hashed_password"
+]
+_USER_NUMERIC_COLUMNS = [
+    column.key for column in User.__table__.columns if isinstance(column.type, Numeric)
+]
+_USER_DATETIME_COLUMNS = [
+    column.key for column in User.__table__.columns if isinstance(column.type, DateTime)
+]
 
-def get_db() -> Generator:
-    """Get database session.
+# Session.info key collecting users updated or deleted in the transaction
+_CHANGED_USER_IDS = "changed_user_ids"
 
-    Yields:
-        Database session
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _track_changed_user(mapper, connection, target: User) -> None:
+    """Remember a flushed user change so its cache entry is dropped on commit."""
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_CHANGED_USER_IDS, set()).add(target.id)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _invalidate_changed_users(session: Session) -> None:
+    """Drop cached users changed by the committed transaction."""
+    changed = session.info.pop(_CHANGED_USER_IDS, None)
+    if changed:
+        cache_delete(*(user_cache_key(user_id) for user_id in changed))
+
+
+@event.listens_for(SessionLocal, "after_soft_rollback")
+def _forget_changed_users(session: Session, previous_transaction) -> None:
+    """Forget user changes that were rolled back."""
+    session.info.pop(_CHANGED_USER_IDS, None)
+
+
+def _load_user(db: Session, user_id: int) -> Optional[User]:
+    """Load a user, from the short-lived cache when possible.
+
+    A cache hit is attached to the session without a query, so it behaves
+    like a loaded user: attributes not kept in the cache and relationships
+    are lazy-loaded, and changes are flushed as usual.
+
+    Args:
+        db: Database session
+        user_id: User ID
+
+    Returns:
+        User object or None if not found
     """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+    cache_key = user_cache_key(user_id)
+    cached = cache_get(cache_key)
+
+    if cached is not None:
+        values = orjson.loads(cached)
+        for key in _USER_NUMERIC_COLUMNS:
+            if values.get(key) is not None:
+                values[key] = Decimal(values[key])
+        for key in _USER_DATETIME_COLUMNS:
+            if values.get(key) is not None:
+                values[key] = datetime.fromisoformat(values[key])
+
+        user = User(**values)
+        make_transient_to_detached(user)
+        return db.merge(user, load=False)
+
+    user = db.get(User, user_id)
+    if user is not None:
+        values = {key: getattr(user, key) for key in _USER_CACHE_COLUMNS}
+        cache_set(cache_key, orjson.dumps(values, default=str).decode(), USER_CACHE_TTL)
+    return user
 
 
-async def get_current_user(
+def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db),
 ) -> User:
     """Get current authenticated user.
 
+    Declared as a plain function so FastAPI runs the blocking user lookup in
+    its threadpool instead of on the event loop.
+
     Args:
         credentials: HTTP bearer token credentials
         db: Database session
@@ -50,7 +121,7 @@ async def get_current_user(
     )
 
     token = credentials.credentials
-    payload = decode_token(token)
+    payload = decode_token_cached(token)
 
     if payload is None:
         raise credentials_exception
@@ -69,8 +140,8 @@ async def get_current_user(
     except (ValueError, TypeError):
         raise credentials_exception
 
-    # Get user from database
-    user = db.query(User).filter(User.id == user_id).first()
+    # Get user from cache or database
+    user = _load_user(db, user_id)
     if user is None:
         raise credentials_exception
 
@@ -83,6 +154,49 @@ async def get_current_user(
     return user
 
 
+def check_day_access(db: Session, day_id: int, user_id: int, forbidden_detail: str) -> None:
+    """Verify that a day exists and belongs to the user.
+
+    The common case is answered by one EXISTS query; the day's existence is
+    only probed separately when that check fails.
+
+    Args:
+        db: Database session
+        day_id: Day ID
+        user_id: Current user ID
+        forbidden_detail: Error detail used when the day belongs to another user
+
+    Raises:
+        HTTPException: 404 if day not found, 403 if not authorized
+    """
+    if DayService.user_owns_day(db, day_id, user_id):
+        return
+
+    raise_day_not_accessible(db, day_id, forbidden_detail)
+
+
+def raise_day_not_accessible(db: Session, day_id: int, forbidden_detail: str) -> NoReturn:
+    """Raise 404 or 403 after an ownership-filtered day query matched nothing.
+
+    Args:
+        db: Database session
+        day_id: Day ID that was requested
+        forbidden_detail: Error detail used when the day belongs to another user
+
+    Raises:
+        HTTPException: 404 if day not found, 403 otherwise
+    """
+    if not DayService.day_exists(db, day_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Day with id {day_id} not found",
+        )
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail=forbidden_detail,
+    )
+
+
 async def get_current_active_user(
     current_user: User = Depends(get_current_user),
 ) -> User:
@@ -1,17 +1,22 @@
 """Error tracking and Sentry integration."""
 
 import logging
-import os
+import re
 from typing import Any, Dict, Optional
 
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from app.config import settings
 from app.core.request_id import get_request_id
 
 logger = logging.getLogger(__name__)
 
+# Keys whose values are masked in Sentry events (substring match, any case);
+# "token" and "auth" also cover access_token, refresh_token and authorization
+_SENSITIVE_KEY_RE = re.compile(r"password|secret|api_?key|token|auth|jwt", re.IGNORECASE)
+
 # Sentry SDK (optional)
 sentry_sdk = None
 SENTRY_ENABLED = False
@@ -21,8 +26,8 @@ try:
     from sentry_sdk.integrations.fastapi import FastApiIntegration
     from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
 
-    SENTRY_DSN = os.getenv("SENTRY_DSN")
-    SENTRY_ENVIRONMENT = os.getenv("SENTRY_ENVIRONMENT", "development")
+    SENTRY_DSN = settings.SENTRY_DSN
+    SENTRY_ENVIRONMENT = settings.SENTRY_ENVIRONMENT or settings.ENVIRONMENT
 
     if SENTRY_DSN:
         sentry_sdk.init(
@@ -67,48 +72,34 @@ def filter_sensitive_data(event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     Returns:
         Filtered event or None to drop event
     """
-    # List of sensitive keys to filter
-    sensitive_keys = {
-        "password",
-        "secret",
-        "api_key",
-        "apikey",
-        "token",
-        "authorization",
-        "auth",
-        "jwt",
-        "refresh_token",
-        "access_token",
-    }
-
-    def filter_dict(data: Dict[str, Any]) -> Dict[str, Any]:
-        """Recursively filter dictionary."""
-        filtered = {}
-        for key, value in data.items():
-            key_lower = key.lower()
-            if any(sensitive in key_lower for sensitive in sensitive_keys):
-                filtered[key] = "[FILTERED]"
-            elif isinstance(value, dict):
-                filtered[key] = filter_dict(value)
-            elif isinstance(value, list):
-                filtered[key] = [
-                    filter_dict(item) if isinstance(item, dict) else item
-                    for item in value
-                ]
-            else:
-                filtered[key] = value
-        return filtered
+    def scrub(data: Any) -> None:
+        """Mask sensitive values in nested dicts/lists in place.
+
+        Sentry hands over an event it discards afterwards, so it is walked
+        with an explicit stack and modified directly rather than copied.
+        """
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    if _SENSITIVE_KEY_RE.search(key):
+                        node[key] = "[FILTERED]"
+                    elif isinstance(value, (dict, list)):
+                        stack.append(value)
+            elif isinstance(node, list):
+                stack.extend(item for item in node if isinstance(item, (dict, list)))
 
     # Filter request data
     if "request" in event:
         if "data" in event["request"]:
-            event["request"]["data"] = filter_dict(event["request"]["data"])
+            scrub(event["request"]["data"])
         if "headers" in event["request"]:
-            event["request"]["headers"] = filter_dict(event["request"]["headers"])
+            scrub(event["request"]["headers"])
 
     # Filter extra context
     if "extra" in event:
-        event["extra"] = filter_dict(event["extra"])
+        scrub(event["extra"])
 
     return event
 
@@ -126,6 +117,10 @@ def capture_exception(
         user_id: Optional user ID for context
         extra_context: Additional context data
     """
+    # Nothing to do if the error would be neither logged nor sent
+    if not SENTRY_ENABLED and not logger.isEnabledFor(logging.ERROR):
+        return
+
     request_id = get_request_id()
 
     # Build context
@@ -147,7 +142,8 @@ def capture_exception(
     )
 
     # Send to Sentry if enabled
-    if SENTRY_ENABLED and sentry_sdk:
+    # Only set once sentry_sdk has been imported and initialized
+    if SENTRY_ENABLED:
         with sentry_sdk.push_scope() as scope:
             # Set user context
             if user_id:
@@ -204,7 +200,7 @@ async def http_exception_handler(
             "status_code": exc.status_code,
             "request_id": request_id,
         },
-        headers={"X-Request-ID": request_id},
+        headers={**(exc.headers or {}), "X-Request-ID": request_id},
     )
 
 
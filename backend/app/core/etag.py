@@ -0,0 +1,68 @@
+"""Conditional GET support for JSON detail endpoints.
+
+Responses carry a weak ETag derived from the serialized body. Clients that
+poll (e.g. meal photo processing status) send it back in ``If-None-Match``
+and get an empty 304 while the resource is unchanged.
+"""
+
+import hashlib
+
+from fastapi import Request, status
+from fastapi.responses import Response
+
+# Authenticated responses must not be stored by shared caches, and clients
+# should revalidate before reuse
+_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(body: str) -> str:
+    """Build a weak ETag for a serialized response body.
+
+    Args:
+        body: Serialized JSON body
+
+    Returns:
+        Quoted weak ETag value
+    """
+    digest = hashlib.blake2b(body.encode("utf-8"), digest_size=16).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison).
+
+    Args:
+        if_none_match: Raw If-None-Match header value
+        etag: Current ETag
+
+    Returns:
+        True if the client's copy is current
+    """
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def json_response_with_etag(request: Request, body: str) -> Response:
+    """Return a JSON body, or 304 if the client already has it.
+
+    Args:
+        request: Incoming request
+        body: Serialized JSON body
+
+    Returns:
+        200 response with ETag, or empty 304 response
+    """
+    etag = make_etag(body)
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -19,14 +19,16 @@ References:
 - OWASP File Upload Cheat Sheet: https://cheatsheetseries.owasp.org/cheatsheets/File_Upload_Cheat_Sheet.html
 """
 
+import asyncio
 import imghdr
 import logging
 import os
 import re
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import BinaryIO, Optional, Tuple
 
 from fastapi import HTTPException, UploadFile, status
+from PIL import Image
 
 logger = logging.getLogger(__name__)
 
@@ -46,10 +48,11 @@ class FileValidator:
     This class implements multiple layers of file upload security:
     1. Extension whitelist validation
     2. Magic bytes validation (actual file type)
-    3. Filename sanitization
-    4. Path traversal prevention
-    5. Size limit enforcement
-    6. Optional virus scanning
+    3. Image header validation (decodable format, dimensions)
+    4. Filename sanitization
+    5. Path traversal prevention
+    6. Size limit enforcement
+    7. Optional virus scanning
 
     Example:
         ```python
@@ -99,12 +102,26 @@ class FileValidator:
     DEFAULT_MAX_SIZE_MB = 10
     ABSOLUTE_MAX_SIZE_MB = 50
 
+    # Image format (as reported by Pillow) expected for each extension
+    IMAGE_FORMATS = {
+        ".jpg": "JPEG",
+        ".jpeg": "JPEG",
+        ".png": "PNG",
+        ".gif": "GIF",
+        ".bmp": "BMP",
+        ".webp": "WEBP",
+    }
+
+    # Maximum image width/height in pixels
+    DEFAULT_MAX_DIMENSION = 8192
+
     def __init__(
         self,
         allowed_extensions: Optional[set] = None,
         max_size_mb: int = DEFAULT_MAX_SIZE_MB,
         check_magic_bytes: bool = True,
         scan_viruses: bool = False,
+        max_dimension: int = DEFAULT_MAX_DIMENSION,
     ):
         """Initialize file validator.
 
@@ -113,18 +130,25 @@ class FileValidator:
             max_size_mb: Maximum file size in MB (default: 10)
             check_magic_bytes: Whether to validate actual file type (default: True)
             scan_viruses: Whether to scan for viruses with ClamAV (default: False)
+            max_dimension: Maximum image width/height in pixels (default: 8192)
         """
         self.allowed_extensions = allowed_extensions or self.DEFAULT_IMAGE_EXTENSIONS
         self.max_size_mb = min(max_size_mb, self.ABSOLUTE_MAX_SIZE_MB)
         self.max_size_bytes = self.max_size_mb * 1024 * 1024
         self.check_magic_bytes = check_magic_bytes
         self.scan_viruses = scan_viruses
+        self.max_dimension = max_dimension
 
         # Normalize extensions to lowercase with dot
         self.allowed_extensions = {
             ext.lower() if ext.startswith(".") else f".{ext.lower()}"
             for ext in self.allowed_extensions
         }
+        self.allowed_formats = {
+            self.IMAGE_FORMATS[ext]
+            for ext in self.allowed_extensions
+            if ext in self.IMAGE_FORMATS
+        }
 
     def sanitize_filename(self, filename: str) -> str:
         """Sanitize filename to prevent security issues.
@@ -280,6 +304,55 @@ class FileValidator:
             logger.error(f"Error validating magic bytes: {e}")
             return False, f"Error validating file type: {str(e)}"
 
+    def _check_image_header(self, source: BinaryIO) -> Tuple[bool, Optional[str]]:
+        """Check image format and dimensions without decoding pixel data.
+
+        Args:
+            source: Image file object
+
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        try:
+            source.seek(0)
+            with Image.open(source) as image:
+                image_format = image.format
+                width, height = image.size
+                image.verify()
+        except Exception as e:
+            logger.warning(f"Image header could not be parsed: {e}")
+            return False, "File is not a valid or complete image"
+        finally:
+            source.seek(0)
+
+        if image_format not in self.allowed_formats:
+            allowed_str = ", ".join(sorted(self.allowed_formats))
+            return False, f"Image format '{image_format}' not allowed. Allowed formats: {allowed_str}"
+
+        if width > self.max_dimension or height > self.max_dimension:
+            return False, (
+                f"Image dimensions ({width}x{height}) exceed maximum allowed "
+                f"size ({self.max_dimension}x{self.max_dimension})"
+            )
+
+        return True, None
+
+    async def validate_image_header(
+        self, file: UploadFile
+    ) -> Tuple[bool, Optional[str]]:
+        """Validate that the file is a decodable image of acceptable dimensions.
+
+        Only the image header is parsed, so corrupt or oversized images are
+        rejected before they are stored or sent for processing.
+
+        Args:
+            file: Uploaded file
+
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        return await asyncio.to_thread(self._check_image_header, file.file)
+
     def validate_size(self, file_size: int) -> Tuple[bool, Optional[str]]:
         """Validate file size.
 
@@ -433,6 +506,13 @@ class FileValidator:
                 logger.warning(f"Magic bytes validation failed: {error}")
                 return False, error
 
+        # 7. Validate image header (format, dimensions, integrity)
+        if check_content:
+            is_valid, error = await self.validate_image_header(file)
+            if not is_valid:
+                logger.warning(f"Image header validation failed: {error}")
+                return False, error
+
         logger.info(f"File validation successful: {safe_filename}")
         return True, None
 
@@ -0,0 +1,133 @@
+"""Redis pub/sub notifications for FitCoach API.
+
+Background jobs publish a message when they finish so long-polling endpoints
+can respond immediately instead of clients polling the database.
+
+Like the response cache, this fails open: if Redis is unavailable, publishing
+is skipped and subscribers get no subscription, leaving callers to fall back
+to reading the database.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import redis
+import redis.asyncio as aioredis
+from redis.asyncio.client import PubSub
+from redis.exceptions import RedisError
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Redis channel prefixes
+MEAL_STATUS_CHANNEL_PREFIX = "meal_status:"
+TRAINING_PROGRAM_JOB_CHANNEL_PREFIX = "training_program_job:"
+
+_publish_client = redis.Redis(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    db=settings.REDIS_DB,
+    socket_timeout=0.5,
+    socket_connect_timeout=0.5,
+)
+
+
+def meal_status_channel(meal_id: int) -> str:
+    """Build channel name for meal photo processing updates.
+
+    Args:
+        meal_id: Meal ID
+
+    Returns:
+        Redis channel name
+    """
+    return f"{MEAL_STATUS_CHANNEL_PREFIX}{meal_id}"
+
+
+def training_program_job_channel(job_id: str) -> str:
+    """Build channel name for training program generation job updates.
+
+    Args:
+        job_id: Generation job ID
+
+    Returns:
+        Redis channel name
+    """
+    return f"{TRAINING_PROGRAM_JOB_CHANNEL_PREFIX}{job_id}"
+
+
+def publish(channel: str, message: str) -> None:
+    """Publish a message to a channel.
+
+    Args:
+        channel: Redis channel name
+        message: Message payload
+    """
+    try:
+        _publish_client.publish(channel, message)
+    except RedisError as e:
+        logger.warning(f"Publish failed for {channel}: {e}")
+
+
+@asynccontextmanager
+async def subscription(channel: str) -> AsyncIterator[Optional[PubSub]]:
+    """Subscribe to a channel for the duration of the block.
+
+    Each subscription uses its own connection, so it is not tied to the event
+    loop of any other request.
+
+    Args:
+        channel: Redis channel name
+
+    Yields:
+        Subscribed PubSub, or None if Redis is unavailable
+    """
+    client = aioredis.Redis(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        db=settings.REDIS_DB,
+        decode_responses=True,
+        socket_connect_timeout=0.5,
+    )
+    pubsub = client.pubsub(ignore_subscribe_messages=True)
+
+    try:
+        try:
+            await pubsub.subscribe(channel)
+        except RedisError as e:
+            logger.warning(f"Subscribe failed for {channel}: {e}")
+            yield None
+        else:
+            yield pubsub
+    finally:
+        await pubsub.aclose()
+        await client.aclose()
+
+
+async def wait_for_message(pubsub: PubSub, timeout: float) -> Optional[str]:
+    """Wait for the next message on a subscription.
+
+    Args:
+        pubsub: Subscribed PubSub
+        timeout: Maximum seconds to wait
+
+    Returns:
+        Message payload, or None on timeout or Redis error
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+
+    try:
+        while (remaining := deadline - loop.time()) > 0:
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=remaining
+            )
+            if message is not None:
+                return message["data"]
+    except RedisError as e:
+        logger.warning(f"Waiting for message failed: {e}")
+
+    return None
@@ -1,7 +1,9 @@
 """Security utilities for authentication and authorization."""
 
+import threading
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -11,6 +13,14 @@ from app.config import settings
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Verified token payloads by raw token, so a client's burst of requests
+# verifies its token once. Entries live at most _TOKEN_CACHE_TTL seconds and
+# never past the token's own expiry; invalid tokens are never cached.
+_TOKEN_CACHE_TTL = 60
+_TOKEN_CACHE_MAX_SIZE = 10_000
+_token_cache: Dict[str, Tuple[dict, float]] = {}
+_token_cache_lock = threading.Lock()
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash.
@@ -109,3 +119,31 @@ def decode_token(token: str) -> Optional[dict]:
         return payload
     except JWTError:
         return None
+
+
+def decode_token_cached(token: str) -> Optional[dict]:
+    """Decode and verify JWT token, reusing recent verifications.
+
+    Args:
+        token: The JWT token to decode
+
+    Returns:
+        The decoded token payload (shared, do not modify) or None if invalid
+    """
+    now = time.time()
+    cached = _token_cache.get(token)
+    if cached is not None and now < cached[1]:
+        return cached[0]
+
+    payload = decode_token(token)
+    if payload is None:
+        return None
+
+    expires_at = min(now + _TOKEN_CACHE_TTL, payload.get("exp", now))
+    with _token_cache_lock:
+        if len(_token_cache) >= _TOKEN_CACHE_MAX_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _token_cache[next(iter(_token_cache))]
+        _token_cache[token] = (payload, expires_at)
+
+    return payload
@@ -0,0 +1,59 @@
+"""Redis-backed job queue for FitCoach API.
+
+Long-running work (e.g. meal photo recognition) is handed to the arq worker
+defined in ``app.worker`` instead of running inside the API process.
+
+Enqueueing fails soft: if Redis is unavailable ``enqueue_job`` returns False
+and the caller decides on a fallback.
+"""
+
+import logging
+from typing import Optional
+
+from arq import create_pool
+from arq.connections import ArqRedis, RedisSettings
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Fail fast when Redis is down instead of retrying inside a request
+_redis_settings = RedisSettings(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    database=settings.REDIS_DB,
+    conn_timeout=1,
+    conn_retries=0,
+)
+
+_pool: Optional[ArqRedis] = None
+
+
+async def enqueue_job(function: str, **kwargs) -> bool:
+    """Enqueue a job for the background worker.
+
+    Args:
+        function: Registered worker function name
+        **kwargs: Job arguments
+
+    Returns:
+        True if the job was enqueued, False otherwise
+    """
+    global _pool
+    try:
+        if _pool is None:
+            _pool = await create_pool(_redis_settings)
+        job = await _pool.enqueue_job(function, **kwargs)
+        return job is not None
+    except Exception as e:
+        logger.warning(f"Failed to enqueue job {function}: {e}")
+        _pool = None
+        return False
+
+
+async def close_task_queue() -> None:
+    """Close the job queue connection pool."""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
@@ -6,8 +6,11 @@ import signal
 import sys
 from contextlib import asynccontextmanager
 
+import anyio.to_thread
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from slowapi.errors import RateLimitExceeded
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
@@ -51,6 +54,23 @@ logger = get_logger(__name__)
 shutdown_event = asyncio.Event()
 
 
+async def keep_db_pool_alive(interval: float) -> None:
+    """
+    Ping idle pooled database connections every ``interval`` seconds.
+
+    Args:
+        interval: Seconds between pings
+    """
+    from app.core.database import ping_idle_connections
+
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(ping_idle_connections)
+        except Exception as e:
+            logger.warning(f"Database connection keep-alive failed: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -82,8 +102,29 @@ async def lifespan(app: FastAPI):
     signal.signal(signal.SIGTERM, handle_shutdown_signal)
     signal.signal(signal.SIGINT, handle_shutdown_signal)
 
+    # Sync endpoints run in AnyIO's threadpool; size it to the DB pool
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+
+    # Pre-open pooled database connections so first requests skip the handshake
+    try:
+        from app.core.database import warm_up_pool
+
+        await asyncio.to_thread(warm_up_pool)
+        logger.info("Database connection pool warmed up")
+    except Exception as e:
+        logger.warning(f"Database connection pool warm-up failed: {e}")
+
+    keepalive_task = None
+    if settings.DB_POOL_KEEPALIVE_INTERVAL > 0:
+        keepalive_task = asyncio.create_task(
+            keep_db_pool_alive(settings.DB_POOL_KEEPALIVE_INTERVAL)
+        )
+
     yield
 
+    if keepalive_task is not None:
+        keepalive_task.cancel()
+
     # Shutdown
     logger.info("Application shutting down")
 
@@ -102,6 +143,13 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error closing database connections: {e}")
 
+    try:
+        from app.core.task_queue import close_task_queue
+
+        await close_task_queue()
+    except Exception as e:
+        logger.error(f"Error closing job queue connections: {e}")
+
     logger.info("Application shutdown complete")
 
 
@@ -113,6 +161,7 @@ app = FastAPI(
     redoc_url="/api/redoc",
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Exception handlers
@@ -123,6 +172,11 @@ app.add_exception_handler(Exception, general_exception_handler)
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
 
+# Response compression for large JSON payloads (e.g. meal plans). SSE and
+# MP3 audio responses set Content-Encoding: identity and are passed through
+# uncompressed.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Request ID Middleware (apply early to track all requests)
 app.add_middleware(RequestIDMiddleware)
 
@@ -143,9 +197,10 @@ app.add_middleware(
         "User-Agent",
         "DNT",
         "Cache-Control",
+        "If-None-Match",
         "X-Requested-With",
     ],
-    expose_headers=["Content-Length", "Content-Type"],
+    expose_headers=["Content-Length", "Content-Type", "ETag"],
     max_age=600,  # 10 minutes
 )
 
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, Numeric, String, Text, func
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, Numeric, String, Text, func
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -49,12 +49,19 @@ class Exercise(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
-    day = relationship("Day", back_populates="exercises")
+    # Never lazy-load the day with a query: callers that need it must
+    # eager-load it (see ExerciseService.get_exercise) so N+1 patterns fail fast
+    day = relationship("Day", back_populates="exercises", lazy="raise_on_sql")
     sets = relationship("ExerciseSet", back_populates="exercise", cascade="all, delete-orphan")
 
     def __repr__(self):
         return f"<Exercise {self.type} - Day {self.day_id}>"
 
+    __table_args__ = (
+        # Covers listing a day's exercises ordered by start time
+        Index("ix_exercises_day_start", "day_id", "start_time"),
+    )
+
 
 class ExerciseSet(Base):
     """Individual set in a workout."""
@@ -3,7 +3,7 @@
 from datetime import date, datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, Integer, Numeric, String, Text
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -52,3 +52,8 @@ class Goal(Base):
 
     def __repr__(self):
         return f"<Goal {self.title} - {self.status}>"
+
+    __table_args__ = (
+        # Covers listing a user's goals by status, newest first
+        Index("ix_goals_user_status_created", "user_id", "status", created_at.desc()),
+    )
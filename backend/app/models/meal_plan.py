@@ -3,7 +3,8 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -25,10 +26,10 @@ class MealPlan(Base):
     allergies = Column(JSON, nullable=True)  # List of allergies
 
     # Generated meal plan data (JSON structure with 7 days)
-    plan_data = Column(JSON, nullable=False)
+    plan_data = Column(JSONB, nullable=False)
 
     # Summary/metadata
-    summary = Column(JSON, nullable=True)  # Macros, notes, etc.
+    summary = Column(JSONB, nullable=True)  # Macros, notes, etc.
 
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -37,6 +38,11 @@ class MealPlan(Base):
     # Active status (user can have multiple plans)
     is_active = Column(Integer, default=1)  # 1 = active, 0 = archived
 
+    __table_args__ = (
+        # Covers listing a user's active plans, newest first
+        Index("ix_meal_plans_user_active_created", "user_id", "is_active", created_at.desc()),
+    )
+
     # Relationship
     user = relationship("User", backref="meal_plans")
 
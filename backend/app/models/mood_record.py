@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
@@ -46,3 +46,8 @@ class MoodRecord(Base):
 
     def __repr__(self):
         return f"<MoodRecord rating={self.rating} at {self.time}>"
+
+    __table_args__ = (
+        # Covers listing a day's mood records ordered by time
+        Index("ix_mood_records_day_time", "day_id", "time"),
+    )
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
@@ -41,3 +41,8 @@ class Note(Base):
 
     def __repr__(self):
         return f"<Note {self.title} - Day {self.day_id}>"
+
+    __table_args__ = (
+        # Covers listing a day's notes, newest first
+        Index("ix_notes_day_created", "day_id", created_at.desc()),
+    )
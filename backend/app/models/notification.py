@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
@@ -44,3 +44,14 @@ class Notification(Base):
 
     def __repr__(self):
         return f"<Notification {self.title} - User {self.user_id}>"
+
+    __table_args__ = (
+        # Covers listing a user's notifications newest first; is_read is
+        # carried in the index so the unread filter is checked from it
+        Index(
+            "ix_notifications_user_created",
+            "user_id",
+            created_at.desc(),
+            postgresql_include=["is_read"],
+        ),
+    )
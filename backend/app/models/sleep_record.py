@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, Numeric, Text, func
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, Numeric, Text, func
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -49,3 +49,8 @@ class SleepRecord(Base):
 
     def __repr__(self):
         return f"<SleepRecord {self.duration}h - Day {self.day_id}>"
+
+    __table_args__ = (
+        # Covers listing a day's sleep records ordered by bedtime
+        Index("ix_sleep_records_day_bedtime", "day_id", "bedtime"),
+    )
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -37,6 +37,11 @@ class TrainingProgram(Base):
     # Active status (user can have multiple programs)
     is_active = Column(Integer, default=1)  # 1 = active, 0 = archived
 
+    __table_args__ = (
+        # Covers listing a user's active programs, newest first
+        Index("ix_training_programs_user_active_created", "user_id", "is_active", created_at.desc()),
+    )
+
     # Relationship
     user = relationship("User", backref="training_programs")
 
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, Numeric, func
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, Numeric, func
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -30,5 +30,10 @@ class WaterIntake(Base):
     # Relationships
     day = relationship("Day", back_populates="water_intakes")
 
+    __table_args__ = (
+        # Covers listing a day's water intakes ordered by time
+        Index("ix_water_intakes_day_time", "day_id", "time"),
+    )
+
     def __repr__(self):
         return f"<WaterIntake {self.amount}L at {self.time}>"
@@ -36,10 +36,28 @@ class MealPlanResponse(BaseModel):
         from_attributes = True
 
 
+class MealPlanListItem(BaseModel):
+    """Meal plan entry in list responses (without plan_data and summary)."""
+
+    id: int
+    user_id: int
+    name: str
+    description: Optional[str] = None
+    calorie_target: int
+    dietary_preferences: Optional[List[str]] = None
+    allergies: Optional[List[str]] = None
+    is_active: int
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 class MealPlanListResponse(BaseModel):
     """Response schema for list of meal plans."""
 
-    meal_plans: List[MealPlanResponse]
+    meal_plans: List[MealPlanListItem]
     total: int
 
 
@@ -1,7 +1,7 @@
 """Notification schemas."""
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -27,6 +27,18 @@ class NotificationUpdate(BaseModel):
     is_read: Optional[bool] = None
 
 
+class NotificationMarkRead(BaseModel):
+    """Schema for marking several notifications as read."""
+
+    ids: List[int] = Field(..., max_length=1000)
+
+
+class NotificationMarkReadResponse(BaseModel):
+    """Schema for bulk mark-as-read response."""
+
+    updated_ids: List[int]
+
+
 class NotificationResponse(NotificationBase):
     """Schema for notification response."""
 
@@ -38,10 +38,29 @@ class TrainingProgramResponse(BaseModel):
         from_attributes = True
 
 
+class TrainingProgramListItem(BaseModel):
+    """Training program entry in list responses (without program_data and summary)."""
+
+    id: int
+    user_id: int
+    name: str
+    description: Optional[str] = None
+    goal: str
+    experience_level: str
+    days_per_week: int
+    equipment: Optional[List[str]] = None
+    is_active: int
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 class TrainingProgramListResponse(BaseModel):
     """Response schema for list of training programs."""
 
-    programs: List[TrainingProgramResponse]
+    programs: List[TrainingProgramListItem]
     total: int
 
 
@@ -51,3 +70,12 @@ class TrainingProgramCreateResponse(BaseModel):
     success: bool
     program: Optional[TrainingProgramResponse] = None
     error: Optional[str] = None
+
+
+class TrainingProgramJobResponse(BaseModel):
+    """Response schema for a background training program generation job."""
+
+    job_id: str
+    status: str  # pending, completed, failed
+    program_id: Optional[int] = None
+    error: Optional[str] = None
@@ -290,7 +290,7 @@ class AuthService:
             return None
 
         # Get user
-        user = db.query(User).filter(User.id == token_data["user_id"]).first()
+        user = db.get(User, token_data["user_id"])
         if not user:
             # Remove token if user doesn't exist
             del _reset_tokens[token]
@@ -351,7 +351,7 @@ class AuthService:
             return False
 
         # Get user
-        user = db.query(User).filter(User.id == token_data["user_id"]).first()
+        user = db.get(User, token_data["user_id"])
         if not user:
             # Remove token if user doesn't exist
             del _verification_tokens[token]
@@ -384,7 +384,7 @@ class AuthService:
             Verification token if user exists and is not verified, None otherwise
         """
         # Get user
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.get(User, user_id)
         if not user:
             return None
 
@@ -1,12 +1,22 @@
 """Day service."""
 
 from datetime import date
-from typing import List, Optional
+from typing import List, Optional, Type
 
+from sqlalchemy import Insert, bindparam, exists, insert, literal, select
 from sqlalchemy.orm import Session, joinedload
 
+from app.core.database import Base
 from app.models.day import Day
 
+# Ownership probes run on nearly every day-scoped request. They are built once
+# with bound parameters so each call reuses the statement and its cached
+# compiled form instead of constructing a new one.
+_USER_OWNS_DAY = select(
+    exists().where(Day.id == bindparam("day_id"), Day.user_id == bindparam("user_id"))
+)
+_DAY_EXISTS = select(exists().where(Day.id == bindparam("day_id")))
+
 
 class DayService:
     """Service for day operations."""
@@ -74,6 +84,72 @@ class DayService:
             .first()
         )
 
+    @staticmethod
+    def user_owns_day(db: Session, day_id: int, user_id: int) -> bool:
+        """Check whether a day exists and belongs to the user.
+
+        Evaluated as a single EXISTS query, without loading the Day row.
+
+        Args:
+            db: Database session
+            day_id: Day ID
+            user_id: User ID
+
+        Returns:
+            True if the day belongs to the user, False otherwise
+        """
+        return db.scalar(_USER_OWNS_DAY, {"day_id": day_id, "user_id": user_id})
+
+    @staticmethod
+    def insert_for_owned_day(
+        model: Type[Base], day_id: int, user_id: int, data: dict
+    ) -> Insert:
+        """Build an INSERT of a day record that only writes for the day's owner.
+
+        The values are selected from the day filtered by ID and owner, so
+        the statement inserts nothing and returns no row unless the day
+        belongs to the user. A None value is left out for columns with a
+        default, so the default applies as it does for ``model(**data)``.
+
+        Args:
+            model: Day record model with a ``day_id`` column
+            day_id: Day ID
+            user_id: ID of the user who must own the day
+            data: Column values for the new row; unknown keys are ignored
+
+        Returns:
+            INSERT ... SELECT ... RETURNING statement for the model
+        """
+        columns = model.__table__.c
+        fields = [
+            key
+            for key, value in data.items()
+            if key in columns
+            and not (
+                value is None
+                and (columns[key].default is not None or columns[key].server_default is not None)
+            )
+        ]
+        owned_day = select(
+            Day.id,
+            *[literal(data[key], columns[key].type) for key in fields],
+        ).where(Day.id == day_id, Day.user_id == user_id)
+
+        return insert(model).from_select(["day_id", *fields], owned_day).returning(model)
+
+    @staticmethod
+    def day_exists(db: Session, day_id: int) -> bool:
+        """Check whether a day exists regardless of its owner.
+
+        Args:
+            db: Database session
+            day_id: Day ID
+
+        Returns:
+            True if the day exists, False otherwise
+        """
+        return db.scalar(_DAY_EXISTS, {"day_id": day_id})
+
     @staticmethod
     def get_days_range(
         db: Session, user_id: int, start_date: date, end_date: date
@@ -123,7 +199,7 @@ class DayService:
         Raises:
             ValueError: If day not found
         """
-        day = db.query(Day).filter(Day.id == day_id).first()
+        day = db.get(Day, day_id)
 
         if not day:
             raise ValueError(f"Day with id {day_id} not found")
@@ -149,7 +225,7 @@ class DayService:
         Returns:
             True if deleted, False if not found
         """
-        day = db.query(Day).filter(Day.id == day_id).first()
+        day = db.get(Day, day_id)
 
         if not day:
             return False
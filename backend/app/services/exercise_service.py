@@ -1,26 +1,56 @@
 """Exercise service."""
 
-from typing import List, Optional
+import io
+from typing import Any, List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, delete, func, insert, select, update
+from sqlalchemy.orm import Session, joinedload
 
+from app.core.database import commit_returning
+from app.models.day import Day
 from app.models.exercise import Exercise
+from app.services.day_service import DayService
+
+# Batches of at least this many rows are loaded with COPY on PostgreSQL
+COPY_THRESHOLD = 100
+
+
+def _csv_field(value: Any) -> str:
+    """Render a value as a COPY CSV field.
+
+    Args:
+        value: Column value
+
+    Returns:
+        Empty unquoted field for None (read as NULL), quoted text otherwise
+    """
+    if value is None:
+        return ""
+    return '"' + str(value).replace('"', '""') + '"'
 
 
 class ExerciseService:
     """Service for exercise operations."""
 
     @staticmethod
-    def create_exercise(db: Session, day_id: int, exercise_data: dict) -> Exercise:
-        """Create new exercise for a day.
+    def create_exercise(
+        db: Session, day_id: int, user_id: int, exercise_data: dict
+    ) -> Optional[Exercise]:
+        """Create new exercise for a day owned by the user.
+
+        The ownership check and the insert run as a single
+        INSERT ... SELECT ... RETURNING statement, so no row is written
+        unless the day belongs to the user.
 
         Args:
             db: Database session
             day_id: Day ID
+            user_id: ID of the user who must own the day
             exercise_data: Dictionary containing exercise fields
 
         Returns:
-            Newly created Exercise object
+            Newly created Exercise object, or None if the day does not
+            exist or belongs to another user
 
         Raises:
             ValueError: If required fields are missing
@@ -28,16 +58,115 @@ class ExerciseService:
         if "type" not in exercise_data:
             raise ValueError("Exercise type is required")
 
-        new_exercise = Exercise(day_id=day_id, **exercise_data)
-        db.add(new_exercise)
-        db.commit()
-        db.refresh(new_exercise)
+        stmt = DayService.insert_for_owned_day(Exercise, day_id, user_id, exercise_data)
+        new_exercise = db.execute(stmt).scalar_one_or_none()
+        commit_returning(db, new_exercise)
         return new_exercise
 
+    @staticmethod
+    def bulk_create_exercises(
+        db: Session, day_id: int, exercises_data: List[dict]
+    ) -> List[Exercise]:
+        """Create several exercises for a day in one batch.
+
+        Large batches on PostgreSQL are streamed with COPY FROM STDIN, smaller
+        ones go through a multi-row INSERT ... RETURNING. Day ownership must be
+        checked by the caller.
+
+        Args:
+            db: Database session
+            day_id: Day ID
+            exercises_data: List of dictionaries containing exercise fields
+
+        Returns:
+            List of newly created Exercise objects in input order
+
+        Raises:
+            ValueError: If required fields are missing
+        """
+        if any("type" not in data for data in exercises_data):
+            raise ValueError("Exercise type is required")
+
+        rows = [{**data, "day_id": day_id} for data in exercises_data]
+        if not rows:
+            return []
+
+        dialect = db.get_bind().dialect
+        if (
+            len(rows) >= COPY_THRESHOLD
+            and dialect.name == "postgresql"
+            and dialect.driver == "psycopg2"
+        ):
+            exercises = ExerciseService._copy_exercises(db, rows)
+        else:
+            exercises = list(
+                db.scalars(
+                    insert(Exercise).returning(Exercise, sort_by_parameter_order=True),
+                    rows,
+                )
+            )
+
+        commit_returning(db, *exercises)
+        return exercises
+
+    @staticmethod
+    def _copy_exercises(db: Session, rows: List[dict]) -> List[Exercise]:
+        """Load exercise rows with PostgreSQL COPY.
+
+        COPY cannot return rows, so IDs are reserved from the sequence first
+        and the inserted rows are read back by ID.
+
+        Args:
+            db: Database session bound to a psycopg2 connection
+            rows: Exercise column dictionaries including day_id
+
+        Returns:
+            List of inserted Exercise objects in input order
+        """
+        columns = ["id"] + [
+            column.name
+            for column in Exercise.__table__.columns
+            if any(column.name in row for row in rows)
+        ]
+
+        # First reserve one ID per row from the exercises sequence
+        ids = list(
+            db.scalars(
+                select(
+                    func.nextval(func.pg_get_serial_sequence("exercises", "id"))
+                ).select_from(func.generate_series(1, len(rows)))
+            )
+        )
+
+        buffer = io.StringIO()
+        for exercise_id, row in zip(ids, rows):
+            values = [exercise_id] + [row.get(name) for name in columns[1:]]
+            buffer.write(",".join(_csv_field(value) for value in values) + "\n")
+        buffer.seek(0)
+
+        # The raw connection shares the session's transaction
+        cursor = db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY exercises ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+                buffer,
+            )
+        finally:
+            cursor.close()
+
+        return list(
+            db.scalars(
+                select(Exercise).where(Exercise.id.in_(ids)).order_by(Exercise.id)
+            )
+        )
+
     @staticmethod
     def get_exercise(db: Session, exercise_id: int) -> Optional[Exercise]:
         """Get exercise by ID.
 
+        The parent day is joined in the same SELECT so ownership checks on
+        ``exercise.day.user_id`` don't trigger a second lazy-load query.
+
         Args:
             db: Database session
             exercise_id: Exercise ID
@@ -45,7 +174,12 @@ class ExerciseService:
         Returns:
             Exercise object or None if not found
         """
-        return db.query(Exercise).filter(Exercise.id == exercise_id).first()
+        return (
+            db.query(Exercise)
+            .options(joinedload(Exercise.day))
+            .filter(Exercise.id == exercise_id)
+            .first()
+        )
 
     @staticmethod
     def get_exercises_by_day(db: Session, day_id: int) -> List[Exercise]:
@@ -66,25 +200,38 @@ class ExerciseService:
         )
 
     @staticmethod
-    def update_exercise(db: Session, exercise_id: int, **kwargs) -> Exercise:
+    def exercise_exists(db: Session, exercise_id: int) -> bool:
+        """Check whether an exercise exists regardless of its owner.
+
+        Args:
+            db: Database session
+            exercise_id: Exercise ID
+
+        Returns:
+            True if the exercise exists, False otherwise
+        """
+        return db.query(Exercise.id).filter(Exercise.id == exercise_id).first() is not None
+
+    @staticmethod
+    def update_exercise(
+        db: Session, exercise_id: int, user_id: int, **kwargs
+    ) -> Optional[Exercise]:
         """Update exercise fields.
 
+        Ownership (through the parent day) is enforced in the UPDATE's WHERE
+        clause and the new row is returned by the same statement.
+
         Args:
             db: Database session
             exercise_id: Exercise ID
+            user_id: ID of the user that must own the exercise's day
             **kwargs: Fields to update (type, name, start_time, duration, distance,
                       calories_burned, heart_rate_avg, heart_rate_max, intensity, notes)
 
         Returns:
-            Updated Exercise object
-
-        Raises:
-            ValueError: If exercise not found
+            Updated Exercise object or None if no such exercise belongs to the user
         """
-        exercise = db.query(Exercise).filter(Exercise.id == exercise_id).first()
-
-        if not exercise:
-            raise ValueError(f"Exercise with id {exercise_id} not found")
+        owned = and_(Exercise.id == exercise_id, Exercise.day.has(Day.user_id == user_id))
 
         # Update allowed fields
         allowed_fields = {
@@ -99,30 +246,43 @@ class ExerciseService:
             "intensity",
             "notes",
         }
-        for field, value in kwargs.items():
-            if field in allowed_fields:
-                setattr(exercise, field, value)
+        values = {field: value for field, value in kwargs.items() if field in allowed_fields}
 
-        db.commit()
-        db.refresh(exercise)
+        if not values:
+            return db.query(Exercise).filter(owned).first()
+
+        stmt = (
+            update(Exercise)
+            .where(owned)
+            .values(**values)
+            .returning(Exercise)
+            .execution_options(synchronize_session=False)
+        )
+        exercise = db.execute(stmt).scalar_one_or_none()
+        commit_returning(db, exercise)
         return exercise
 
     @staticmethod
-    def delete_exercise(db: Session, exercise_id: int) -> bool:
-        """Delete exercise.
+    def delete_exercise(db: Session, exercise_id: int, user_id: int) -> bool:
+        """Delete exercise if its day belongs to the user.
+
+        Runs as a single DELETE ... RETURNING with ownership in the WHERE
+        clause; exercise sets are removed by the ON DELETE CASCADE foreign key.
 
         Args:
             db: Database session
             exercise_id: Exercise ID
+            user_id: ID of the user who must own the exercise's day
 
         Returns:
-            True if deleted, False if not found
+            True if deleted, False if not found or owned by another user
         """
-        exercise = db.query(Exercise).filter(Exercise.id == exercise_id).first()
-
-        if not exercise:
-            return False
-
-        db.delete(exercise)
+        stmt = (
+            delete(Exercise)
+            .where(Exercise.id == exercise_id, Exercise.day.has(Day.user_id == user_id))
+            .returning(Exercise.id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = db.execute(stmt).first()
         db.commit()
-        return True
+        return deleted is not None
@@ -3,8 +3,10 @@
 from datetime import datetime
 from typing import List, Optional
 
+from sqlalchemy import and_, case, delete, update
 from sqlalchemy.orm import Session
 
+from app.core.database import commit_returning
 from app.models.goal import Goal
 
 
@@ -52,7 +54,7 @@ class GoalService:
         Returns:
             Goal object or None if not found
         """
-        return db.query(Goal).filter(Goal.id == goal_id).first()
+        return db.get(Goal, goal_id)
 
     @staticmethod
     def get_user_goals(
@@ -76,31 +78,36 @@ class GoalService:
         return query.order_by(Goal.created_at.desc()).all()
 
     @staticmethod
-    def update_goal(db: Session, goal_id: int, **kwargs) -> Goal:
+    def goal_exists(db: Session, goal_id: int) -> bool:
+        """Check whether a goal exists regardless of its owner.
+
+        Args:
+            db: Database session
+            goal_id: Goal ID
+
+        Returns:
+            True if the goal exists, False otherwise
+        """
+        return db.query(Goal.id).filter(Goal.id == goal_id).first() is not None
+
+    @staticmethod
+    def update_goal(db: Session, goal_id: int, user_id: int, **kwargs) -> Optional[Goal]:
         """Update goal with field validation.
 
+        Ownership is enforced in the UPDATE's WHERE clause and the new row is
+        returned by the same statement, so no prior SELECT is issued.
+
         Args:
             db: Database session
             goal_id: Goal ID
+            user_id: ID of the user that must own the goal
             **kwargs: Fields to update (type, title, description, target_value,
                      current_value, unit, start_date, end_date, status)
 
         Returns:
-            Updated Goal object
-
-        Raises:
-            ValueError: If goal not found
+            Updated Goal object or None if no such goal belongs to the user
         """
-        goal = db.query(Goal).filter(Goal.id == goal_id).first()
-
-        if not goal:
-            raise ValueError(f"Goal with id {goal_id} not found")
-
-        # Track if status is being changed to completed
-        status_changed_to_completed = False
-        if "status" in kwargs and kwargs["status"] == "completed":
-            if goal.status != "completed":
-                status_changed_to_completed = True
+        owned = and_(Goal.id == goal_id, Goal.user_id == user_id)
 
         # Update allowed fields
         allowed_fields = {
@@ -114,34 +121,47 @@ class GoalService:
             "end_date",
             "status",
         }
-        for field, value in kwargs.items():
-            if field in allowed_fields:
-                setattr(goal, field, value)
+        values = {field: value for field, value in kwargs.items() if field in allowed_fields}
 
-        # Auto-set completed_at when status changes to completed
-        if status_changed_to_completed:
-            goal.completed_at = datetime.utcnow()
+        if not values:
+            return db.query(Goal).filter(owned).first()
 
-        db.commit()
-        db.refresh(goal)
+        # Auto-set completed_at when status changes to completed
+        if values.get("status") == "completed":
+            values["completed_at"] = case(
+                (Goal.status.is_distinct_from("completed"), datetime.utcnow()),
+                else_=Goal.completed_at,
+            )
+
+        stmt = (
+            update(Goal)
+            .where(owned)
+            .values(**values)
+            .returning(Goal)
+            .execution_options(synchronize_session=False)
+        )
+        goal = db.execute(stmt).scalar_one_or_none()
+        commit_returning(db, goal)
         return goal
 
     @staticmethod
-    def delete_goal(db: Session, goal_id: int) -> bool:
-        """Delete goal.
+    def delete_goal(db: Session, goal_id: int, user_id: int) -> bool:
+        """Delete goal if it belongs to the user.
 
         Args:
             db: Database session
             goal_id: Goal ID
+            user_id: ID of the user who must own the goal
 
         Returns:
-            True if deleted, False if not found
+            True if deleted, False if not found or owned by another user
         """
-        goal = db.query(Goal).filter(Goal.id == goal_id).first()
-
-        if not goal:
-            return False
-
-        db.delete(goal)
+        stmt = (
+            delete(Goal)
+            .where(Goal.id == goal_id, Goal.user_id == user_id)
+            .returning(Goal.id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = db.execute(stmt).first()
         db.commit()
-        return True
+        return deleted is not None
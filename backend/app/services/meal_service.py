@@ -2,25 +2,37 @@
 
 from typing import List, Optional
 
+from sqlalchemy import and_, delete, update
 from sqlalchemy.orm import Session
 
+from app.core.database import commit_returning
+from app.models.day import Day
 from app.models.meal import Meal
+from app.services.day_service import DayService
 
 
 class MealService:
     """Service for meal operations."""
 
     @staticmethod
-    def create_meal(db: Session, day_id: int, meal_data: dict) -> Meal:
-        """Create new meal for a day.
+    def create_meal(
+        db: Session, day_id: int, user_id: int, meal_data: dict
+    ) -> Optional[Meal]:
+        """Create new meal for a day owned by the user.
+
+        The ownership check and the insert run as a single
+        INSERT ... SELECT ... RETURNING statement, so no row is written
+        unless the day belongs to the user.
 
         Args:
             db: Database session
             day_id: Day ID to associate meal with
+            user_id: ID of the user who must own the day
             meal_data: Dictionary containing meal fields
 
         Returns:
-            Newly created Meal object
+            Newly created Meal object, or None if the day does not exist or
+            belongs to another user
 
         Raises:
             ValueError: If required fields are missing
@@ -28,10 +40,9 @@ class MealService:
         if "category" not in meal_data:
             raise ValueError("Meal category is required")
 
-        new_meal = Meal(day_id=day_id, **meal_data)
-        db.add(new_meal)
-        db.commit()
-        db.refresh(new_meal)
+        stmt = DayService.insert_for_owned_day(Meal, day_id, user_id, meal_data)
+        new_meal = db.execute(stmt).scalar_one_or_none()
+        commit_returning(db, new_meal)
         return new_meal
 
     @staticmethod
@@ -45,7 +56,41 @@ class MealService:
         Returns:
             Meal object or None if not found
         """
-        return db.query(Meal).filter(Meal.id == meal_id).first()
+        return db.get(Meal, meal_id)
+
+    @staticmethod
+    def get_user_meal(db: Session, meal_id: int, user_id: int) -> Optional[Meal]:
+        """Get meal by ID if its day belongs to the user.
+
+        Ownership is checked in the same SELECT through a join on days.
+
+        Args:
+            db: Database session
+            meal_id: Meal ID
+            user_id: ID of the user who must own the meal's day
+
+        Returns:
+            Meal object or None if not found or owned by another user
+        """
+        return (
+            db.query(Meal)
+            .join(Day, Meal.day_id == Day.id)
+            .filter(Meal.id == meal_id, Day.user_id == user_id)
+            .first()
+        )
+
+    @staticmethod
+    def meal_exists(db: Session, meal_id: int) -> bool:
+        """Check whether a meal exists regardless of its owner.
+
+        Args:
+            db: Database session
+            meal_id: Meal ID
+
+        Returns:
+            True if the meal exists, False otherwise
+        """
+        return db.query(Meal.id).filter(Meal.id == meal_id).first() is not None
 
     @staticmethod
     def get_meals_by_day(db: Session, day_id: int) -> List[Meal]:
@@ -66,25 +111,23 @@ class MealService:
         )
 
     @staticmethod
-    def update_meal(db: Session, meal_id: int, **kwargs) -> Meal:
+    def update_meal(db: Session, meal_id: int, user_id: int, **kwargs) -> Optional[Meal]:
         """Update meal with field validation.
 
+        Ownership (through the parent day) is enforced in the UPDATE's WHERE
+        clause and the new row is returned by the same statement.
+
         Args:
             db: Database session
             meal_id: Meal ID
+            user_id: ID of the user who must own the meal's day
             **kwargs: Fields to update (category, time, calories, protein, carbs,
                      fat, fiber, sugar, sodium, notes, photo_url)
 
         Returns:
-            Updated Meal object
-
-        Raises:
-            ValueError: If meal not found
+            Updated Meal object or None if no such meal belongs to the user
         """
-        meal = db.query(Meal).filter(Meal.id == meal_id).first()
-
-        if not meal:
-            raise ValueError(f"Meal with id {meal_id} not found")
+        owned = and_(Meal.id == meal_id, Meal.day.has(Day.user_id == user_id))
 
         # Update allowed fields
         allowed_fields = {
@@ -100,30 +143,43 @@ class MealService:
             "notes",
             "photo_url",
         }
-        for field, value in kwargs.items():
-            if field in allowed_fields:
-                setattr(meal, field, value)
+        values = {field: value for field, value in kwargs.items() if field in allowed_fields}
 
-        db.commit()
-        db.refresh(meal)
+        if not values:
+            return db.query(Meal).filter(owned).first()
+
+        stmt = (
+            update(Meal)
+            .where(owned)
+            .values(**values)
+            .returning(Meal)
+            .execution_options(synchronize_session=False)
+        )
+        meal = db.execute(stmt).scalar_one_or_none()
+        commit_returning(db, meal)
         return meal
 
     @staticmethod
-    def delete_meal(db: Session, meal_id: int) -> bool:
-        """Delete meal.
+    def delete_meal(db: Session, meal_id: int, user_id: int) -> bool:
+        """Delete meal if its day belongs to the user.
+
+        Runs as a single DELETE ... RETURNING with ownership in the WHERE
+        clause; meal items are removed by the ON DELETE CASCADE foreign key.
 
         Args:
             db: Database session
             meal_id: Meal ID
+            user_id: ID of the user who must own the meal's day
 
         Returns:
-            True if deleted, False if not found
+            True if deleted, False if not found or owned by another user
         """
-        meal = db.query(Meal).filter(Meal.id == meal_id).first()
-
-        if not meal:
-            return False
-
-        db.delete(meal)
+        stmt = (
+            delete(Meal)
+            .where(Meal.id == meal_id, Meal.day.has(Day.user_id == user_id))
+            .returning(Meal.id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = db.execute(stmt).first()
         db.commit()
-        return True
+        return deleted is not None
@@ -2,25 +2,46 @@
 
 from typing import List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, bindparam, delete, exists, select, update
+from sqlalchemy.orm import Session, joinedload, raiseload
 
+from app.core.database import commit_returning
+from app.models.day import Day
 from app.models.mood_record import MoodRecord
+from app.services.day_service import DayService
+
+# Lookups by primary key are built once with bound parameters so each call
+# reuses the statement and its cached compiled form
+_MOOD_WITH_DAY = (
+    select(MoodRecord)
+    .options(joinedload(MoodRecord.day))
+    .where(MoodRecord.id == bindparam("mood_id"))
+)
+_MOOD_EXISTS = select(exists().where(MoodRecord.id == bindparam("mood_id")))
 
 
 class MoodService:
     """Service for mood operations."""
 
     @staticmethod
-    def create_mood(db: Session, day_id: int, mood_data: dict) -> MoodRecord:
-        """Create new mood record for a day.
+    def create_mood(
+        db: Session, day_id: int, user_id: int, mood_data: dict
+    ) -> Optional[MoodRecord]:
+        """Create new mood record for a day owned by the user.
+
+        The ownership check and the insert run as a single
+        INSERT ... SELECT ... RETURNING statement, so no row is written
+        unless the day belongs to the user.
 
         Args:
             db: Database session
             day_id: Day ID to associate mood record with
+            user_id: ID of the user who must own the day
             mood_data: Dictionary containing mood fields
 
         Returns:
-            Newly created MoodRecord object
+            Newly created MoodRecord object, or None if the day does not
+            exist or belongs to another user
 
         Raises:
             ValueError: If required fields are missing
@@ -28,16 +49,18 @@ class MoodService:
         if "rating" not in mood_data:
             raise ValueError("Mood rating is required")
 
-        new_mood = MoodRecord(day_id=day_id, **mood_data)
-        db.add(new_mood)
-        db.commit()
-        db.refresh(new_mood)
+        stmt = DayService.insert_for_owned_day(MoodRecord, day_id, user_id, mood_data)
+        new_mood = db.execute(stmt).scalar_one_or_none()
+        commit_returning(db, new_mood)
         return new_mood
 
     @staticmethod
     def get_mood(db: Session, mood_id: int) -> Optional[MoodRecord]:
         """Get mood record by ID.
 
+        The parent day is joined in the same SELECT so ownership checks on
+        ``mood.day.user_id`` don't trigger a second lazy-load query.
+
         Args:
             db: Database session
             mood_id: Mood record ID
@@ -45,12 +68,15 @@ class MoodService:
         Returns:
             MoodRecord object or None if not found
         """
-        return db.query(MoodRecord).filter(MoodRecord.id == mood_id).first()
+        return db.execute(_MOOD_WITH_DAY, {"mood_id": mood_id}).scalar_one_or_none()
 
     @staticmethod
     def get_moods_by_day(db: Session, day_id: int) -> List[MoodRecord]:
         """Get all mood records for a specific day.
 
+        Relationships are never loaded for the list; responses only carry
+        the record's own columns.
+
         Args:
             db: Database session
             day_id: Day ID
@@ -60,31 +86,32 @@ class MoodService:
         """
         return (
             db.query(MoodRecord)
+            .options(raiseload("*"))
             .filter(MoodRecord.day_id == day_id)
             .order_by(MoodRecord.time.asc())
             .all()
         )
 
     @staticmethod
-    def update_mood(db: Session, mood_id: int, **kwargs) -> MoodRecord:
-        """Update mood record with field validation.
+    def update_mood(
+        db: Session, mood_id: int, user_id: int, **kwargs
+    ) -> Optional[MoodRecord]:
+        """Update mood record fields.
+
+        Ownership (through the parent day) is enforced in the UPDATE's WHERE
+        clause and the new row is returned by the same statement.
 
         Args:
             db: Database session
             mood_id: Mood record ID
+            user_id: ID of the user that must own the mood record's day
             **kwargs: Fields to update (time, rating, energy_level, stress_level,
-                     anxiety_level, tags, notes, ai_sentiment, ai_suggestions)
+                      anxiety_level, tags, notes, ai_sentiment, ai_suggestions)
 
         Returns:
-            Updated MoodRecord object
-
-        Raises:
-            ValueError: If mood record not found
+            Updated MoodRecord object or None if no such mood record belongs to the user
         """
-        mood = db.query(MoodRecord).filter(MoodRecord.id == mood_id).first()
-
-        if not mood:
-            raise ValueError(f"Mood record with id {mood_id} not found")
+        owned = and_(MoodRecord.id == mood_id, MoodRecord.day.has(Day.user_id == user_id))
 
         # Update allowed fields
         allowed_fields = {
@@ -98,30 +125,79 @@ class MoodService:
             "ai_sentiment",
             "ai_suggestions",
         }
-        for field, value in kwargs.items():
-            if field in allowed_fields:
-                setattr(mood, field, value)
+        values = {field: value for field, value in kwargs.items() if field in allowed_fields}
 
-        db.commit()
-        db.refresh(mood)
+        if not values:
+            return db.query(MoodRecord).filter(owned).first()
+
+        stmt = (
+            update(MoodRecord)
+            .where(owned)
+            .values(**values)
+            .returning(MoodRecord)
+            .execution_options(synchronize_session=False)
+        )
+        mood = db.execute(stmt).scalar_one_or_none()
+        commit_returning(db, mood)
         return mood
 
     @staticmethod
-    def delete_mood(db: Session, mood_id: int) -> bool:
-        """Delete mood record.
+    def mood_exists(db: Session, mood_id: int) -> bool:
+        """Check whether a mood record exists regardless of its owner.
 
         Args:
             db: Database session
             mood_id: Mood record ID
 
         Returns:
-            True if deleted, False if not found
+            True if the mood record exists, False otherwise
         """
-        mood = db.query(MoodRecord).filter(MoodRecord.id == mood_id).first()
+        return db.scalar(_MOOD_EXISTS, {"mood_id": mood_id})
+
+    @staticmethod
+    def delete_mood(db: Session, mood_id: int, user_id: int) -> bool:
+        """Delete mood record if its day belongs to the user.
 
-        if not mood:
-            return False
+        Runs as a single DELETE ... RETURNING with ownership in the WHERE
+        clause.
 
-        db.delete(mood)
+        Args:
+            db: Database session
+            mood_id: Mood record ID
+            user_id: ID of the user who must own the mood record's day
+
+        Returns:
+            True if deleted, False if not found or owned by another user
+        """
+        stmt = (
+            delete(MoodRecord)
+            .where(MoodRecord.id == mood_id, MoodRecord.day.has(Day.user_id == user_id))
+            .returning(MoodRecord.id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = db.execute(stmt).first()
+        db.commit()
+        return deleted is not None
+
+    @staticmethod
+    def delete_moods_by_day(db: Session, day_id: int, user_id: int) -> int:
+        """Delete all mood records of a day owned by the user.
+
+        Runs as a single DELETE with ownership in the WHERE clause.
+
+        Args:
+            db: Database session
+            day_id: Day ID
+            user_id: ID of the user who must own the day
+
+        Returns:
+            Number of deleted mood records
+        """
+        stmt = (
+            delete(MoodRecord)
+            .where(MoodRecord.day_id == day_id, MoodRecord.day.has(Day.user_id == user_id))
+            .execution_options(synchronize_session=False)
+        )
+        result = db.execute(stmt)
         db.commit()
-        return True
+        return result.rowcount
@@ -2,25 +2,46 @@
 
 from typing import List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, bindparam, delete, exists, select, update
+from sqlalchemy.orm import Session, joinedload, raiseload
 
+from app.core.database import commit_returning
+from app.models.day import Day
 from app.models.note import Note
+from app.services.day_service import DayService
+
+# Lookups by primary key are built once with bound parameters so each call
+# reuses the statement and its cached compiled form
+_NOTE_WITH_DAY = (
+    select(Note)
+    .options(joinedload(Note.day))
+    .where(Note.id == bindparam("note_id"))
+)
+_NOTE_EXISTS = select(exists().where(Note.id == bindparam("note_id")))
 
 
 class NoteService:
     """Service for note operations."""
 
     @staticmethod
-    def create_note(db: Session, day_id: int, note_data: dict) -> Note:
-        """Create new note for a day.
+    def create_note(
+        db: Session, day_id: int, user_id: int, note_data: dict
+    ) -> Optional[Note]:
+        """Create new note for a day owned by the user.
+
+        The ownership check and the insert run as a single
+        INSERT ... SELECT ... RETURNING statement, so no row is written
+        unless the day belongs to the user.
 
         Args:
             db: Database session
             day_id: Day ID to associate note with
+            user_id: ID of the user who must own the day
             note_data: Dictionary containing note fields
 
         Returns:
-            Newly created Note object
+            Newly created Note object, or None if the day does not
+            exist or belongs to another user
 
         Raises:
             ValueError: If required fields are missing
@@ -28,16 +49,18 @@ class NoteService:
         if "content" not in note_data:
             raise ValueError("Note content is required")
 
-        new_note = Note(day_id=day_id, **note_data)
-        db.add(new_note)
-        db.commit()
-        db.refresh(new_note)
+        stmt = DayService.insert_for_owned_day(Note, day_id, user_id, note_data)
+        new_note = db.execute(stmt).scalar_one_or_none()
+        commit_returning(db, new_note)
         return new_note
 
     @staticmethod
     def get_note(db: Session, note_id: int) -> Optional[Note]:
         """Get note by ID.
 
+        The parent day is joined in the same SELECT so ownership checks on
+        ``note.day.user_id`` don't trigger a second lazy-load query.
+
         Args:
             db: Database session
             note_id: Note ID
@@ -45,12 +68,15 @@ class NoteService:
         Returns:
             Note object or None if not found
         """
-        return db.query(Note).filter(Note.id == note_id).first()
+        return db.execute(_NOTE_WITH_DAY, {"note_id": note_id}).scalar_one_or_none()
 
     @staticmethod
     def get_notes_by_day(db: Session, day_id: int) -> List[Note]:
         """Get all notes for a specific day.
 
+        Relationships are never loaded for the list; responses only carry
+        the record's own columns.
+
         Args:
             db: Database session
             day_id: Day ID
@@ -60,30 +86,31 @@ class NoteService:
         """
         return (
             db.query(Note)
+            .options(raiseload("*"))
             .filter(Note.day_id == day_id)
             .order_by(Note.created_at.desc())
             .all()
         )
 
     @staticmethod
-    def update_note(db: Session, note_id: int, **kwargs) -> Note:
-        """Update note with field validation.
+    def update_note(
+        db: Session, note_id: int, user_id: int, **kwargs
+    ) -> Optional[Note]:
+        """Update note fields.
+
+        Ownership (through the parent day) is enforced in the UPDATE's WHERE
+        clause and the new row is returned by the same statement.
 
         Args:
             db: Database session
             note_id: Note ID
+            user_id: ID of the user that must own the note's day
             **kwargs: Fields to update (title, content, tags, attachments)
 
         Returns:
-            Updated Note object
-
-        Raises:
-            ValueError: If note not found
+            Updated Note object or None if no such note belongs to the user
         """
-        note = db.query(Note).filter(Note.id == note_id).first()
-
-        if not note:
-            raise ValueError(f"Note with id {note_id} not found")
+        owned = and_(Note.id == note_id, Note.day.has(Day.user_id == user_id))
 
         # Update allowed fields
         allowed_fields = {
@@ -92,30 +119,79 @@ class NoteService:
             "tags",
             "attachments",
         }
-        for field, value in kwargs.items():
-            if field in allowed_fields:
-                setattr(note, field, value)
+        values = {field: value for field, value in kwargs.items() if field in allowed_fields}
 
-        db.commit()
-        db.refresh(note)
+        if not values:
+            return db.query(Note).filter(owned).first()
+
+        stmt = (
+            update(Note)
+            .where(owned)
+            .values(**values)
+            .returning(Note)
+            .execution_options(synchronize_session=False)
+        )
+        note = db.execute(stmt).scalar_one_or_none()
+        commit_returning(db, note)
         return note
 
     @staticmethod
-    def delete_note(db: Session, note_id: int) -> bool:
-        """Delete note.
+    def note_exists(db: Session, note_id: int) -> bool:
+        """Check whether a note exists regardless of its owner.
 
         Args:
             db: Database session
             note_id: Note ID
 
         Returns:
-            True if deleted, False if not found
+            True if the note exists, False otherwise
         """
-        note = db.query(Note).filter(Note.id == note_id).first()
+        return db.scalar(_NOTE_EXISTS, {"note_id": note_id})
+
+    @staticmethod
+    def delete_note(db: Session, note_id: int, user_id: int) -> bool:
+        """Delete note if its day belongs to the user.
 
-        if not note:
-            return False
+        Runs as a single DELETE ... RETURNING with ownership in the WHERE
+        clause.
 
-        db.delete(note)
+        Args:
+            db: Database session
+            note_id: Note ID
+            user_id: ID of the user who must own the note's day
+
+        Returns:
+            True if deleted, False if not found or owned by another user
+        """
+        stmt = (
+            delete(Note)
+            .where(Note.id == note_id, Note.day.has(Day.user_id == user_id))
+            .returning(Note.id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = db.execute(stmt).first()
+        db.commit()
+        return deleted is not None
+
+    @staticmethod
+    def delete_notes_by_day(db: Session, day_id: int, user_id: int) -> int:
+        """Delete all notes of a day owned by the user.
+
+        Runs as a single DELETE with ownership in the WHERE clause.
+
+        Args:
+            db: Database session
+            day_id: Day ID
+            user_id: ID of the user who must own the day
+
+        Returns:
+            Number of deleted notes
+        """
+        stmt = (
+            delete(Note)
+            .where(Note.day_id == day_id, Note.day.has(Day.user_id == user_id))
+            .execution_options(synchronize_session=False)
+        )
+        result = db.execute(stmt)
         db.commit()
-        return True
+        return result.rowcount
@@ -3,8 +3,10 @@
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, update
+from sqlalchemy.orm import Session, raiseload
 
+from app.core.cache import invalidate_notifications
 from app.models.notification import Notification
 
 
@@ -35,6 +37,7 @@ class NotificationService:
         db.add(new_notification)
         db.commit()
         db.refresh(new_notification)
+        invalidate_notifications(user_id)
         return new_notification
 
     @staticmethod
@@ -48,7 +51,7 @@ class NotificationService:
         Returns:
             Notification object or None if not found
         """
-        return db.query(Notification).filter(Notification.id == notification_id).first()
+        return db.get(Notification, notification_id)
 
     @staticmethod
     def get_user_notifications(
@@ -56,6 +59,9 @@ class NotificationService:
     ) -> List[Notification]:
         """Get all notifications for a specific user.
 
+        Relationships are never loaded for the list; responses only carry
+        the notification's own columns.
+
         Args:
             db: Database session
             user_id: User ID
@@ -64,7 +70,11 @@ class NotificationService:
         Returns:
             List of Notification objects ordered by created_at desc
         """
-        query = db.query(Notification).filter(Notification.user_id == user_id)
+        query = (
+            db.query(Notification)
+            .options(raiseload("*"))
+            .filter(Notification.user_id == user_id)
+        )
 
         if unread_only:
             query = query.filter(Notification.is_read == False)
@@ -72,30 +82,38 @@ class NotificationService:
         return query.order_by(Notification.created_at.desc()).all()
 
     @staticmethod
-    def mark_as_read(db: Session, notification_id: int) -> Notification:
-        """Mark notification as read.
+    def mark_as_read(db: Session, user_id: int, notification_ids: List[int]) -> List[int]:
+        """Mark several notifications of a user as read in one statement.
+
+        Only unread notifications are touched, so repeating the call is a
+        no-op and keeps the original read_at. IDs that don't exist or belong
+        to another user are skipped.
 
         Args:
             db: Database session
-            notification_id: Notification ID
+            user_id: Owner user ID
+            notification_ids: Notification IDs to mark as read
 
         Returns:
-            Updated Notification object
-
-        Raises:
-            ValueError: If notification not found
+            IDs of the notifications that were changed by this call
         """
-        notification = db.query(Notification).filter(Notification.id == notification_id).first()
-
-        if not notification:
-            raise ValueError(f"Notification with id {notification_id} not found")
-
-        notification.is_read = True
-        notification.read_at = datetime.utcnow()
-
+        stmt = (
+            update(Notification)
+            .where(
+                Notification.id.in_(notification_ids),
+                Notification.user_id == user_id,
+                Notification.is_read == False,
+            )
+            .values(is_read=True, read_at=datetime.utcnow())
+            .returning(Notification.id)
+            .execution_options(synchronize_session=False)
+        )
+        updated_ids = list(db.execute(stmt).scalars())
         db.commit()
-        db.refresh(notification)
-        return notification
+
+        if updated_ids:
+            invalidate_notifications(user_id)
+        return updated_ids
 
     @staticmethod
     def delete_notification(db: Session, notification_id: int) -> bool:
@@ -108,11 +126,36 @@ class NotificationService:
         Returns:
             True if deleted, False if not found
         """
-        notification = db.query(Notification).filter(Notification.id == notification_id).first()
+        notification = db.get(Notification, notification_id)
 
         if not notification:
             return False
 
         db.delete(notification)
         db.commit()
+        invalidate_notifications(notification.user_id)
         return True
+
+    @staticmethod
+    def delete_notifications(db: Session, user_id: int, notification_ids: List[int]) -> int:
+        """Delete several notifications of a user in one statement.
+
+        IDs that don't exist or belong to another user are skipped.
+
+        Args:
+            db: Database session
+            user_id: Owner user ID
+            notification_ids: Notification IDs to delete
+
+        Returns:
+            Number of deleted notifications
+        """
+        stmt = (
+            delete(Notification)
+            .where(Notification.id.in_(notification_ids), Notification.user_id == user_id)
+            .execution_options(synchronize_session=False)
+        )
+        result = db.execute(stmt)
+        db.commit()
+        invalidate_notifications(user_id)
+        return result.rowcount
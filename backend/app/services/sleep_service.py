@@ -2,39 +2,62 @@
 
 from typing import List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, bindparam, delete, exists, select, update
+from sqlalchemy.orm import Session, joinedload, raiseload
 
+from app.core.database import commit_returning
+from app.models.day import Day
 from app.models.sleep_record import SleepRecord
+from app.services.day_service import DayService
+
+# Lookups by primary key are built once with bound parameters so each call
+# reuses the statement and its cached compiled form
+_SLEEP_WITH_DAY = (
+    select(SleepRecord)
+    .options(joinedload(SleepRecord.day))
+    .where(SleepRecord.id == bindparam("sleep_id"))
+)
+_SLEEP_EXISTS = select(exists().where(SleepRecord.id == bindparam("sleep_id")))
 
 
 class SleepService:
     """Service for sleep operations."""
 
     @staticmethod
-    def create_sleep(db: Session, day_id: int, sleep_data: dict) -> SleepRecord:
-        """Create new sleep record for a day.
+    def create_sleep(
+        db: Session, day_id: int, user_id: int, sleep_data: dict
+    ) -> Optional[SleepRecord]:
+        """Create new sleep record for a day owned by the user.
+
+        The ownership check and the insert run as a single
+        INSERT ... SELECT ... RETURNING statement, so no row is written
+        unless the day belongs to the user.
 
         Args:
             db: Database session
             day_id: Day ID to associate sleep record with
+            user_id: ID of the user who must own the day
             sleep_data: Dictionary containing sleep record fields
 
         Returns:
-            Newly created SleepRecord object
+            Newly created SleepRecord object, or None if the day does not
+            exist or belongs to another user
 
         Raises:
             ValueError: If required fields are missing
         """
-        new_sleep = SleepRecord(day_id=day_id, **sleep_data)
-        db.add(new_sleep)
-        db.commit()
-        db.refresh(new_sleep)
+        stmt = DayService.insert_for_owned_day(SleepRecord, day_id, user_id, sleep_data)
+        new_sleep = db.execute(stmt).scalar_one_or_none()
+        commit_returning(db, new_sleep)
         return new_sleep
 
     @staticmethod
     def get_sleep(db: Session, sleep_id: int) -> Optional[SleepRecord]:
         """Get sleep record by ID.
 
+        The parent day is joined in the same SELECT so ownership checks on
+        ``sleep.day.user_id`` don't trigger a second lazy-load query.
+
         Args:
             db: Database session
             sleep_id: Sleep record ID
@@ -42,12 +65,15 @@ class SleepService:
         Returns:
             SleepRecord object or None if not found
         """
-        return db.query(SleepRecord).filter(SleepRecord.id == sleep_id).first()
+        return db.execute(_SLEEP_WITH_DAY, {"sleep_id": sleep_id}).scalar_one_or_none()
 
     @staticmethod
     def get_sleep_by_day(db: Session, day_id: int) -> List[SleepRecord]:
         """Get all sleep records for a specific day.
 
+        Relationships are never loaded for the list; responses only carry
+        the record's own columns.
+
         Args:
             db: Database session
             day_id: Day ID
@@ -57,31 +83,32 @@ class SleepService:
         """
         return (
             db.query(SleepRecord)
+            .options(raiseload("*"))
             .filter(SleepRecord.day_id == day_id)
             .order_by(SleepRecord.bedtime.asc().nullslast())
             .all()
         )
 
     @staticmethod
-    def update_sleep(db: Session, sleep_id: int, **kwargs) -> SleepRecord:
-        """Update sleep record with field validation.
+    def update_sleep(
+        db: Session, sleep_id: int, user_id: int, **kwargs
+    ) -> Optional[SleepRecord]:
+        """Update sleep record fields.
+
+        Ownership (through the parent day) is enforced in the UPDATE's WHERE
+        clause and the new row is returned by the same statement.
 
         Args:
             db: Database session
             sleep_id: Sleep record ID
+            user_id: ID of the user that must own the sleep record's day
             **kwargs: Fields to update (bedtime, wake_time, duration, quality,
-                     deep_sleep, rem_sleep, interruptions, notes)
+                      deep_sleep, rem_sleep, interruptions, notes)
 
         Returns:
-            Updated SleepRecord object
-
-        Raises:
-            ValueError: If sleep record not found
+            Updated SleepRecord object or None if no such sleep record belongs to the user
         """
-        sleep = db.query(SleepRecord).filter(SleepRecord.id == sleep_id).first()
-
-        if not sleep:
-            raise ValueError(f"Sleep record with id {sleep_id} not found")
+        owned = and_(SleepRecord.id == sleep_id, SleepRecord.day.has(Day.user_id == user_id))
 
         # Update allowed fields
         allowed_fields = {
@@ -94,30 +121,79 @@ class SleepService:
             "interruptions",
             "notes",
         }
-        for field, value in kwargs.items():
-            if field in allowed_fields:
-                setattr(sleep, field, value)
+        values = {field: value for field, value in kwargs.items() if field in allowed_fields}
 
-        db.commit()
-        db.refresh(sleep)
+        if not values:
+            return db.query(SleepRecord).filter(owned).first()
+
+        stmt = (
+            update(SleepRecord)
+            .where(owned)
+            .values(**values)
+            .returning(SleepRecord)
+            .execution_options(synchronize_session=False)
+        )
+        sleep = db.execute(stmt).scalar_one_or_none()
+        commit_returning(db, sleep)
         return sleep
 
     @staticmethod
-    def delete_sleep(db: Session, sleep_id: int) -> bool:
-        """Delete sleep record.
+    def sleep_exists(db: Session, sleep_id: int) -> bool:
+        """Check whether a sleep record exists regardless of its owner.
 
         Args:
             db: Database session
             sleep_id: Sleep record ID
 
         Returns:
-            True if deleted, False if not found
+            True if the sleep record exists, False otherwise
         """
-        sleep = db.query(SleepRecord).filter(SleepRecord.id == sleep_id).first()
+        return db.scalar(_SLEEP_EXISTS, {"sleep_id": sleep_id})
+
+    @staticmethod
+    def delete_sleep(db: Session, sleep_id: int, user_id: int) -> bool:
+        """Delete sleep record if its day belongs to the user.
 
-        if not sleep:
-            return False
+        Runs as a single DELETE ... RETURNING with ownership in the WHERE
+        clause.
 
-        db.delete(sleep)
+        Args:
+            db: Database session
+            sleep_id: Sleep record ID
+            user_id: ID of the user who must own the sleep record's day
+
+        Returns:
+            True if deleted, False if not found or owned by another user
+        """
+        stmt = (
+            delete(SleepRecord)
+            .where(SleepRecord.id == sleep_id, SleepRecord.day.has(Day.user_id == user_id))
+            .returning(SleepRecord.id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = db.execute(stmt).first()
+        db.commit()
+        return deleted is not None
+
+    @staticmethod
+    def delete_sleep_by_day(db: Session, day_id: int, user_id: int) -> int:
+        """Delete all sleep records of a day owned by the user.
+
+        Runs as a single DELETE with ownership in the WHERE clause.
+
+        Args:
+            db: Database session
+            day_id: Day ID
+            user_id: ID of the user who must own the day
+
+        Returns:
+            Number of deleted sleep records
+        """
+        stmt = (
+            delete(SleepRecord)
+            .where(SleepRecord.day_id == day_id, SleepRecord.day.has(Day.user_id == user_id))
+            .execution_options(synchronize_session=False)
+        )
+        result = db.execute(stmt)
         db.commit()
-        return True
+        return result.rowcount
@@ -5,8 +5,18 @@ import logging
 from typing import Any, Dict, List, Optional
 
 from langchain.schema import HumanMessage, SystemMessage
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
+from app.core.cache import (
+    TRAINING_PROGRAM_JOB_TTL,
+    cache_get,
+    cache_set,
+    invalidate_training_programs,
+    training_program_job_key,
+)
+from app.core.database import commit_returning
+from app.models.training_program import TrainingProgram
 from app.models.user import User
 from app.services.llm_service import LLMService
 
@@ -169,9 +179,91 @@ class TrainingProgramService:
                 "error": str(e)
             }
 
+    @staticmethod
+    def save_program(
+        db: Session, user_id: int, params: Dict[str, Any], result: Dict[str, Any]
+    ) -> TrainingProgram:
+        """Store a generated training program.
+
+        The row, including server-generated columns, is read back by the
+        same INSERT ... RETURNING statement.
+
+        Args:
+            db: Database session
+            user_id: Owner user ID
+            params: Generation request fields (name, description, goal,
+                experience_level, days_per_week, equipment)
+            result: Successful result of generate_12week_program
+
+        Returns:
+            Newly created TrainingProgram object
+        """
+        stmt = (
+            insert(TrainingProgram)
+            .values(
+                user_id=user_id,
+                name=params.get("name") or f"{params['goal'].replace('_', ' ').title()} Program",
+                description=params.get("description"),
+                goal=params["goal"],
+                experience_level=params["experience_level"],
+                days_per_week=params["days_per_week"],
+                equipment=params.get("equipment"),
+                program_data=result.get("program", {}),
+                summary=result.get("summary", {}),
+                is_active=1,
+            )
+            .returning(TrainingProgram)
+        )
+        program = db.execute(stmt).scalar_one()
+        commit_returning(db, program)
+        invalidate_training_programs(user_id)
+        return program
+
+    @staticmethod
+    def set_job_state(
+        job_id: str,
+        user_id: int,
+        status: str,
+        program_id: Optional[int] = None,
+        error: Optional[str] = None,
+    ) -> bool:
+        """Record the state of a background generation job.
+
+        Args:
+            job_id: Generation job ID
+            user_id: User who started the job
+            status: "pending", "completed" or "failed"
+            program_id: ID of the stored program once completed
+            error: Error message if the job failed
+
+        Returns:
+            True if the state was recorded, False if Redis was unavailable
+        """
+        state = {
+            "user_id": user_id,
+            "status": status,
+            "program_id": program_id,
+            "error": error,
+        }
+        return cache_set(
+            training_program_job_key(job_id), json.dumps(state), TRAINING_PROGRAM_JOB_TTL
+        )
+
+    @staticmethod
+    def get_job_state(job_id: str) -> Optional[Dict[str, Any]]:
+        """Get the state of a background generation job.
+
+        Args:
+            job_id: Generation job ID
+
+        Returns:
+            Job state dictionary, or None if unknown or expired
+        """
+        cached = cache_get(training_program_job_key(job_id))
+        return json.loads(cached) if cached is not None else None
+
     @staticmethod
     async def stream_program_generation(
-        db: Session,
         user: User,
         goal: str,
         experience_level: str = "beginner",
@@ -180,9 +272,11 @@ class TrainingProgramService:
     ):
         """Stream training program generation in real-time.
 
+        Does not touch the database, so callers can release their session
+        before streaming.
+
         Args:
-            db: Database session
-            user: User instance
+            user: User instance with goals loaded
             goal: Training goal
             experience_level: Fitness level
             days_per_week: Training days per week
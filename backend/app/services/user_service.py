@@ -40,7 +40,7 @@ class UserService:
         Raises:
             ValueError: If user not found or invalid fields provided
         """
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.get(User, user_id)
 
         if not user:
             raise ValueError(f"User with id {user_id} not found")
@@ -97,7 +97,7 @@ class UserService:
         Returns:
             User object or None if not found
         """
-        return db.query(User).filter(User.id == user_id).first()
+        return db.get(User, user_id)
 
     @staticmethod
     def get_user_by_email(db: Session, email: str) -> Optional[User]:
@@ -128,7 +128,7 @@ class UserService:
             True if user was deleted, False if user not found
         """
         # Get the user
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.get(User, user_id)
 
         if not user:
             return False
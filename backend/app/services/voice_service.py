@@ -2,7 +2,7 @@
 
 import base64
 import logging
-from typing import Optional
+from typing import BinaryIO, Optional
 
 from app.config import settings
 
@@ -14,14 +14,17 @@ class VoiceService:
 
     @staticmethod
     def speech_to_text(
-        audio_data: bytes,
+        audio_file: BinaryIO,
         audio_format: str = "webm",
         language: str = "en"
     ) -> dict:
         """Convert speech audio to text using OpenAI Whisper API.
 
+        The file is streamed to the API as it is read, so the upload is never
+        held in memory as a whole.
+
         Args:
-            audio_data: Audio file bytes
+            audio_file: Binary file object positioned at the start of the audio
             audio_format: Audio format (webm, mp3, wav, etc.)
             language: Language code (en, ru, cz, etc.)
 
@@ -46,15 +49,10 @@ class VoiceService:
             from openai import OpenAI
             client = OpenAI(api_key=settings.OPENAI_API_KEY)
 
-            # Create a temporary file-like object
-            import io
-            audio_file = io.BytesIO(audio_data)
-            audio_file.name = f"audio.{audio_format}"
-
-            # Transcribe using Whisper
+            # Transcribe using Whisper; the filename tells it the audio format
             transcript = client.audio.transcriptions.create(
                 model="whisper-1",
-                file=audio_file,
+                file=(f"audio.{audio_format}", audio_file),
                 language=language
             )
 
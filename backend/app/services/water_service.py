@@ -2,36 +2,74 @@
 
 from typing import List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, bindparam, delete, exists, select, update
+from sqlalchemy.orm import Session, joinedload
 
+from app.core.database import commit_returning
+from app.models.day import Day
 from app.models.water_intake import WaterIntake
+from app.services.day_service import DayService
+
+# Lookups by primary key are built once with bound parameters so each call
+# reuses the statement and its cached compiled form
+_WATER_INTAKE_WITH_DAY = (
+    select(WaterIntake)
+    .options(joinedload(WaterIntake.day))
+    .where(WaterIntake.id == bindparam("water_id"))
+)
+_WATER_INTAKE_EXISTS = select(exists().where(WaterIntake.id == bindparam("water_id")))
+_OWNED_WATER_INTAKES_BY_DAY = (
+    select(WaterIntake)
+    .join(WaterIntake.day)
+    .where(WaterIntake.day_id == bindparam("day_id"), Day.user_id == bindparam("user_id"))
+    .order_by(WaterIntake.time)
+)
+_DELETE_OWNED_WATER_INTAKE = (
+    delete(WaterIntake)
+    .where(
+        WaterIntake.id == bindparam("water_id"),
+        WaterIntake.day.has(Day.user_id == bindparam("user_id")),
+    )
+    .returning(WaterIntake.id)
+    .execution_options(synchronize_session=False)
+)
 
 
 class WaterService:
     """Service for water intake operations."""
 
     @staticmethod
-    def create_water_intake(db: Session, day_id: int, water_data: dict) -> WaterIntake:
-        """Create new water intake for a day.
+    def create_water_intake(
+        db: Session, day_id: int, user_id: int, water_data: dict
+    ) -> Optional[WaterIntake]:
+        """Create new water intake for a day owned by the user.
+
+        The ownership check and the insert run as a single
+        INSERT ... SELECT ... RETURNING statement, so no row is written
+        unless the day belongs to the user.
 
         Args:
             db: Database session
             day_id: Day ID
+            user_id: ID of the user who must own the day
             water_data: Dictionary containing water intake data (amount, time)
 
         Returns:
-            Newly created WaterIntake object
+            Newly created WaterIntake object, or None if the day does not
+            exist or belongs to another user
         """
-        water_intake = WaterIntake(day_id=day_id, **water_data)
-        db.add(water_intake)
-        db.commit()
-        db.refresh(water_intake)
+        stmt = DayService.insert_for_owned_day(WaterIntake, day_id, user_id, water_data)
+        water_intake = db.execute(stmt).scalar_one_or_none()
+        commit_returning(db, water_intake)
         return water_intake
 
     @staticmethod
     def get_water_intake(db: Session, water_id: int) -> Optional[WaterIntake]:
         """Get water intake by ID.
 
+        The parent day is joined in the same SELECT so ownership checks on
+        ``water_intake.day.user_id`` don't trigger a second lazy-load query.
+
         Args:
             db: Database session
             water_id: Water intake ID
@@ -39,72 +77,96 @@ class WaterService:
         Returns:
             WaterIntake object or None if not found
         """
-        return db.query(WaterIntake).filter(WaterIntake.id == water_id).first()
+        return db.execute(_WATER_INTAKE_WITH_DAY, {"water_id": water_id}).scalar_one_or_none()
 
     @staticmethod
-    def get_water_intakes_by_day(db: Session, day_id: int) -> List[WaterIntake]:
-        """Get all water intakes for a specific day.
+    def get_water_intakes_by_day(db: Session, day_id: int, user_id: int) -> List[WaterIntake]:
+        """Get all water intakes for a specific day owned by the user.
+
+        Ownership is checked in the same query by joining the parent day, so
+        an empty list means the day has no entries, does not exist or
+        belongs to another user.
 
         Args:
             db: Database session
             day_id: Day ID
+            user_id: ID of the user who must own the day
 
         Returns:
             List of WaterIntake objects ordered by time
         """
-        return (
-            db.query(WaterIntake)
-            .filter(WaterIntake.day_id == day_id)
-            .order_by(WaterIntake.time)
-            .all()
+        return list(
+            db.scalars(_OWNED_WATER_INTAKES_BY_DAY, {"day_id": day_id, "user_id": user_id})
         )
 
     @staticmethod
-    def update_water_intake(db: Session, water_id: int, **kwargs) -> WaterIntake:
+    def update_water_intake(
+        db: Session, water_id: int, user_id: int, **kwargs
+    ) -> Optional[WaterIntake]:
         """Update water intake fields.
 
+        Ownership (through the parent day) is enforced in the UPDATE's WHERE
+        clause and the new row is returned by the same statement.
+
         Args:
             db: Database session
             water_id: Water intake ID
+            user_id: ID of the user that must own the water intake's day
             **kwargs: Fields to update (amount, time)
 
         Returns:
-            Updated WaterIntake object
-
-        Raises:
-            ValueError: If water intake not found
+            Updated WaterIntake object or None if no such water intake belongs to the user
         """
-        water_intake = db.query(WaterIntake).filter(WaterIntake.id == water_id).first()
-
-        if not water_intake:
-            raise ValueError(f"WaterIntake with id {water_id} not found")
+        owned = and_(WaterIntake.id == water_id, WaterIntake.day.has(Day.user_id == user_id))
 
         # Update allowed fields
         allowed_fields = {"amount", "time"}
-        for field, value in kwargs.items():
-            if field in allowed_fields:
-                setattr(water_intake, field, value)
+        values = {field: value for field, value in kwargs.items() if field in allowed_fields}
 
-        db.commit()
-        db.refresh(water_intake)
+        if not values:
+            return db.query(WaterIntake).filter(owned).first()
+
+        stmt = (
+            update(WaterIntake)
+            .where(owned)
+            .values(**values)
+            .returning(WaterIntake)
+            .execution_options(synchronize_session=False)
+        )
+        water_intake = db.execute(stmt).scalar_one_or_none()
+        commit_returning(db, water_intake)
         return water_intake
 
     @staticmethod
-    def delete_water_intake(db: Session, water_id: int) -> bool:
-        """Delete water intake.
+    def water_intake_exists(db: Session, water_id: int) -> bool:
+        """Check whether a water intake exists regardless of its owner.
 
         Args:
             db: Database session
             water_id: Water intake ID
 
         Returns:
-            True if deleted, False if not found
+            True if the water intake exists, False otherwise
         """
-        water_intake = db.query(WaterIntake).filter(WaterIntake.id == water_id).first()
+        return db.scalar(_WATER_INTAKE_EXISTS, {"water_id": water_id})
+
+    @staticmethod
+    def delete_water_intake(db: Session, water_id: int, user_id: int) -> bool:
+        """Delete water intake if its day belongs to the user.
 
-        if not water_intake:
-            return False
+        Runs as a single DELETE ... RETURNING with ownership in the WHERE
+        clause.
 
-        db.delete(water_intake)
+        Args:
+            db: Database session
+            water_id: Water intake ID
+            user_id: ID of the user who must own the water intake's day
+
+        Returns:
+            True if deleted, False if not found or owned by another user
+        """
+        deleted = db.execute(
+            _DELETE_OWNED_WATER_INTAKE, {"water_id": water_id, "user_id": user_id}
+        ).first()
         db.commit()
-        return True
+        return deleted is not None
@@ -0,0 +1,245 @@
+"""Background job worker for FitCoach.
+
+Runs jobs enqueued by the API (see ``app.core.task_queue``) in a separate
+process with a long-lived event loop, so slow vision-model and LLM calls
+don't tie up API workers.
+
+Usage:
+    arq app.worker.WorkerSettings
+"""
+
+import asyncio
+import json
+import logging
+import os
+from typing import Any, Dict, Optional
+
+from arq.connections import RedisSettings
+from arq.worker import func
+
+from app.agents.agents.vision_agent import VisionAgent
+from app.config import settings
+from app.core.cache import (
+    VISION_CACHE_TTL,
+    cache_delete,
+    cache_get,
+    cache_set,
+    meal_cache_key,
+    vision_cache_key,
+)
+from app.core.database import SessionLocal
+from app.core.pubsub import meal_status_channel, publish, training_program_job_channel
+from app.models.meal import Meal
+from app.models.user import User
+from app.services.training_program_service import TrainingProgramService
+
+logger = logging.getLogger(__name__)
+
+# Vision Agent results kept per photo, enough for VisionAgent.replay to
+# write the same meal, totals and items as a full run
+_VISION_CACHED_RESULTS = ("recognized_items", "nutrition_data", "totals", "confidence")
+
+
+def _drop_page_cache(path: str) -> None:
+    """Advise the kernel that a processed photo won't be read again soon.
+
+    Args:
+        path: Photo file path
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+async def process_meal_photo(
+    meal_id: int, photo_path: str, user_id: int, photo_hash: Optional[str] = None
+) -> None:
+    """Process meal photo with Vision Agent.
+
+    When the photo content hash is known, the results of an earlier upload
+    of the same photo are replayed instead of calling the vision model.
+
+    Args:
+        meal_id: ID of the meal to update
+        photo_path: Path to the uploaded photo
+        user_id: User ID for database session
+        photo_hash: Hex digest of the photo content, if computed at upload
+    """
+    db = SessionLocal()
+
+    try:
+        # Get meal and update status to processing
+        meal = db.get(Meal, meal_id)
+        if not meal:
+            return
+
+        meal.photo_processing_status = "processing"
+        db.commit()
+
+        # Initialize Vision Agent
+        vision_agent = VisionAgent(db_session=db, user_id=user_id)
+        input_data = {
+            "photo_path": photo_path,
+            "category": meal.category,
+            "day_id": meal.day_id,
+        }
+
+        # If the same photo was already recognized, repeat that run's write
+        # instead of calling the vision model and nutrition search again
+        cached = cache_get(vision_cache_key(photo_hash)) if photo_hash else None
+        if cached is not None:
+            result = await vision_agent.replay(input_data, json.loads(cached))
+        else:
+            result = await vision_agent.execute(input_data)
+
+            if photo_hash and result.get("success") and result.get("recognized_items"):
+                cache_set(
+                    vision_cache_key(photo_hash),
+                    json.dumps(
+                        {key: result.get(key) for key in _VISION_CACHED_RESULTS},
+                        default=str,
+                    ),
+                    VISION_CACHE_TTL,
+                )
+
+        # Update meal with results
+        if result.get("success"):
+            meal.photo_processing_status = "completed"
+            if result.get("recognized_items"):
+                meal.ai_recognized_items = result["recognized_items"]
+        else:
+            meal.photo_processing_status = "failed"
+            meal.photo_processing_error = result.get("error", "Unknown error")
+
+        db.commit()
+
+    except Exception as e:
+        logger.error(f"Meal photo processing failed for meal {meal_id}: {e}")
+        # Update meal with error
+        db.rollback()
+        meal = db.get(Meal, meal_id)
+        if meal:
+            meal.photo_processing_status = "failed"
+            meal.photo_processing_error = str(e)
+            db.commit()
+    finally:
+        # Drop any detail response cached while the photo was processing
+        cache_delete(meal_cache_key(meal_id, user_id))
+        # Wake up clients long-polling for the result
+        publish(meal_status_channel(meal_id), "done")
+        _drop_page_cache(photo_path)
+        db.close()
+
+
+async def process_meal_photo_job(
+    ctx: Dict[str, Any],
+    meal_id: int,
+    photo_path: str,
+    user_id: int,
+    photo_hash: Optional[str] = None,
+) -> None:
+    """arq entry point for meal photo processing.
+
+    Args:
+        ctx: arq job context
+        meal_id: ID of the meal to update
+        photo_path: Path to the uploaded photo
+        user_id: User ID for database session
+        photo_hash: Hex digest of the photo content
+    """
+    await process_meal_photo(meal_id, photo_path, user_id, photo_hash)
+
+
+async def generate_training_program(job_id: str, user_id: int, params: Dict[str, Any]) -> None:
+    """Generate a training program and store it for the user.
+
+    The job state is updated in Redis and a message is published when the
+    job finishes, for clients waiting on the job status endpoint.
+
+    Args:
+        job_id: Generation job ID
+        user_id: User to generate the program for
+        params: Generation request fields (name, description, goal,
+            experience_level, days_per_week, equipment)
+    """
+    db = SessionLocal()
+
+    try:
+        user = db.get(User, user_id)
+        if not user:
+            TrainingProgramService.set_job_state(job_id, user_id, "failed", error="User not found")
+            return
+
+        # The LLM call is blocking; keep the event loop free for other jobs
+        result = await asyncio.to_thread(
+            TrainingProgramService.generate_12week_program,
+            db=db,
+            user=user,
+            goal=params["goal"],
+            experience_level=params["experience_level"],
+            days_per_week=params["days_per_week"],
+            equipment=params.get("equipment"),
+        )
+
+        if result["success"]:
+            program = TrainingProgramService.save_program(db, user_id, params, result)
+            TrainingProgramService.set_job_state(
+                job_id, user_id, "completed", program_id=program.id
+            )
+        else:
+            TrainingProgramService.set_job_state(
+                job_id,
+                user_id,
+                "failed",
+                error=result.get("error", "Failed to generate training program"),
+            )
+
+    except Exception as e:
+        logger.error(f"Training program generation failed for job {job_id}: {e}")
+        db.rollback()
+        TrainingProgramService.set_job_state(job_id, user_id, "failed", error=str(e))
+    finally:
+        # Wake up clients long-polling for the result
+        publish(training_program_job_channel(job_id), "done")
+        db.close()
+
+
+async def generate_training_program_job(
+    ctx: Dict[str, Any], job_id: str, user_id: int, params: Dict[str, Any]
+) -> None:
+    """arq entry point for training program generation.
+
+    Args:
+        ctx: arq job context
+        job_id: Generation job ID
+        user_id: User to generate the program for
+        params: Generation request fields
+    """
+    await generate_training_program(job_id, user_id, params)
+
+
+class WorkerSettings:
+    """arq worker configuration."""
+
+    functions = [
+        func(process_meal_photo_job, name="process_meal_photo"),
+        func(generate_training_program_job, name="generate_training_program"),
+    ]
+    redis_settings = RedisSettings(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        database=settings.REDIS_DB,
+    )
+    # Vision and LLM calls are network-bound; run several concurrently per worker
+    max_jobs = 4
+    job_timeout = 300
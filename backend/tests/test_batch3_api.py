@@ -306,7 +306,7 @@ class TestGoalsCRUD:
                 assert goal["status"] == "completed"
     
     def test_get_goals_invalid_status_filter(self, auth_headers):
-        """Test invalid status filter returns 400."""
+        """Test invalid status filter returns 422."""
         with httpx.Client() as client:
             response = client.get(
                 f"{API_V1}/goals?status=invalid_status",
@@ -314,7 +314,7 @@ class TestGoalsCRUD:
                 timeout=10.0
             )
             
-            assert response.status_code == 400, f"Should reject invalid status"
+            assert response.status_code == 422, f"Should reject invalid status"
     
     def test_get_specific_goal(self, auth_headers):
         """Test getting specific goal by ID."""
@@ -373,6 +373,30 @@ class TestExerciseCRUDAPI:
             assert verify_response.status_code == 404, "Exercise should be deleted"
             
             print(f"\n✅ Deleted exercise: ID={TestExerciseCRUDAPI.exercise_id}")
+    
+    def test_06_bulk_create_exercises(self, auth_headers, test_day_id):
+        """Test POST /api/v1/days/{day_id}/exercises/bulk - Create several exercises."""
+        exercises_data = [
+            {"type": "gym", "name": f"Set {i}", "duration": 600, "intensity": 3}
+            for i in range(1, 4)
+        ]
+        
+        with httpx.Client() as client:
+            response = client.post(
+                f"{API_V1}/days/{test_day_id}/exercises/bulk",
+                json=exercises_data,
+                headers=auth_headers,
+                timeout=10.0
+            )
+            
+            assert response.status_code == 201, f"Failed to bulk create exercises: {response.text}"
+            data = response.json()
+            
+            assert len(data) == 3, "Should create one exercise per item"
+            assert [e["name"] for e in data] == ["Set 1", "Set 2", "Set 3"]
+            assert all(e["day_id"] == test_day_id for e in data)
+            
+            print(f"\n✅ Bulk created {len(data)} exercises for day {test_day_id}")
 
 
 # ===========================
@@ -413,6 +437,24 @@ class TestWaterCRUDAPI:
             
             print(f"\n✅ Created water intake: ID={data['id']}, Amount={data['amount']}L")
     
+    def test_01b_create_water_without_time(self, auth_headers, test_day_id):
+        """Test POST /api/v1/days/{day_id}/water-intakes - Omitted time defaults to now."""
+        with httpx.Client() as client:
+            response = client.post(
+                f"{API_V1}/days/{test_day_id}/water-intakes",
+                json={"amount": 0.25},
+                headers=auth_headers,
+                timeout=10.0
+            )
+            
+            assert response.status_code == 201, f"Failed to create water intake: {response.text}"
+            data = response.json()
+            
+            assert float(data["amount"]) == 0.25
+            assert data["time"] is not None, "Time should default to the insert time"
+            
+            print(f"\n✅ Created water intake without time: ID={data['id']}, Time={data['time']}")
+    
     def test_02_get_water_by_day(self, auth_headers, test_day_id):
         """Test GET /api/v1/days/{day_id}/water - Get all water intakes for a day."""
         with httpx.Client() as client:
@@ -301,6 +301,63 @@ class TestNotificationsCRUD:
             assert response.status_code == 404, "Should return 404 for non-existent notification"
             print("\nCorrectly returned 404 when deleting non-existent notification")
 
+    def test_12_bulk_delete_notifications(self):
+        """Test DELETE /api/v1/notifications?ids=... - Delete several notifications."""
+        first_id = create_test_notification()
+        second_id = create_test_notification()
+        assert first_id is not None and second_id is not None, "Failed to create notifications"
+
+        with httpx.Client() as client:
+            response = client.delete(
+                f"{API_V1}/notifications",
+                params={"ids": [first_id, second_id, 999999]},
+                headers=get_auth_headers(),
+                timeout=10.0
+            )
+
+            assert response.status_code == 204, f"Failed to bulk delete notifications: {response.text}"
+
+            # Verify both are gone
+            for notification_id in (first_id, second_id):
+                verify_response = client.get(
+                    f"{API_V1}/notifications/{notification_id}",
+                    headers=get_auth_headers(),
+                    timeout=10.0
+                )
+                assert verify_response.status_code == 404, "Notification should be deleted"
+
+            print(f"\nBulk deleted notifications: IDs={first_id}, {second_id}")
+
+    def test_13_bulk_mark_notifications_as_read(self):
+        """Test POST /api/v1/notifications/read - Mark several notifications as read."""
+        first_id = create_test_notification()
+        second_id = create_test_notification()
+        assert first_id is not None and second_id is not None, "Failed to create notifications"
+
+        with httpx.Client() as client:
+            response = client.post(
+                f"{API_V1}/notifications/read",
+                json={"ids": [first_id, second_id, 999999]},
+                headers=get_auth_headers(),
+                timeout=10.0
+            )
+
+            assert response.status_code == 200, f"Failed to bulk mark as read: {response.text}"
+            assert sorted(response.json()["updated_ids"]) == sorted([first_id, second_id])
+
+            # Repeating the request changes nothing
+            repeat_response = client.post(
+                f"{API_V1}/notifications/read",
+                json={"ids": [first_id, second_id]},
+                headers=get_auth_headers(),
+                timeout=10.0
+            )
+
+            assert repeat_response.status_code == 200
+            assert repeat_response.json()["updated_ids"] == []
+
+            print(f"\nBulk marked notifications as read: IDs={first_id}, {second_id}")
+
 
 class TestNotificationTypes:
     """Test different notification types."""
@@ -241,6 +241,38 @@ class TestSleepCRUDAPI:
             
             print(f"\n✅ Deleted sleep record: ID={TestSleepCRUDAPI.sleep_id}")
 
+    def test_06_delete_sleep_by_day(self, auth_headers, test_day_id):
+        """Test DELETE /api/v1/days/{day_id}/sleep - Delete all sleep records of a day."""
+        with httpx.Client() as client:
+            for quality in (3, 4):
+                response = client.post(
+                    f"{API_V1}/days/{test_day_id}/sleep",
+                    json={"duration": 7.5, "quality": quality, "day_id": test_day_id},
+                    headers=auth_headers,
+                    timeout=10.0
+                )
+                assert response.status_code == 201, f"Failed to create sleep record: {response.text}"
+
+            response = client.delete(
+                f"{API_V1}/days/{test_day_id}/sleep",
+                headers=auth_headers,
+                timeout=10.0
+            )
+
+            assert response.status_code == 204, f"Failed to delete sleep records: {response.text}"
+
+            # Verify the day has no sleep records left
+            verify_response = client.get(
+                f"{API_V1}/days/{test_day_id}/sleep",
+                headers=auth_headers,
+                timeout=10.0
+            )
+
+            assert verify_response.status_code == 200
+            assert verify_response.json() == [], "All sleep records should be deleted"
+
+            print(f"\n✅ Deleted all sleep records of day ID={test_day_id}")
+
 
 # ===========================
 # VALIDATION TESTS
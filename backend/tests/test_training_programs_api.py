@@ -884,6 +884,65 @@ class TestProgramStreaming:
             print("\n✅ Streaming endpoint requires authentication")
 
 
+# ===========================
+# BACKGROUND GENERATION TESTS
+# ===========================
+
+class TestProgramGenerationJobs:
+    """Test suite for background program generation jobs."""
+
+    def test_generate_program_job(self, auth_headers):
+        """Test POST /api/v1/training-programs/generate/jobs - Start and follow a job."""
+        program_data = {
+            "name": "Background Program",
+            "goal": "strength",
+            "days_per_week": 3
+        }
+
+        with httpx.Client() as client:
+            response = client.post(
+                f"{API_V1}/training-programs/generate/jobs",
+                json=program_data,
+                headers=auth_headers,
+                timeout=10.0
+            )
+
+            assert response.status_code == 202, f"Failed to start job: {response.text}"
+            job = response.json()
+            assert job["status"] == "pending"
+            assert job["job_id"]
+
+            # Long-poll the job status
+            status_response = client.get(
+                f"{API_V1}/training-programs/jobs/{job['job_id']}",
+                params={"timeout": 5},
+                headers=auth_headers,
+                timeout=30.0
+            )
+
+            assert status_response.status_code == 200, f"Failed to get job: {status_response.text}"
+            status_data = status_response.json()
+            assert status_data["job_id"] == job["job_id"]
+            assert status_data["status"] in ["pending", "completed", "failed"]
+            if status_data["status"] == "completed":
+                assert status_data["program_id"] is not None
+
+            print(f"\n✅ Generation job {job['job_id']} is {status_data['status']}")
+
+    def test_get_unknown_job(self, auth_headers):
+        """Test GET /api/v1/training-programs/jobs/{job_id} - Unknown job."""
+        with httpx.Client() as client:
+            response = client.get(
+                f"{API_V1}/training-programs/jobs/does-not-exist",
+                headers=auth_headers,
+                timeout=10.0
+            )
+
+            assert response.status_code == 404, "Should return 404 for unknown job"
+
+            print("\n✅ Unknown generation job returns 404")
+
+
 # ===========================
 # DAYS PER WEEK TESTS
 # ===========================